@@ -0,0 +1,71 @@
+from lie2me import Form, fields, compile_form
+
+from .suite import ops_per_second
+
+
+class AddressForm(Form):
+
+    street = fields.Text(max=200)
+    number = fields.Integer(min=0)
+    complement = fields.Text(required=False)
+
+
+class OrderForm(Form):
+
+    code = fields.Text(min=3, max=3)
+    quantity = fields.Integer(min=1, max=100)
+    price = fields.Float(min=0)
+    gift = fields.Boolean(default=False)
+    category = fields.Text(options=['feature', 'improvement', 'bug'])
+    email = fields.Email()
+    delivery = fields.Date(required=False)
+    tags = fields.List(fields.Text(max=10), max=10, required=False)
+    extra = fields.Dict({'color': fields.Text(), 'size': fields.Integer()}, required=False)
+    address = AddressForm
+
+
+VALID = {
+    'code': 'ABC',
+    'quantity': '3',
+    'price': 9.9,
+    'gift': 'no',
+    'category': 'bug',
+    'email': 'john.doe@domain.com',
+    'delivery': '2017-09-20',
+    'tags': ['a', 'b', 'c', 'd'],
+    'extra': {'color': 'red', 'size': 42},
+    'address': {'street': 'Nowhere Street', 'number': 42},
+}
+
+INVALID = {
+    'code': 'ABCD',
+    'quantity': 'many',
+    'price': -1,
+    'gift': 'maybe',
+    'category': 'question',
+    'email': 'john.doe@domain',
+    'delivery': '2017-02-30',
+    'tags': ['a', None, 'a' * 11],
+    'extra': {'size': 'big'},
+    'address': {'street': 'a' * 201},
+}
+
+
+def submit(data):
+    form = OrderForm(data)
+    form.submit()
+    return form.valid, form.data, form.errors
+
+
+def main(number=10000):
+    compiled = compile_form(OrderForm)
+    for name, data in (('valid', VALID), ('invalid', INVALID)):
+        assert compiled(data) == submit(data)
+        baseline = ops_per_second(lambda: submit(data), number)
+        optimized = ops_per_second(lambda: compiled(data), number)
+        print('{:<8} submit: {:>9.0f} ops/s  compiled: {:>9.0f} ops/s  speedup: {:.1f}x'.format(
+            name, baseline, optimized, optimized / baseline))
+
+
+if __name__ == '__main__':
+    main()
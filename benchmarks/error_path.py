@@ -0,0 +1,66 @@
+from lie2me import Form, fields
+
+from .suite import ops_per_second, submit_form
+
+
+def raising(field_class):
+    class Raising(field_class):
+        def validate(self, value):
+            return super().validate(value)
+    return Raising
+
+
+def build_form(Integer, Text, Email, Date):
+    class AddressForm(Form):
+        street = Text(max=20)
+        number = Integer(min=0)
+    class SignupForm(Form):
+        name = Text(max=20)
+        email = Email()
+        age = Integer(min=18)
+        birthday = Date()
+        address = AddressForm
+    return SignupForm
+
+
+FIELDS = [
+    (fields.Integer, {'min': 0}, ['x', -1]),
+    (fields.Text, {'max': 20}, ['a' * 21, 'a\nb']),
+    (fields.Email, {}, ['john.doe@domain']),
+    (fields.Date, {}, ['2017-02-30']),
+]
+
+INVALID = {
+    'name': 'a' * 21,
+    'email': 'john.doe@domain',
+    'age': 'x',
+    'birthday': '2017-02-30',
+    'address': {'street': 'a' * 21, 'number': -1},
+}
+
+
+def report(name, before, after):
+    print('{:<24} raising: {:>9.0f} ops/s  returned: {:>9.0f} ops/s  speedup: {:.2f}x'.format(
+        name, before, after, after / before))
+
+
+def main(number=10000):
+    for field_class, options, values in FIELDS:
+        before = raising(field_class)(**options)
+        after = field_class(**options)
+        for value in values:
+            assert before.submit(value) == after.submit(value)
+            report('{} {!r}'.format(field_class.__name__, str(value)[:10]),
+                ops_per_second(lambda: before.submit(value), number),
+                ops_per_second(lambda: after.submit(value), number))
+    field_classes = [field_class for field_class, options, values in FIELDS]
+    before = build_form(*map(raising, field_classes))
+    after = build_form(*field_classes)
+    assert submit_form(before, INVALID) == submit_form(after, INVALID)
+    report('invalid form',
+        ops_per_second(lambda: submit_form(before, INVALID), number),
+        ops_per_second(lambda: submit_form(after, INVALID), number))
+
+
+if __name__ == '__main__':
+    main()
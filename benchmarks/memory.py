@@ -0,0 +1,56 @@
+import tracemalloc
+
+from lie2me import Field, Form, fields
+
+
+class AddressForm(Form):
+
+    street = fields.Text(max=200)
+    number = fields.Integer(min=0)
+    city = fields.Text(max=100)
+
+
+class PersonForm(Form):
+
+    name = fields.Text(max=100)
+    age = fields.Integer(min=0)
+    address = AddressForm
+
+
+PERSON = {'name': 'John Doe', 'age': 42, 'address': {'street': 'Nowhere', 'number': 42, 'city': 'Somewhere'}}
+
+CASES = [
+    ('Field()', Field),
+    ('Integer(min=0)', lambda: fields.Integer(min=0)),
+    ('Text(max=100)', lambda: fields.Text(max=100)),
+    ('Integer(messages=...)', lambda: fields.Integer(messages={'type': 'Not a number.'})),
+    ('List(Integer())', lambda: fields.List(fields.Integer())),
+    ('AddressForm()', AddressForm),
+    ('PersonForm(data)', lambda: PersonForm(PERSON)),
+    ('PersonForm(data).submit()', lambda: submit(PersonForm(PERSON))),
+]
+
+
+def submit(form):
+    form.submit()
+    return form
+
+
+def bytes_per_instance(factory, number):
+    factory()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for i in range(number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    container = len(instances) * 8
+    return (after - before - container) / number
+
+
+def main(number=10000):
+    for name, factory in CASES:
+        print('{:<28} {:>8.0f} bytes per instance'.format(name, bytes_per_instance(factory, number)))
+
+
+if __name__ == '__main__':
+    main()
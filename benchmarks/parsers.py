@@ -0,0 +1,30 @@
+from lie2me.parsers import parse_datetime, parse_date, parse_time
+from tests.test_parsers import legacy_parse_datetime, legacy_parse_date, legacy_parse_time
+
+from .suite import ops_per_second
+
+
+CASES = [
+    ('datetime Z', legacy_parse_datetime, parse_datetime, '2017-09-20T19:34:59Z'),
+    ('datetime ms offset', legacy_parse_datetime, parse_datetime, '2017-09-20T19:34:59.123-03:00'),
+    ('datetime naive', legacy_parse_datetime, parse_datetime, '2017-09-20 19:34:59'),
+    ('datetime short', legacy_parse_datetime, parse_datetime, '2017-09-20 19:34'),
+    ('datetime invalid', legacy_parse_datetime, parse_datetime, '2017-02-30T19:34:59Z'),
+    ('date', legacy_parse_date, parse_date, '2017-09-20'),
+    ('date invalid', legacy_parse_date, parse_date, '2017-9-20'),
+    ('time offset', legacy_parse_time, parse_time, '19:34:59+05:30'),
+    ('time short', legacy_parse_time, parse_time, '19:34'),
+]
+
+
+def main(number=20000):
+    for name, legacy, parse, value in CASES:
+        assert legacy(value) == parse(value)
+        before = ops_per_second(lambda: legacy(value), number)
+        after = ops_per_second(lambda: parse(value), number)
+        print('{:<20} legacy: {:>9.0f} ops/s  current: {:>9.0f} ops/s  speedup: {:.2f}x'.format(
+            name, before, after, after / before))
+
+
+if __name__ == '__main__':
+    main()
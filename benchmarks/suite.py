@@ -0,0 +1,205 @@
+import argparse
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+import platform
+import sys
+import tracemalloc
+from timeit import Timer
+
+from lie2me import Form, fields
+
+
+FIELDS = [
+    ('boolean', fields.Boolean(), 'yes', 'maybe'),
+    ('integer', fields.Integer(min=0, max=100), '42', 'many'),
+    ('float', fields.Float(min=0), '9.90', 'much'),
+    ('decimal', fields.Decimal(min=0, max=1000), '9.90', 'much'),
+    ('text', fields.Text(max=100), '  Lorem ipsum dolor sit amet  ', 'a\nb'),
+    ('text_pattern', fields.Text(pattern=r'^[A-Z]{3}-[0-9]{4}$'), 'ABC-1234', 'abc-1234'),
+    ('text_options', fields.Text(options=['feature', 'improvement', 'bug']), 'bug', 'question'),
+    ('password', fields.Password(min=8), 'correct horse', 'short'),
+    ('email', fields.Email(), 'john.doe@domain.com', 'john.doe@domain'),
+    ('date', fields.Date(), '2017-09-20', '2017-02-30'),
+    ('datetime', fields.DateTime(), '2017-09-20T19:34:59-03:00', '2017-09-20T25:00'),
+    ('time', fields.Time(), '19:34:59', '19:60'),
+    ('list', fields.List(fields.Integer()), ['1', '2', '3'], ['1', 'x', '3']),
+    ('dict', fields.Dict({'a': fields.Integer(), 'b': fields.Text()}), {'a': '1', 'b': 'x'}, {'a': 'x'}),
+]
+
+TYPED = [
+    ('boolean', fields.Boolean(), True),
+    ('integer', fields.Integer(min=0, max=100), 42),
+    ('float', fields.Float(min=0), 9.9),
+    ('decimal', fields.Decimal(min=0, max=1000), Decimal('9.90')),
+    ('date', fields.Date(), date(2017, 9, 20)),
+    ('datetime', fields.DateTime(), datetime(2017, 9, 20, 19, 34, 59)),
+    ('time', fields.Time(), time(19, 34, 59)),
+]
+
+SIZES = [10, 1000, 100000]
+
+
+class AddressForm(Form):
+
+    street = fields.Text(max=200)
+    number = fields.Integer(min=0)
+    city = fields.Text(max=100)
+
+
+class PersonForm(Form):
+
+    name = fields.Text(max=100)
+    email = fields.Email()
+    age = fields.Integer(min=0)
+    birthday = fields.Date()
+    active = fields.Boolean()
+    street = fields.Text(max=200)
+    number = fields.Integer(min=0)
+    city = fields.Text(max=100)
+
+
+class NestedPersonForm(Form):
+
+    name = fields.Text(max=100)
+    email = fields.Email()
+    age = fields.Integer(min=0)
+    birthday = fields.Date()
+    active = fields.Boolean()
+    address = AddressForm
+
+
+PERSON = {
+    'name': 'John Doe',
+    'email': 'john.doe@domain.com',
+    'age': '42',
+    'birthday': '1975-01-01',
+    'active': 'yes',
+}
+
+ADDRESS = {'street': 'Nowhere Street', 'number': 42, 'city': 'Somewhere'}
+
+JSON_PERSON = json.loads(json.dumps(dict(PERSON, age=42, active=True, **ADDRESS)))
+
+JSON_BODY = json.dumps(dict(JSON_PERSON, metadata=[{'id': i, 'tags': ['x'] * 5} for i in range(1000)])).encode()
+
+FORMS = [
+    ('form_flat', PersonForm, dict(PERSON, **ADDRESS), dict(PERSON, **dict(ADDRESS, age='x', number=-1))),
+    ('form_nested', NestedPersonForm, dict(PERSON, address=ADDRESS), dict(PERSON, age='x', address=dict(ADDRESS, number=-1))),
+]
+
+WideForm = type('WideForm', (Form,), {'field_{}'.format(i): fields.Text(max=100) for i in range(150)})
+
+PATCH = {'field_0': 'foo', 'field_75': 'bar', 'field_149': 'baz'}
+
+
+def submit_form(form_class, data, **options):
+    form = form_class(data)
+    form.submit(**options)
+    return form.errors
+
+
+def submit_json(form_class, body):
+    form = form_class()
+    form.submit_json(body)
+    return form.errors
+
+
+def cases():
+    for name, field, valid, invalid in FIELDS:
+        yield 'field.{}.valid'.format(name), lambda field=field, value=valid: field.submit(value)
+        yield 'field.{}.invalid'.format(name), lambda field=field, value=invalid: field.submit(value)
+        yield 'field.{}.empty'.format(name), lambda field=field: field.submit(None)
+    for name, field, value in TYPED:
+        yield 'field.{}.typed'.format(name), lambda field=field, value=value: field.submit(value)
+    for name, form_class, valid, invalid in FORMS:
+        yield '{}.valid'.format(name), lambda form_class=form_class, data=valid: submit_form(form_class, data)
+        yield '{}.invalid'.format(name), lambda form_class=form_class, data=invalid: submit_form(form_class, data)
+    yield 'form_flat.json', lambda: submit_form(PersonForm, JSON_PERSON)
+    yield 'form_flat.json_loads', lambda: submit_form(PersonForm, json.loads(JSON_BODY))
+    yield 'form_flat.submit_json', lambda: submit_json(PersonForm, JSON_BODY)
+    yield 'form_wide.patch', lambda: submit_form(WideForm, PATCH)
+    yield 'form_wide.patch_partial', lambda: submit_form(WideForm, PATCH, partial=True)
+    for size in SIZES:
+        items = [str(i) for i in range(size)]
+        field = fields.List(fields.Integer())
+        yield 'list.{}'.format(size), lambda field=field, items=items: field.submit(items)
+        records = [dict(ADDRESS, number=i) for i in range(size)]
+        field = fields.List(AddressForm)
+        yield 'list_forms.{}'.format(size), lambda field=field, records=records: field.submit(records)
+        entries = {str(i): str(i) for i in range(size)}
+        field = fields.Dict({key: fields.Integer() for key in entries})
+        yield 'dict.{}'.format(size), lambda field=field, entries=entries: field.submit(entries)
+
+
+def ops_per_second(function, number=None, repeat=3):
+    timer = Timer(function)
+    if number is None:
+        number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def measure(function, repeat=3):
+    ops = ops_per_second(function, repeat=repeat)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'ops_per_sec': ops, 'peak_bytes': peak}
+
+
+def run(pattern=None):
+    results = {}
+    for name, function in cases():
+        if pattern is None or pattern in name:
+            results[name] = measure(function)
+            print('{:<32} {:>12.0f} ops/s {:>10} bytes'.format(
+                name, results[name]['ops_per_sec'], results[name]['peak_bytes']), file=sys.stderr)
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    regressions = []
+    for name, result in sorted(report['results'].items()):
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        speed = result['ops_per_sec'] / before['ops_per_sec']
+        memory = result['peak_bytes'] / max(before['peak_bytes'], 1)
+        flag = 'REGRESSION' if speed < 1 - threshold or memory > 1 + threshold else ''
+        if flag:
+            regressions.append(name)
+        print('{:<32} {:>12.0f} -> {:>12.0f} ops/s {:>7.2f}x  memory {:>7.2f}x {}'.format(
+            name, before['ops_per_sec'], result['ops_per_sec'], speed, memory, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the lie2me benchmark suite.')
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--output', help='write the JSON report to this file instead of stdout')
+    parser.add_argument('--compare', metavar='BASELINE', help='compare against a stored JSON report')
+    parser.add_argument('--threshold', type=float, default=0.1,
+        help='slowdown or memory growth ratio flagged as a regression (default: 0.1)')
+    args = parser.parse_args(argv)
+    report = run(args.filter)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as fp:
+            regressions = compare(report, json.load(fp), args.threshold)
+        if regressions:
+            print('{} regression(s) over {:.0%}.'.format(len(regressions), args.threshold))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
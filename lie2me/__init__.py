@@ -1,2 +1,4 @@
 from .field import Field
 from .form import Form
+from .options import Options
+from .compiler import compile_form
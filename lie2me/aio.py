@@ -0,0 +1,43 @@
+import asyncio
+from contextvars import ContextVar
+from inspect import isawaitable
+
+
+_context = ContextVar('lie2me_submit', default=None)
+
+
+class SubmitContext(object):
+
+    def __init__(self, concurrency=None):
+        self.semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        self.lookups = {}
+
+
+def enter(concurrency=None):
+    if _context.get() is not None:
+        return None
+    return _context.set(SubmitContext(concurrency))
+
+
+def leave(token):
+    if token is not None:
+        _context.reset(token)
+
+
+async def resolve(result):
+    if not isawaitable(result):
+        return result
+    context = _context.get()
+    if context is None or context.semaphore is None:
+        return await result
+    async with context.semaphore:
+        return await result
+
+
+def lookup(key, function, *args):
+    context = _context.get()
+    if context is None:
+        return asyncio.ensure_future(function(*args))
+    if key not in context.lookups:
+        context.lookups[key] = asyncio.ensure_future(function(*args))
+    return context.lookups[key]
@@ -0,0 +1,33 @@
+from .messages import render
+
+
+class Batch(object):
+
+    def __init__(self):
+        self.valid = []
+        self.data = []
+        self._errors = {}
+
+    @property
+    def errors(self):
+        return render(self._errors)
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __iter__(self):
+        for i, (valid, data) in enumerate(zip(self.valid, self.data)):
+            yield valid, data, render(self._errors.get(i, {}))
+
+    def append(self, valid, data, errors):
+        if not valid:
+            self._errors[len(self.valid)] = errors
+        self.valid.append(valid)
+        self.data.append(data)
+
+    def extend(self, batch):
+        offset = len(self.valid)
+        for i, errors in batch._errors.items():
+            self._errors[offset + i] = errors
+        self.valid.extend(batch.valid)
+        self.data.extend(batch.data)
@@ -0,0 +1,51 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# Only immutable types whose equality implies identical validation results.
+# Floats, decimals and datetimes are left out because equal values can still
+# render differently (0.0 and -0.0, 1.0 and 1.00, the same instant in two timezones).
+CACHEABLE = frozenset([str, int, bool])
+
+
+class ResultCache(object):
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def submit(self, submit, value, fail_fast=False):
+        key = value if type(value) is str else (type(value), value)
+        with self.lock:
+            result = self.results.get(key)
+            if result is not None:
+                self.hits += 1
+                self.results.move_to_end(key)
+        if result is not None:
+            return _copy(result)
+        result = submit(value, fail_fast)
+        with self.lock:
+            self.misses += 1
+            self.results[key] = _copy(result)
+            if len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+        return result
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.results))
+
+
+def _copy(result):
+    value, error = result
+    if type(error) is dict:
+        return value, _copy_errors(error)
+    return result
+
+
+def _copy_errors(errors):
+    return {key: _copy_errors(error) if type(error) is dict else error for key, error in errors.items()}
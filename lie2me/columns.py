@@ -0,0 +1,121 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+CODES = (None, 'required', 'type', 'min', 'max', 'default')
+OK, REQUIRED, TYPE, MIN, MAX, DEFAULT = range(len(CODES))
+
+
+class Column(object):
+
+    def __init__(self, valid, data, errors):
+        self.valid = valid
+        self.data = data
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.valid)
+
+
+def submit_column(field, values, cls=None, convert=None):
+    if numpy is not None and convert is not None and _is_vectorizable(field, cls):
+        if not hasattr(values, '__getitem__'):
+            values = list(values)
+        column = _vectorized_submit(field, values, convert)
+        if column is not None:
+            return column
+    valid = []
+    data = []
+    errors = {}
+    for i, value in enumerate(values):
+        value, error = field.submit(value)
+        valid.append(not error)
+        data.append(value)
+        if error:
+            errors[i] = error
+    return Column(valid, data, errors)
+
+
+def _vectorized_submit(field, values, convert):
+    array, empty = _column_array(values)
+    if array is None:
+        return None
+    converted = convert(array, empty)
+    if converted is None:
+        return None
+    converted, invalid, data = converted
+    codes = numpy.zeros(len(array), dtype=numpy.int8)
+    codes[invalid & ~empty] = TYPE
+    checked = ~empty & ~invalid
+    for code, attr, compare in ((MIN, 'min', numpy.less), (MAX, 'max', numpy.greater)):
+        limit = getattr(field, attr, None)
+        if limit is not None:
+            out = checked & compare(converted, limit)
+            codes[out] = code
+            checked &= ~out
+    if data is None:
+        data = converted.tolist()
+    empty_value = None
+    default_error = None
+    if empty.any():
+        if field.default is not None:
+            empty_value, default_error = field.submit(None)
+            if default_error:
+                codes[empty] = DEFAULT
+        elif field.required:
+            codes[empty] = REQUIRED
+        else:
+            empty_value = field.empty_value()
+        if not default_error:
+            for i in numpy.flatnonzero(empty & (codes == OK)).tolist():
+                data[i] = empty_value
+    messages = {}
+    for code in numpy.unique(codes).tolist():
+        if code == DEFAULT:
+            messages[code] = default_error
+        elif code != OK:
+            messages[code] = field.error(CODES[code]).data
+    errors = {}
+    for i in numpy.flatnonzero(codes).tolist():
+        errors[i] = messages[codes[i]]
+        data[i] = values[i]
+    return Column((codes == OK).tolist(), data, errors)
+
+
+def _is_vectorizable(field, cls):
+    for name in ('submit', '_process_value', 'is_empty', 'empty_value', 'validate', '_check'):
+        if getattr(type(field), name) is not getattr(cls, name):
+            return False
+    for name in ('min', 'max'):
+        if type(getattr(field, name, None)) not in (type(None), int, float):
+            return False
+    return field.max_length is None and getattr(field, 'max_digits', None) is None
+
+
+def _column_array(values):
+    try:
+        array = numpy.asarray(values)
+    except (TypeError, ValueError):
+        return None, None
+    if array.ndim != 1:
+        return None, None
+    empty = numpy.zeros(len(array), dtype=bool)
+    if array.dtype.kind == 'O':
+        empty = numpy.equal(array, None)
+        if empty.all():
+            return numpy.zeros(len(array)), empty
+        filled = array.copy()
+        filled[empty] = array[~empty][0]
+        try:
+            array = numpy.asarray(filled.tolist())
+        except (TypeError, ValueError):
+            return None, None
+        if array.ndim != 1:
+            return None, None
+    if array.dtype.kind == 'U':
+        empty |= numpy.char.strip(array) == ''
+    elif array.dtype.kind not in 'biuf':
+        return None, None
+    return array, empty
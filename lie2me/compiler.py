@@ -0,0 +1,291 @@
+from datetime import date
+from itertools import count
+
+from .form import Form
+from .field import SCALARS
+from .exceptions import BadValidation
+from .parsers import parse_date
+from .fields.email import EMAIL_PATTERN
+from . import fields
+
+
+def compile_form(form_class):
+    return FormCompiler().compile(form_class)
+
+
+class FormCompiler(object):
+
+    def __init__(self):
+        self.namespace = {'BadValidation': BadValidation}
+        self.constants = {}
+        self.functions = {}
+        self.blocks = []
+        self.counter = count()
+        self.emitters = {
+            fields.Integer: self.emit_integer,
+            fields.Float: self.emit_float,
+            fields.Boolean: self.emit_boolean,
+            fields.Text: self.emit_text,
+            fields.Email: self.emit_email,
+            fields.Date: self.emit_date,
+            fields.List: self.emit_list,
+            fields.Dict: self.emit_dict,
+        }
+
+    def compile(self, form_class):
+        name = self.compile_form(form_class)
+        source = '\n\n'.join('\n'.join(block) for block in self.blocks)
+        filename = '<lie2me compiled {}>'.format(form_class.__name__)
+        exec(compile(source, filename, 'exec'), self.namespace)
+        function = self.namespace[name]
+        function.source = source
+        function.schemas = tuple((form, form._get_schema()) for form in self.functions)
+        return function
+
+    def name(self, prefix):
+        return '{}_{}'.format(prefix, next(self.counter))
+
+    def constant(self, value):
+        key = id(value)
+        if key not in self.constants:
+            name = self.name('const')
+            self.namespace[name] = value
+            self.constants[key] = (name, value)
+        return self.constants[key][0]
+
+    def literal(self, value):
+        if type(value) is str:
+            return repr(value)
+        return self.constant(value)
+
+    def message(self, field, code):
+        message = field._render(code)
+        if isinstance(field, fields.List):
+            return '{{\'list\': {}}}'.format(self.constant(message))
+        return self.constant(message)
+
+    def is_standard(self, form_class):
+        for method in ('__init__', 'submit', '_initialize_data', '_validate_fields', '_validate_forms', 'error'):
+            if getattr(form_class, method) is not getattr(Form, method):
+                return False
+        return form_class.max_keys is None and form_class.max_depth is None
+
+    def compile_form(self, form_class):
+        if form_class in self.functions:
+            return self.functions[form_class]
+        name = self.name('form')
+        self.functions[form_class] = name
+        block = []
+        self.blocks.append(block)
+        write = lambda indent, line: block.append('    ' * indent + line)
+        write(0, 'def {}(raw):'.format(name))
+        if not self.is_standard(form_class):
+            write(1, 'form = {}(raw)'.format(self.constant(form_class)))
+            write(1, 'form.submit()')
+            write(1, 'return form.valid, form.data, form.errors')
+            return name
+        schema = form_class._get_schema()
+        write(1, 'source = raw if hasattr(raw, \'get\') else None')
+        write(1, 'if source is None:')
+        write(2, 'source = {' + ', '.join('{}: {{}}'.format(repr(key)) for key in schema.forms) + '}')
+        write(1, 'elif not source:')
+        write(2, 'source = {}')
+        write(1, 'data = {}')
+        write(1, 'errors = {}')
+        for key, field in schema.fields.items():
+            value = self.name('value')
+            write(1, '{} = source.get({})'.format(value, repr(key)))
+            self.emit_field(write, 1, field, value,
+                lambda expr, key=key: 'data[{}] = {}'.format(repr(key), expr),
+                lambda expr, key=key: 'errors[{}] = {}'.format(repr(key), expr))
+        for key, form in schema.forms.items():
+            self.emit_form(write, 1, form, 'source.get({})'.format(repr(key)),
+                lambda expr, key=key: 'data[{}] = {}'.format(repr(key), expr),
+                lambda expr, key=key: 'errors[{}] = {}'.format(repr(key), expr))
+        if form_class.validate is not Form.validate:
+            write(1, 'form = {}(raw)'.format(self.constant(form_class)))
+            write(1, 'form.errors = errors')
+            write(1, 'data = form.validate(data)')
+            write(1, 'errors = form.errors')
+            write(1, 'source = form.data')
+        write(1, 'if errors:')
+        write(2, 'return False, source, errors')
+        write(1, 'if data is None:')
+        write(2, 'raise BadValidation(\'Form validation did not return any data.\')')
+        write(1, 'return True, data, errors')
+        return name
+
+    def emit_field(self, write, indent, field, var, ok, fail):
+        emitter = self.emitters.get(type(field))
+        if emitter is None or field.max_length is not None or getattr(field, 'max_digits', None) is not None:
+            self.emit_submit(write, indent, field, var, ok, fail)
+            return
+        if isinstance(field, fields.List) and (field.lazy or field.max_errors is not None):
+            self.emit_submit(write, indent, field, var, ok, fail)
+            return
+        empty = self.empty_test(field, var)
+        if field.default is not None:
+            write(indent, 'if {}:'.format(empty))
+            write(indent + 1, '{} = {}'.format(var, self.constant(field.default)))
+        write(indent, 'if {}:'.format(empty))
+        if field.required:
+            write(indent + 1, fail(self.message(field, 'required')))
+        else:
+            write(indent + 1, ok(self.empty_value(field)))
+        write(indent, 'else:')
+        emitter(write, indent + 1, field, var, ok, fail)
+
+    def emit_submit(self, write, indent, field, var, ok, fail):
+        value = self.name('value')
+        error = self.name('error')
+        write(indent, '{}, {} = {}.submit({})'.format(value, error, self.constant(field), var))
+        write(indent, 'if not {}:'.format(error))
+        write(indent + 1, ok(value))
+        write(indent, 'else:')
+        write(indent + 1, fail(error))
+
+    def emit_checks(self, write, indent, checks, ok):
+        for i, (condition, error) in enumerate(checks):
+            write(indent, '{} {}:'.format('if' if i == 0 else 'elif', condition))
+            write(indent + 1, error)
+        if checks:
+            write(indent, 'else:')
+            indent += 1
+        write(indent, ok)
+
+    def empty_test(self, field, var):
+        if isinstance(field, fields.List):
+            return '{0} is None or {0} == []'.format(var)
+        if isinstance(field, fields.Dict):
+            return '{0} is None or {0} == {{}}'.format(var)
+        return '{0} is None or (not {0} or {0}.isspace() if type({0}) is str else type({0}) not in {1} and str({0}).strip() == \'\')'.format(
+            var, self.constant(SCALARS))
+
+    def empty_value(self, field):
+        if isinstance(field, fields.List):
+            return '[]'
+        if isinstance(field, fields.Dict):
+            return '{}'
+        return 'None'
+
+    def emit_integer(self, write, indent, field, var, ok, fail):
+        self.emit_number(write, indent, field, var, ok, fail, 'int')
+
+    def emit_float(self, write, indent, field, var, ok, fail):
+        self.emit_number(write, indent, field, var, ok, fail, 'float')
+
+    def emit_number(self, write, indent, field, var, ok, fail, cast):
+        write(indent, 'try:')
+        write(indent + 1, '{0} = {0} if type({0}) is {1} else {1}({0})'.format(var, cast))
+        write(indent, 'except:')
+        write(indent + 1, fail(self.message(field, 'type')))
+        write(indent, 'else:')
+        checks = []
+        if field.min is not None:
+            checks.append(('{} < {}'.format(var, self.constant(field.min)), fail(self.message(field, 'min'))))
+        if field.max is not None:
+            checks.append(('{} > {}'.format(var, self.constant(field.max)), fail(self.message(field, 'max'))))
+        self.emit_checks(write, indent + 1, checks, ok(var))
+
+    def emit_boolean(self, write, indent, field, var, ok, fail):
+        write(indent, '{0} = {0} if type({0}) is bool else str({0}).strip().lower()'.format(var))
+        self.emit_checks(write, indent, [
+            ('{} is True'.format(var), ok('True')),
+            ('{} is False'.format(var), ok('False')),
+            ('{} in (\'true\', \'yes\', \'1\', \'on\')'.format(var), ok('True')),
+            ('{} in (\'false\', \'no\', \'0\', \'off\')'.format(var), ok('False')),
+        ], fail(self.message(field, 'type')))
+
+    def emit_text(self, write, indent, field, var, ok, fail):
+        write(indent, '{0} = str({0})'.format(var))
+        if field.trim:
+            write(indent, '{0} = {0}.strip()'.format(var))
+        checks = []
+        if field.min is not None:
+            checks.append(('len({}) < {}'.format(var, self.constant(field.min)), fail(self.message(field, 'min'))))
+        if field.max is not None:
+            checks.append(('len({}) > {}'.format(var, self.constant(field.max)), fail(self.message(field, 'max'))))
+        if not field.multiline:
+            checks.append(('len({}.splitlines()) > 1'.format(var), fail(self.message(field, 'multiline'))))
+        if field.pattern:
+            match = '{}.match({})'.format(self.constant(field._compiled_pattern()), var)
+            if field.pattern_max_length is not None:
+                match = 'len({}) <= {} and {}'.format(var, self.constant(field.pattern_max_length), match)
+            checks.append(('not ({})'.format(match), fail(self.message(field, 'pattern'))))
+        value = var
+        if field.options:
+            index = field._indexed_options()
+            options = self.constant(index)
+            checks.append(('{} not in {}'.format(var, options), fail(self.message(field, 'options'))))
+            if index.normalize is not None:
+                value = '{}.get({})'.format(options, var)
+        self.emit_checks(write, indent, checks, ok(value))
+
+    def emit_email(self, write, indent, field, var, ok, fail):
+        write(indent, '{0} = str({0}).strip()'.format(var))
+        self.emit_checks(write, indent, [
+            ('len({}) > 254'.format(var), fail(self.message(field, 'type'))),
+            ('not {}.match({})'.format(self.constant(EMAIL_PATTERN), var), fail(self.message(field, 'type'))),
+        ], ok(var))
+
+    def emit_date(self, write, indent, field, var, ok, fail):
+        parse = self.constant(parse_date if field.format is None else field.parse)
+        write(indent, '{0} = {0} if type({0}) is {2} else {1}({0})'.format(var, parse, self.constant(date)))
+        checks = [('{} is None'.format(var), fail(self.message(field, 'type')))]
+        if field.min:
+            checks.append(('{} < {}'.format(var, self.constant(field.parsed_min)), fail(self.message(field, 'min'))))
+        if field.max:
+            checks.append(('{} > {}'.format(var, self.constant(field.parsed_max)), fail(self.message(field, 'max'))))
+        self.emit_checks(write, indent, checks, ok(var))
+
+    def emit_list(self, write, indent, field, var, ok, fail):
+        checks = [('not isinstance({0}, list) and not isinstance({0}, tuple)'.format(var), fail(self.message(field, 'type')))]
+        if field.min is not None:
+            checks.append(('len({}) < {}'.format(var, self.constant(field.min)), fail(self.message(field, 'min'))))
+        if field.max is not None:
+            checks.append(('len({}) > {}'.format(var, self.constant(field.max)), fail(self.message(field, 'max'))))
+        for i, (condition, error) in enumerate(checks):
+            write(indent, '{} {}:'.format('if' if i == 0 else 'elif', condition))
+            write(indent + 1, error)
+        write(indent, 'else:')
+        items = self.name('items')
+        errors = self.name('errors')
+        index = self.name('index')
+        item = self.name('item')
+        write(indent + 1, '{} = []'.format(items))
+        write(indent + 1, '{} = {{}}'.format(errors))
+        write(indent + 1, 'for {}, {} in enumerate({}):'.format(index, item, var))
+        if isinstance(field.field, type):
+            self.emit_form(write, indent + 2, field.field, item,
+                lambda expr: '{}.append({})'.format(items, expr),
+                lambda expr: '{}[{}] = {}'.format(errors, index, expr))
+        else:
+            self.emit_field(write, indent + 2, field.field, item,
+                lambda expr: '{}.append({})'.format(items, expr),
+                lambda expr: '{}[{}] = {}'.format(errors, index, expr))
+        self.emit_checks(write, indent + 1, [(errors, fail(errors))], ok(items))
+
+    def emit_form(self, write, indent, form_class, var, ok, fail):
+        function = self.compile_form(form_class)
+        valid = self.name('valid')
+        value = self.name('value')
+        error = self.name('error')
+        write(indent, '{}, {}, {} = {}({})'.format(valid, value, error, function, var))
+        write(indent, 'if {}:'.format(valid))
+        write(indent + 1, ok(value))
+        write(indent, 'else:')
+        write(indent + 1, fail(error))
+
+    def emit_dict(self, write, indent, field, var, ok, fail):
+        entries = self.name('entries')
+        errors = self.name('errors')
+        write(indent, '{} = {{}}'.format(entries))
+        write(indent, '{} = {{}}'.format(errors))
+        for key, child in field.fields.items():
+            item = self.name('item')
+            key = self.literal(key)
+            write(indent, '{} = {}.get({})'.format(item, var, key))
+            self.emit_field(write, indent, child, item,
+                lambda expr, key=key: '{}[{}] = {}'.format(entries, key, expr),
+                lambda expr, key=key: '{}[{}] = {}'.format(errors, key, expr))
+        self.emit_checks(write, indent, [(errors, fail(errors))], ok(entries))
@@ -0,0 +1,161 @@
+import json
+import re
+from itertools import count
+from json.decoder import JSONDecodeError, scanstring
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+_scan = json.JSONDecoder().scan_once
+
+
+class TooDeep(Exception):
+    pass
+
+
+class JSONReader(object):
+
+    def __init__(self, body, max_depth=None):
+        if isinstance(body, (bytes, bytearray)):
+            body = body.decode(json.detect_encoding(body), 'surrogatepass')
+        if body.startswith('\ufeff'):
+            raise JSONDecodeError('Unexpected UTF-8 BOM (decode using utf-8-sig)', body, 0)
+        self.text = body
+        self.pos = 0
+        self.depth = 0
+        self.max_depth = max_depth
+
+    def peek(self):
+        self.pos = WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos:self.pos + 1]
+
+    def read(self):
+        self.peek()
+        try:
+            value, self.pos = _scan(self.text, self.pos)
+        except StopIteration as e:
+            raise JSONDecodeError('Expecting value', self.text, e.value) from None
+        if self.max_depth is not None and isinstance(value, (dict, list)):
+            if exceeds_depth(value, self.max_depth - self.depth):
+                raise TooDeep()
+        return value
+
+    def skip(self):
+        if self.peek() in ('{', '['):
+            self._skip_container()
+        else:
+            self.read()
+
+    def _skip_container(self):
+        text, match, limit = self.text, WHITESPACE.match, self.max_depth
+        ends = []
+        pos = self.pos
+        while True:
+            char = text[pos:pos + 1]
+            if char == '{' or char == '[':
+                ends.append('}' if char == '{' else ']')
+                if limit is not None and self.depth + len(ends) > limit:
+                    raise TooDeep()
+                pos = match(text, pos + 1).end()
+                if text[pos:pos + 1] != ends[-1]:
+                    if char == '{':
+                        pos = self._skip_key(pos)
+                    continue
+                ends.pop()
+                pos += 1
+            elif char == '"':
+                pos = scanstring(text, pos + 1)[1]
+            else:
+                try:
+                    pos = _scan(text, pos)[1]
+                except StopIteration as e:
+                    raise JSONDecodeError('Expecting value', text, e.value) from None
+            while ends:
+                pos = match(text, pos).end()
+                char = text[pos:pos + 1]
+                if char == ends[-1]:
+                    ends.pop()
+                    pos += 1
+                    continue
+                if char != ',':
+                    raise JSONDecodeError('Expecting \',\' delimiter', text, pos)
+                pos = match(text, pos + 1).end()
+                if ends[-1] == '}':
+                    pos = self._skip_key(pos)
+                break
+            else:
+                self.pos = pos
+                return
+
+    def _skip_key(self, pos):
+        text, match = self.text, WHITESPACE.match
+        if text[pos:pos + 1] != '"':
+            raise JSONDecodeError('Expecting property name enclosed in double quotes', text, pos)
+        pos = match(text, scanstring(text, pos + 1)[1]).end()
+        if text[pos:pos + 1] != ':':
+            raise JSONDecodeError('Expecting \':\' delimiter', text, pos)
+        return match(text, pos + 1).end()
+
+    def members(self):
+        self._enter()
+        char = self.peek()
+        if char == '}':
+            self._leave()
+            return
+        while True:
+            if char != '"':
+                raise JSONDecodeError('Expecting property name enclosed in double quotes', self.text, self.pos)
+            key, self.pos = scanstring(self.text, self.pos + 1)
+            if self.peek() != ':':
+                raise JSONDecodeError('Expecting \':\' delimiter', self.text, self.pos)
+            self.pos += 1
+            yield key
+            if self._next('}'):
+                self._leave()
+                return
+            char = self.peek()
+
+    def elements(self):
+        self._enter()
+        if self.peek() == ']':
+            self._leave()
+            return
+        for i in count():
+            yield i
+            if self._next(']'):
+                self._leave()
+                return
+
+    def _enter(self):
+        self.pos = WHITESPACE.match(self.text, self.pos).end() + 1
+        self.depth += 1
+        if self.max_depth is not None and self.depth > self.max_depth:
+            raise TooDeep()
+
+    def _leave(self):
+        self.pos += 1
+        self.depth -= 1
+
+    def _next(self, end):
+        char = self.peek()
+        if char == end:
+            return True
+        if char != ',':
+            raise JSONDecodeError('Expecting \',\' delimiter', self.text, self.pos)
+        self.pos += 1
+        return False
+
+    def close(self):
+        if self.peek():
+            raise JSONDecodeError('Extra data', self.text, self.pos)
+
+
+def exceeds_depth(data, limit):
+    level = [data]
+    depth = 0
+    while level:
+        depth += 1
+        if depth > limit:
+            return True
+        level = [child for node in level for child in (node.values() if hasattr(node, 'values') else node)
+            if isinstance(child, (dict, list, tuple))]
+    return False
@@ -4,6 +4,14 @@ class ValidationError(Exception):
         self.data = data
 
 
+class Invalid(object):
+
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+
 class BadConfiguration(Exception):
     pass
 
@@ -1,28 +1,44 @@
-import re
-from .exceptions import ValidationError, BadConfiguration, BadValidation
+from datetime import date, datetime, time
+from decimal import Decimal
+from inspect import signature
+
+from .exceptions import ValidationError, Invalid, BadConfiguration, BadValidation
+from .messages import Message, Messages, compile_template, render
+from .cache import CACHEABLE, CacheInfo, ResultCache
+from .columns import submit_column
+from .aio import isawaitable, resolve
+
+
+SCALARS = frozenset([int, float, bool, Decimal, date, datetime, time])
+SIZED = frozenset([str, bytes, list, tuple, dict])
+DIGITS_SLACK = 16
 
 
 class Field(object):
 
     required = True
     default = None
+    cache = None
+    max_length = None
 
     messages = {
         'required': 'This is required.',
+        'length': 'Input is too long.',
     }
 
     def __init__(self, *args, **kwargs):
         if args:
             raise BadConfiguration('Positional arguments are not allowed in this field.')
-        self.messages = self._assemble_class_messages()
+        self.messages = self._class_messages()
         self._update_attributes(kwargs)
 
-    def _assemble_class_messages(self):
-        messages = {}
-        for cls in reversed(self.__class__.__mro__):
-            if hasattr(cls, 'messages'):
-                messages.update(cls.messages)
-        return messages
+    @classmethod
+    def _class_messages(cls):
+        bases = cls.__dict__.get('_message_bases')
+        current = [klass.__dict__['messages'] for klass in cls.__mro__ if 'messages' in klass.__dict__]
+        if bases is None or len(bases) != len(current) or any(a is not b for a, b in zip(bases, current)):
+            bases = cls._message_bases = tuple(current)
+        return Messages(bases)
 
     def _update_attributes(self, kwargs):
         for key, value in kwargs.items():
@@ -37,42 +53,166 @@ class Field(object):
         message = 'Invalid argument ({}) for field: {}'.format(key, self.__class__.__name__)
         return BadConfiguration(message)
 
-    def submit(self, value):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'submit' in cls.__dict__ and cls.__module__.partition('.')[0] != __name__.partition('.')[0]:
+            keywords = _keywords(cls.submit)
+            if keywords is None or 'fail_fast' in keywords:
+                cls._submit = Field._submit_overridden
+            else:
+                cls._submit = Field._submit_legacy
+
+    def submit(self, value, fail_fast=False):
+        value, error = Field._submit(self, value, fail_fast)
+        return value, render(error)
+
+    def _submit_overridden(self, value, fail_fast=False):
+        return self.submit(value, **_submit_options(fail_fast))
+
+    def _submit_legacy(self, value, fail_fast=False):
+        return self.submit(value)
+
+    def _submit(self, value, fail_fast=False):
+        if self.cache and type(value) in CACHEABLE:
+            return self._result_cache().submit(self._submit_value, value, fail_fast)
+        return self._submit_value(value, fail_fast)
+
+    def _submit_value(self, value, fail_fast=False):
         try:
-            new_value = self._process_value(value)
+            new_value = self._process_value(value, fail_fast)
         except ValidationError as e:
             return value, e.data
+        if type(new_value) is Invalid:
+            return value, new_value.data
         if isinstance(new_value, ValidationError):
             raise BadValidation('Field validation returned an error instead of raising it.')
         return new_value, None
 
-    def _process_value(self, value):
+    def _update(self, previous, result, value):
+        return self._submit(value)
+
+    async def asubmit(self, value):
+        try:
+            new_value = self._process_value(value, validate=self.avalidate)
+            if isawaitable(new_value):
+                new_value = await new_value
+        except ValidationError as e:
+            return value, render(e.data)
+        if type(new_value) is Invalid:
+            return value, render(new_value.data)
+        if isinstance(new_value, ValidationError):
+            raise BadValidation('Field validation returned an error instead of raising it.')
+        return new_value, None
+
+    def cache_info(self):
+        if not self.cache:
+            return CacheInfo(0, 0, self.cache, 0)
+        return self._result_cache().info()
+
+    def cache_clear(self):
+        self.__dict__.pop('_results', None)
+
+    def _result_cache(self):
+        results = self.__dict__.get('_results')
+        if results is None or results.maxsize != self.cache:
+            results = self._results = ResultCache(self.cache)
+        return results
+
+    def submit_column(self, values):
+        return submit_column(self, values)
+
+    def _process_value(self, value, fail_fast=False, validate=None):
+        if self.max_length is not None and type(value) in SIZED and len(value) > self.max_length:
+            return self._invalid('length')
         if self.default is not None and self.is_empty(value):
             value = self.default
         if self.is_empty(value):
             if self.required:
-                raise self.error('required')
+                return self._invalid('required')
             else:
                 return self.empty_value()
-        return self.validate(value)
+        if validate is None:
+            validate = self._validator(fail_fast)
+        return validate(value)
+
+    def _validator(self, fail_fast):
+        if type(self).validate is not Field.validate:
+            return self.validate
+        return self._check_fail_fast if fail_fast else self._check
 
     def is_empty(self, value):
-        return value is None or str(value).strip() is ''
+        if value is None:
+            return True
+        if type(value) is str:
+            return not value or value.isspace()
+        if type(value) in SCALARS:
+            return False
+        return str(value).strip() == ''
 
     def empty_value(self):
         return None
 
     def validate(self, value):
+        value = self._check(value)
+        if type(value) is Invalid:
+            raise ValidationError(value.data)
         return value
 
+    def _check(self, value):
+        return value
+
+    def _check_fail_fast(self, value):
+        return self._check(value)
+
+    async def avalidate(self, value):
+        return await resolve(self.validate(value))
+
     def error(self, message):
-        message = self.messages.get(message, message)
-        message = self.format_message(message)
-        return ValidationError(message)
+        return ValidationError(self._render(message))
+
+    def _invalid(self, message):
+        return Invalid(Message(self, message))
+
+    def _render(self, code):
+        return self.format_message(self.messages.get(code, code))
 
     def format_message(self, message):
-        matches = re.findall(r'\{([a-zA-Z][a-zA-Z0-9_]*?)\}', message)
-        for match in matches:
-            placeholder = '{' + match + '}'
-            message = message.replace(placeholder, str(getattr(self, match)))
-        return message
+        head, parts = compile_template(message)
+        if not parts:
+            return head
+        chunks = [head]
+        for name, text in parts:
+            chunks.append(str(getattr(self, name)))
+            chunks.append(text)
+        return ''.join(chunks)
+
+
+def _submit_options(fail_fast):
+    return {'fail_fast': True} if fail_fast else {}
+
+
+def _keywords(function):
+    parameters = signature(function).parameters.values()
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return frozenset(parameter.name for parameter in parameters)
+
+
+def _unchanged(old, new):
+    return new is old or type(new) is type(old) and new == old
+
+
+def _snapshot(value):
+    if type(value) is list:
+        return [_snapshot(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_snapshot(item) for item in value)
+    if type(value) is dict or hasattr(value, 'items'):
+        return {key: _snapshot(item) for key, item in value.items()}
+    return value
+
+
+def _exceeds_digits(value, limit):
+    if type(value) is not str or len(value) <= limit:
+        return False
+    return len(value) > limit + DIGITS_SLACK or sum(map(str.isdigit, value)) > limit
@@ -1,4 +1,9 @@
 from ..field import Field
+from ..columns import numpy, submit_column
+
+
+TRUE_VALUES = ('true', 'yes', '1', 'on')
+FALSE_VALUES = ('false', 'no', '0', 'off')
 
 
 class Boolean(Field):
@@ -7,10 +12,30 @@ class Boolean(Field):
         'type': 'Invalid boolean.',
     }
 
-    def validate(self, value):
+    def _check(self, value):
+        if type(value) is bool:
+            return value
+        if type(value) is int:
+            return value == 1 if value in (0, 1) else self._invalid('type')
         value = str(value).strip().lower()
-        if value in ('true', 'yes', '1', 'on'):
+        if value in TRUE_VALUES:
             return True
-        if value in ('false', 'no', '0', 'off'):
+        if value in FALSE_VALUES:
             return False
-        raise self.error('type')
+        return self._invalid('type')
+
+    def submit_column(self, values):
+        return submit_column(self, values, Boolean, self._convert_column)
+
+    def _convert_column(self, array, empty):
+        kind = array.dtype.kind
+        if kind == 'b':
+            return array, numpy.zeros(len(array), dtype=bool), None
+        if kind in 'iu':
+            true = array == 1
+            return true, ~true & (array != 0), None
+        if kind != 'U':
+            return None
+        array = numpy.char.lower(numpy.char.strip(array))
+        true = numpy.isin(array, TRUE_VALUES)
+        return true, ~true & ~numpy.isin(array, FALSE_VALUES), None
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from ..field import Field
 from ..parsers import parse_date
@@ -25,14 +25,15 @@ class Date(Field):
         if self.max and self.parsed_max is None:
             raise ValueError('Invalid max date.')
 
-    def validate(self, value):
-        value = self.parse(value)
+    def _check(self, value):
+        if type(value) is not date:
+            value = self.parse(value)
         if value is None:
-            raise self.error('type')
+            return self._invalid('type')
         if self.min and value < self.parsed_min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max and value > self.parsed_max:
-            raise self.error('max')
+            return self._invalid('max')
         return value
 
     def parse(self, value):
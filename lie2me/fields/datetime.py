@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from ..field import Field
 from ..parsers import parse_datetime
 
@@ -25,16 +27,17 @@ class DateTime(Field):
         if self.max and self.parsed_max is None:
             raise ValueError('Invalid max datetime.')
 
-    def validate(self, value):
-        value = parse_datetime(value)
+    def _check(self, value):
+        if type(value) is not datetime:
+            value = parse_datetime(value)
         if value is None:
-            raise self.error('type')
+            return self._invalid('type')
         if self.timezone is True and not value.tzinfo:
-            raise self.error('naive')
+            return self._invalid('naive')
         if self.timezone is False and value.tzinfo:
-            raise self.error('aware')
+            return self._invalid('aware')
         if self.min and value < self.parsed_min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max and value > self.parsed_max:
-            raise self.error('max')
+            return self._invalid('max')
         return value
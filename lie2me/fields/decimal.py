@@ -1,26 +1,47 @@
 from decimal import Decimal as D
-from ..field import Field
+from ..field import Field, _exceeds_digits
+from ..columns import numpy, submit_column
 
 
 class Decimal(Field):
 
     min = None
     max = None
+    max_digits = None
 
     messages = {
         'type': 'Invalid number.',
+        'digits': 'Must have no more than {max_digits} digits.',
         'min': 'Must not be lower than {min}.',
         'max': 'Must not be higher than {max}.',
     }
 
-    def validate(self, value):
-        value = str(value)
-        try:
-            value = D(value)
-        except:
-            raise self.error('type')
-        if self.min is not None and value < D(str(self.min)):
-            raise self.error('min')
-        if self.max is not None and value > D(str(self.max)):
-            raise self.error('max')
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parsed_min = D(str(self.min)) if self.min is not None else None
+        self.parsed_max = D(str(self.max)) if self.max is not None else None
+
+    def _check(self, value):
+        if type(value) is not D:
+            if self.max_digits is not None and _exceeds_digits(value, self.max_digits):
+                return self._invalid('digits')
+            try:
+                value = D(value if type(value) is int else str(value))
+            except:
+                return self._invalid('type')
+        if self.parsed_min is not None and value < self.parsed_min:
+            return self._invalid('min')
+        if self.parsed_max is not None and value > self.parsed_max:
+            return self._invalid('max')
         return value
+
+    def submit_column(self, values):
+        if numpy is None or not isinstance(values, numpy.ndarray):
+            return super().submit_column(values)
+        return submit_column(self, values, Decimal, self._convert_column)
+
+    def _convert_column(self, array, empty):
+        if array.dtype.kind not in 'iuf' or numpy.isnan(array).any():
+            return None
+        data = [D(str(value)) for value in array]
+        return array, numpy.zeros(len(array), dtype=bool), data
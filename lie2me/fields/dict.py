@@ -1,5 +1,7 @@
-from ..field import Field
-from ..exceptions import ValidationError, BadConfiguration
+from asyncio import gather
+
+from ..field import Field, _unchanged
+from ..exceptions import Invalid, BadConfiguration
 
 
 class Dict(Field):
@@ -16,8 +18,14 @@ class Dict(Field):
                 raise BadConfiguration('First argument must be a dict of field instances.')
         return fields
 
-    def submit(self, data):
-        data, errors = super().submit(data)
+    def submit(self, data, fail_fast=False):
+        data, errors = super().submit(data, fail_fast)
+        if errors is None:
+            errors = {}
+        return data, errors
+
+    async def asubmit(self, data):
+        data, errors = await super().asubmit(data)
         if errors is None:
             errors = {}
         return data, errors
@@ -28,15 +36,69 @@ class Dict(Field):
     def empty_value(self):
         return {}
 
-    def validate(self, data):
+    def _check(self, data):
+        return self._check_entries(data, False)
+
+    def _check_fail_fast(self, data):
+        return self._check_entries(data, True)
+
+    def _check_entries(self, data, fail_fast):
+        results = (field._submit(data.get(key), fail_fast) for key, field in self.fields.items())
+        return self._collect_entries(results, fail_fast)
+
+    def _update(self, previous, result, data):
+        value, error = result
+        if not self._updatable(previous, error, data):
+            return self._submit(data)
+        values = dict.fromkeys(self.fields)
+        errors = {}
+        changed = []
+        unknown = []
+        for key in self.fields:
+            if not _unchanged(previous.get(key), data.get(key)):
+                changed.append(key)
+            elif error is None:
+                values[key] = value[key]
+            elif key in error:
+                errors[key] = error[key]
+            else:
+                unknown.append(key)
+        self._update_entries(data, changed, values, errors)
+        if not errors:
+            self._update_entries(data, unknown, values, errors)
+        if errors:
+            return data, {key: errors[key] for key in self.fields if key in errors}
+        return values, None
+
+    def _updatable(self, previous, error, data):
+        if type(self).validate is not Field.validate or data is previous:
+            return False
+        if not isinstance(previous, dict) or not isinstance(data, dict):
+            return False
+        return bool(previous and data) and (error is None or type(error) is dict)
+
+    def _update_entries(self, data, keys, values, errors):
+        for key in keys:
+            value, error = self.fields[key]._submit(data.get(key))
+            if error:
+                errors[key] = error
+            else:
+                values[key] = value
+
+    async def avalidate(self, data):
+        results = await gather(*(field.asubmit(data.get(key)) for key, field in self.fields.items()))
+        return self._collect_entries(results)
+
+    def _collect_entries(self, results, fail_fast=False):
         new_data = {}
         errors = {}
-        for key, field in self.fields.items():
-            value, error = field.submit(data.get(key))
+        for key, (value, error) in zip(self.fields, results):
             if error:
                 errors[key] = error
+                if fail_fast:
+                    break
             else:
                 new_data[key] = value
         if errors:
-            raise ValidationError(errors)
+            return Invalid(errors)
         return new_data
@@ -1,5 +1,8 @@
-import re
 from ..field import Field
+from ..patterns import compile_pattern
+
+
+EMAIL_PATTERN = compile_pattern(r'^[^@]+@[^@]+\.[^@]+$', 0)
 
 
 class Email(Field):
@@ -8,10 +11,10 @@ class Email(Field):
         'type': 'Invalid email.',
     }
 
-    def validate(self, value):
+    def _check(self, value):
         value = str(value).strip()
         if len(value) > 254:
-            raise self.error('type')
-        if not re.match(r'^[^@]+@[^@]+\.[^@]+$', value):
-            raise self.error('type')
+            return self._invalid('type')
+        if not EMAIL_PATTERN.match(value):
+            return self._invalid('type')
         return value
@@ -1,24 +1,38 @@
-from ..field import Field
+from ..field import Field, _exceeds_digits
+from ..columns import numpy, submit_column
 
 
 class Float(Field):
 
     min = None
     max = None
+    max_digits = None
 
     messages = {
         'type': 'Invalid number.',
+        'digits': 'Must have no more than {max_digits} digits.',
         'min': 'Must not be lower than {min}.',
         'max': 'Must not be higher than {max}.',
     }
 
-    def validate(self, value):
-        try:
-            value = float(value)
-        except:
-            raise self.error('type')
+    def _check(self, value):
+        if type(value) is not float:
+            if self.max_digits is not None and _exceeds_digits(value, self.max_digits):
+                return self._invalid('digits')
+            try:
+                value = float(value)
+            except:
+                return self._invalid('type')
         if self.min is not None and value < self.min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max is not None and value > self.max:
-            raise self.error('max')
+            return self._invalid('max')
         return value
+
+    def submit_column(self, values):
+        return submit_column(self, values, Float, self._convert_column)
+
+    def _convert_column(self, array, empty):
+        if array.dtype.kind not in 'biuf':
+            return None
+        return array.astype(numpy.float64), numpy.zeros(len(array), dtype=bool), None
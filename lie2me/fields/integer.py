@@ -1,24 +1,46 @@
-from ..field import Field
+from ..field import Field, _exceeds_digits
+from ..columns import numpy, submit_column
 
 
 class Integer(Field):
 
     min = None
     max = None
+    max_digits = None
 
     messages = {
         'type': 'Invalid number.',
+        'digits': 'Must have no more than {max_digits} digits.',
         'min': 'Must not be lower than {min}.',
         'max': 'Must not be higher than {max}.',
     }
 
-    def validate(self, value):
-        try:
-            value = int(value)
-        except:
-            raise self.error('type')
+    def _check(self, value):
+        if type(value) is not int:
+            if self.max_digits is not None and _exceeds_digits(value, self.max_digits):
+                return self._invalid('digits')
+            try:
+                value = int(value)
+            except:
+                return self._invalid('type')
         if self.min is not None and value < self.min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max is not None and value > self.max:
-            raise self.error('max')
+            return self._invalid('max')
         return value
+
+    def submit_column(self, values):
+        return submit_column(self, values, Integer, self._convert_column)
+
+    def _convert_column(self, array, empty):
+        kind = array.dtype.kind
+        invalid = numpy.zeros(len(array), dtype=bool)
+        if kind in 'biu':
+            return array.astype(numpy.int64) if kind == 'b' else array, invalid, None
+        if kind == 'f':
+            finite = numpy.isfinite(array)
+            array = numpy.trunc(numpy.where(finite, array, 0))
+            if numpy.abs(array).max(initial=0) >= 2 ** 53:
+                return None
+            return array.astype(numpy.int64), ~finite, None
+        return None
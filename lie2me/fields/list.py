@@ -1,11 +1,18 @@
-from .. import Form, Field
-from ..exceptions import ValidationError, BadConfiguration
+from asyncio import gather
+from itertools import islice
+
+from .. import Form, Field, compiler
+from ..field import _unchanged
+from ..exceptions import ValidationError, Invalid, BadConfiguration
+from ..messages import Message, render
 
 
 class List(Field):
 
     min = None
     max = None
+    lazy = False
+    max_errors = None
 
     messages = {
         'type': 'Invalid list.',
@@ -14,9 +21,10 @@ class List(Field):
     }
 
     def __init__(self, field, *args, **kwargs):
-        if not isinstance(field, Field):
-            raise BadConfiguration('First argument must be a field instance.')
+        if not isinstance(field, Field) and not (isinstance(field, type) and issubclass(field, Form)):
+            raise BadConfiguration('First argument must be a field instance or a form class.')
         self.field = field
+        self._compiled = None
         super().__init__(*args, **kwargs)
 
     def is_empty(self, data):
@@ -25,25 +33,186 @@ class List(Field):
     def empty_value(self):
         return []
 
-    def validate(self, data):
+    def _check(self, data):
+        return self._check_items(data, False)
+
+    def _check_fail_fast(self, data):
+        return self._check_items(data, True)
+
+    def _check_items(self, data, fail_fast):
+        invalid = self._check_list(data)
+        if invalid is not None:
+            return invalid
+        if self.lazy:
+            return LazyItems(self, data, fail_fast)
+        return self._collect_items(self._submit_items(data, fail_fast), fail_fast)
+
+    def _submit_items(self, data, fail_fast):
+        if isinstance(self.field, Field):
+            field = self.field
+            results = (field._submit(value, fail_fast) for value in data)
+        elif fail_fast:
+            results = ((value, errors) for valid, value, errors in self.field._submit_each(data, True))
+        else:
+            results = self._submit_compiled(data)
+        return results
+
+    def _submit_compiled(self, data):
+        submit = self._compiled_form()
+        for value in data:
+            valid, value, errors = submit(value)
+            yield value, errors
+
+    def _compiled_form(self):
+        compiled = self._compiled
+        if compiled is None or any(form._get_schema() is not schema for form, schema in compiled.schemas):
+            compiled = self._compiled = compiler.compile_form(self.field)
+        return compiled
+
+    def _update(self, previous, result, data):
+        value, error = result
+        if not self._updatable(previous, error, data):
+            return self._submit(data)
+        invalid = self._check_list(data)
+        if invalid is not None:
+            return data, invalid.data
+        values = [None] * len(data)
+        errors = {}
+        changed = []
+        unknown = []
+        for i, item in enumerate(data):
+            if i >= len(previous) or not _unchanged(previous[i], item):
+                changed.append(i)
+            elif error is None:
+                values[i] = value[i]
+            elif i in error:
+                errors[i] = error[i]
+            else:
+                unknown.append(i)
+        self._update_items(data, changed, values, errors)
+        if not errors:
+            self._update_items(data, unknown, values, errors)
+        if errors:
+            return data, dict(sorted(errors.items()))
+        return values, None
+
+    def _updatable(self, previous, error, data):
+        if type(self).validate is not Field.validate or self.lazy or self.max_errors is not None:
+            return False
+        if data is previous or not isinstance(previous, (list, tuple)) or not isinstance(data, (list, tuple)):
+            return False
+        return bool(previous and data) and (error is None or type(error) is dict and 'list' not in error)
+
+    def _update_items(self, data, indexes, values, errors):
+        for i, (value, error) in zip(indexes, self._submit_items([data[i] for i in indexes], False)):
+            if error:
+                errors[i] = error
+            else:
+                values[i] = value
+
+    async def avalidate(self, data):
+        if self.lazy:
+            return self._check(data)
+        invalid = self._check_list(data)
+        if invalid is not None:
+            return invalid
+        if isinstance(self.field, Field):
+            results = await gather(*(self.field.asubmit(value) for value in data))
+        else:
+            results = await gather(*(self._asubmit_form(value) for value in data))
+        return self._collect_items(results)
+
+    async def _asubmit_form(self, value):
+        form = self.field(value)
+        await form.asubmit()
+        return form.data, form.errors
+
+    def _check_list(self, data):
         if not isinstance(data, list) and not isinstance(data, tuple):
-            raise self.error('type')
+            if self.lazy and _is_iterable(data):
+                return None
+            return self._invalid('type')
         if self.min is not None and len(data) < self.min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max is not None and len(data) > self.max:
-            raise self.error('max')
+            return self._invalid('max')
+        return None
+
+    def _collect_items(self, results, fail_fast=False):
         new_data = []
         errors = {}
-        for i, value in enumerate(data):
-            value, error = self.field.submit(value)
-            if error is None:
+        for i, (value, error) in enumerate(results):
+            if not error:
                 new_data.append(value)
             else:
                 errors[i] = error
+                if fail_fast or len(errors) == self.max_errors:
+                    break
         if errors:
-            raise ValidationError(errors)
+            return Invalid(errors)
         return new_data
 
     def error(self, message):
-        e = super().error(message)
-        raise ValidationError({'list': e.data})
+        return ValidationError(render(self._invalid(message).data))
+
+    def _invalid(self, message):
+        return Invalid({'list': Message(self, message)})
+
+
+class LazyItems(object):
+
+    def __init__(self, field, data, fail_fast=False):
+        self.field = field
+        self.count = 0
+        self.error_count = 0
+        self.done = False
+        self._errors = {}
+        self._items = self._validate(data, fail_fast)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    @property
+    def errors(self):
+        return render(self._errors)
+
+    @property
+    def valid(self):
+        if not self.done:
+            return None
+        return not self.error_count
+
+    def _validate(self, data, fail_fast):
+        field = self.field
+        if field.max is not None:
+            data = islice(data, field.max + 1)
+        total = 0
+        try:
+            for i, (value, error) in enumerate(field._submit_items(data, fail_fast)):
+                total += 1
+                if field.max is not None and i == field.max:
+                    self._error('list', Message(field, 'max'))
+                    return
+                if error:
+                    self._error(i, error)
+                    if fail_fast:
+                        return
+                else:
+                    self.count += 1
+                    yield value
+            if field.min is not None and total < field.min:
+                self._error('list', Message(field, 'min'))
+        finally:
+            self.done = True
+
+    def _error(self, key, error):
+        self.error_count += 1
+        if self.field.max_errors is None or len(self._errors) < self.field.max_errors:
+            self._errors[key] = error
+
+
+def _is_iterable(data):
+    return hasattr(data, '__iter__') and not isinstance(data, (str, bytes, dict))
@@ -14,10 +14,10 @@ class Password(Field):
     def is_empty(self, value):
         return value is None or value is ''
 
-    def validate(self, value):
+    def _check(self, value):
         value = str(value)
         if self.min is not None and len(value) < self.min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max is not None and len(value) > self.max:
-            raise self.error('max')
+            return self._invalid('max')
         return value
@@ -1,5 +1,12 @@
 import re
+
 from ..field import Field
+from ..options import Options
+from ..patterns import compile_pattern
+from ..exceptions import BadConfiguration
+
+
+SPACE = re.compile(r'\s*')
 
 
 class Text(Field):
@@ -8,7 +15,9 @@ class Text(Field):
     max = None
     multiline = False
     pattern = None
+    pattern_max_length = None
     options = None
+    normalize = None
     trim = True
 
     messages = {
@@ -19,18 +28,59 @@ class Text(Field):
         'options': 'Invalid option.',
     }
 
-    def validate(self, value):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if isinstance(self.options, Options) and self.normalize is not None:
+            raise BadConfiguration('Normalize must be set on the options instance.')
+        self._pattern_source = self._pattern = None
+        self._options_source = self._options_index = None
+        if self.pattern:
+            self._compiled_pattern()
+        if self.options is not None:
+            self._indexed_options()
+
+    def _check(self, value):
         value = str(value)
+        if self.max is not None and len(value) > self.max and not (self.trim and _fits_trimmed(value, self.max)):
+            return self._invalid('max')
         if self.trim:
             value = value.strip()
         if self.min is not None and len(value) < self.min:
-            raise self.error('min')
+            return self._invalid('min')
         if self.max is not None and len(value) > self.max:
-            raise self.error('max')
+            return self._invalid('max')
         if not self.multiline and len(value.splitlines()) > 1:
-            raise self.error('multiline')
-        if self.pattern and not re.match(self.pattern, value, flags=re.MULTILINE|re.DOTALL):
-            raise self.error('pattern')
-        if self.options and value not in self.options:
-            raise self.error('options')
+            return self._invalid('multiline')
+        if self.pattern and not self._match_pattern(value):
+            return self._invalid('pattern')
+        if self.options:
+            value = self._match_option(value)
+            if value is None:
+                return self._invalid('options')
         return value
+
+    def _match_pattern(self, value):
+        if self.pattern_max_length is not None and len(value) > self.pattern_max_length:
+            return False
+        return self._compiled_pattern().match(value)
+
+    def _compiled_pattern(self):
+        if self._pattern_source is not self.pattern:
+            self._pattern = compile_pattern(self.pattern)
+            self._pattern_source = self.pattern
+        return self._pattern
+
+    def _match_option(self, value):
+        return self._indexed_options().get(value)
+
+    def _indexed_options(self):
+        if self._options_source is not self.options:
+            options = self.options
+            self._options_index = options if isinstance(options, Options) else Options(options, self.normalize)
+            self._options_source = options
+        return self._options_index
+
+
+def _fits_trimmed(value, max):
+    start = SPACE.match(value).end()
+    return SPACE.fullmatch(value, start + max) is not None
@@ -1,26 +1,125 @@
-from .field import Field
+from asyncio import gather
+from collections import namedtuple
+from types import MappingProxyType
+
+from . import aio, profiling
+from .field import Field, _keywords, _submit_options, _snapshot, _unchanged
+from .messages import render
+from .batch import Batch
+from .decoder import JSONReader, TooDeep, exceeds_depth
 from .exceptions import BadValidation
 
 
-class Form(object):
+Schema = namedtuple('Schema', ['fields', 'forms'])
+
+
+class FormMeta(type):
+
+    def __setattr__(cls, key, value):
+        super().__setattr__(key, value)
+        if not key.startswith('_'):
+            cls._invalidate_schema()
+
+    def __delattr__(cls, key):
+        super().__delattr__(key)
+        if not key.startswith('_'):
+            cls._invalidate_schema()
+
+    def _invalidate_schema(cls):
+        if '_schema' in cls.__dict__:
+            type.__delattr__(cls, '_schema')
+        for subclass in cls.__subclasses__():
+            subclass._invalidate_schema()
+
+
+class Form(object, metaclass=FormMeta):
+
+    __slots__ = ('fields', 'forms', 'data', 'valid', '_errors', '_path', '_input', '_results')
+
+    max_keys = None
+    max_depth = None
+
+    messages = {
+        'keys': 'Too many keys.',
+        'depth': 'Too deeply nested.',
+    }
 
     def __init__(self, data=None):
-        self.fields, self.forms = self._get_fields_and_nested_forms()
-        self._initialize_data(data)
-        self.errors = {}
-        self.valid = None
+        self.fields, self.forms = self._get_schema()
+        if getattr(self, '__dict__', None):
+            self._merge_instance_schema()
+        self._path = ()
+        self._reset(data)
+
+    @classmethod
+    def submit_many(cls, records, fail_fast=False):
+        batch = Batch()
+        for valid, data, errors in cls._submit_each(records, fail_fast):
+            batch.append(valid, data, errors)
+        return batch
+
+    @classmethod
+    def _submit_each(cls, records, fail_fast=False):
+        form = cls()
+        for record in records:
+            yield form._submit_record(record, fail_fast)
+
+    def _submit_record(self, data, fail_fast=False):
+        self._reset(data)
+        self.submit(**_form_options(type(self), fail_fast, False))
+        return self.valid, self.data, self._errors
 
-    def _get_fields_and_nested_forms(self):
+    @classmethod
+    def _get_schema(cls):
+        schema = cls.__dict__.get('_schema')
+        if schema is None:
+            schema = cls._build_schema()
+            type.__setattr__(cls, '_schema', schema)
+        return schema
+
+    @classmethod
+    def _build_schema(cls):
         fields = {}
         forms = {}
-        for key in dir(self):
+        for key in dir(cls):
+            if not key.startswith('_'):
+                attr = getattr(cls, key)
+                if isinstance(attr, Field):
+                    fields[key] = attr
+                if isinstance(attr, type) and issubclass(attr, Form):
+                    forms[key] = attr
+        return Schema(MappingProxyType(fields), MappingProxyType(forms))
+
+    def _merge_instance_schema(self):
+        fields = dict(self.fields)
+        forms = dict(self.forms)
+        for key, attr in self.__dict__.items():
             if not key.startswith('_'):
-                attr = getattr(self, key)
+                fields.pop(key, None)
+                forms.pop(key, None)
                 if isinstance(attr, Field):
                     fields[key] = attr
                 if isinstance(attr, type) and issubclass(attr, Form):
                     forms[key] = attr
-        return fields, forms
+        self.fields = dict(sorted(fields.items()))
+        self.forms = dict(sorted(forms.items()))
+
+    def _reset(self, data):
+        self._initialize_data(data)
+        self._errors = None
+        self.valid = None
+        self._input = self.data
+        self._results = None
+
+    @property
+    def errors(self):
+        if self._errors is None:
+            self._errors = {}
+        return render(self._errors)
+
+    @errors.setter
+    def errors(self, errors):
+        self._errors = errors
 
     def _initialize_data(self, data):
         data = data if hasattr(data, 'get') else None
@@ -29,40 +128,269 @@ class Form(object):
             for key, form in self.forms.items():
                 self.data[key] = {}
 
-    def submit(self):
+    def submit(self, fail_fast=False, partial=False):
+        self._input = self.data
+        self._results = None
+        if (self.max_keys is not None or self.max_depth is not None) and self._check_size():
+            return
         data = {}
-        data.update(self._validate_fields())
-        data.update(self._validate_forms())
-        data = self.validate(data)
-        self.valid = not self.errors
+        data.update(self._validate_fields(fail_fast, partial))
+        if not (fail_fast and self._errors):
+            data.update(self._validate_forms(fail_fast, partial))
+        if not (fail_fast and self._errors):
+            data = self.validate(data) if profiling.hook is None else profiling.validate(self, data)
+        self._finish(data)
+
+    async def asubmit(self, concurrency=None):
+        self._input = self.data
+        self._results = None
+        if (self.max_keys is not None or self.max_depth is not None) and self._check_size():
+            return
+        token = aio.enter(concurrency)
+        try:
+            fields = gather(*(field.asubmit(self.data.get(key)) for key, field in self.fields.items()))
+            forms = gather(*(self._asubmit_form(key, form) for key, form in self.forms.items()))
+            fields, forms = await gather(fields, forms)
+            data = {}
+            data.update(self._collect_fields(fields))
+            data.update(self._collect_forms(forms))
+            data = await aio.resolve(self.validate(data))
+            self._finish(data)
+        finally:
+            aio.leave(token)
+
+    def _check_size(self):
+        if self.max_keys is not None and len(self.data) > self.max_keys:
+            code = 'keys'
+        elif self.max_depth is not None and exceeds_depth(self.data, self.max_depth):
+            code = 'depth'
+        else:
+            return False
+        self._reject(code)
+        return True
+
+    def _reject(self, code):
+        self._add_error('form', self.messages.get(code, Form.messages[code]))
+        self.valid = False
+
+    def submit_json(self, body, fail_fast=False, partial=False):
+        reader = JSONReader(body, self.max_depth)
+        try:
+            if _is_standard(type(self)):
+                submitted = self._submit_reader(reader, fail_fast, partial)
+            else:
+                self._reset(reader.read())
+                self.submit(**_form_options(type(self), fail_fast, partial))
+                submitted = True
+        except TooDeep:
+            self._reject('depth')
+            return
+        if submitted:
+            reader.close()
+
+    def _submit_reader(self, reader, fail_fast=False, partial=False):
+        self._errors = None
+        self.valid = None
+        if reader.peek() != '{':
+            reader.skip()
+            self._reset(None)
+            self.submit(**_form_options(type(self), fail_fast, partial))
+            return True
+        data = {}
+        results = {}
+        failed = False
+        for count, key in enumerate(reader.members(), 1):
+            if self.max_keys is not None and count > self.max_keys:
+                self._reject('keys')
+                return False
+            if failed or key not in self.fields and key not in self.forms:
+                reader.skip()
+            elif key in self.fields:
+                value = reader.read()
+                data[key] = value
+                results[key] = (value, self.fields[key]._submit(value, fail_fast))
+                failed = fail_fast and bool(results[key][1][1])
+            else:
+                data[key], results[key] = self._read_form(reader, self.forms[key], fail_fast, partial)
+                failed = fail_fast and not results[key].valid
+        if not (partial or failed):
+            self._submit_absent(results, fail_fast)
+        self._input = self.data = data
+        self._results = None if fail_fast or partial else results
+        self._finish_results(results, fail_fast)
+        return True
+
+    def _submit_absent(self, results, fail_fast):
+        for key, field in self.fields.items():
+            if key not in results:
+                results[key] = (None, field._submit(None, fail_fast))
+                if fail_fast and results[key][1][1]:
+                    return
+        for key, form in self.forms.items():
+            if key not in results:
+                results[key] = f = form()
+                f.submit(**_form_options(form, fail_fast, False))
+                if fail_fast and not f.valid:
+                    return
+
+    def _read_form(self, reader, form, fail_fast, partial):
+        f = form()
+        if reader.peek() == '{' and form.max_keys is None and form.max_depth is None and _is_standard(form):
+            f._submit_reader(reader, fail_fast, partial)
+            return f._input, f
+        value = reader.read()
+        f._reset(value)
+        f.submit(**_form_options(form, fail_fast, partial))
+        return value, f
+
+    def update(self, changes=None):
+        if self._results is None:
+            data = _snapshot(self._input)
+        else:
+            data = dict(self._input)
+        if changes:
+            data.update(_snapshot(changes))
+        self._revalidate(data, changes if self._results is not None else None)
+
+    def _revalidate(self, data, keys=None):
+        if keys is None or self._results is None:
+            self._results = {}
+            keys = list(self.fields) + list(self.forms)
+        results = self._results
+        for key in keys:
+            if key in self.fields:
+                results[key] = self._update_field(key, data.get(key), results.get(key))
+            elif key in self.forms:
+                results[key] = self._update_form(key, data.get(key), results.get(key))
+        self._input = self.data = data
+        self._finish_results(results)
+
+    def _finish_results(self, results, fail_fast=False):
+        self._errors = None
+        data = {}
+        for key in self.fields:
+            if key in results:
+                value, error = results[key][1]
+                if not error:
+                    data[key] = value
+                else:
+                    self._add_error(key, error)
+        for key in self.forms:
+            if key in results:
+                f = results[key]
+                if f.valid:
+                    data[key] = f.data
+                else:
+                    self._add_error(key, f._errors)
+        if not (fail_fast and self._errors):
+            data = self.validate(data)
+        self._finish(data)
+
+    def _update_field(self, key, value, previous):
+        field = self.fields[key]
+        if previous is None:
+            return value, field._submit(value)
+        return value, field._update(previous[0], previous[1], value)
+
+    def _update_form(self, key, value, previous):
+        if previous is None or not hasattr(value, 'get'):
+            f = self.forms[key](value)
+            f._revalidate(dict(f.data))
+            return f
+        keys = set(previous._input) | set(value)
+        previous._revalidate(dict(value), [k for k in keys if not _unchanged(previous._input.get(k), value.get(k))])
+        return previous
+
+    def _finish(self, data):
+        self.valid = not self._errors
         if self.valid:
             if data is None:
                 raise BadValidation('Form validation did not return any data.')
             self.data = data
 
-    def _validate_fields(self):
+    def _validate_fields(self, fail_fast=False, partial=False):
+        fields = self._present(self.fields) if partial else self.fields
+        if profiling.hook is None:
+            results = (field._submit(self.data.get(key), fail_fast) for key, field in fields.items())
+        else:
+            results = profiling.submit_fields(self, fail_fast, fields)
+        return self._collect_fields(results, fail_fast, fields)
+
+    def _present(self, schema):
+        if len(self.data) < len(schema):
+            return {key: schema[key] for key in self.data if key in schema}
+        return {key: value for key, value in schema.items() if key in self.data}
+
+    def _collect_fields(self, results, fail_fast=False, fields=None):
         data = {}
-        for key, field in self.fields.items():
-            value, error = field.submit(self.data.get(key))
-            if error is None:
+        for key, (value, error) in zip(self.fields if fields is None else fields, results):
+            if not error:
                 data[key] = value
             else:
-                self.errors[key] = error
+                self._add_error(key, error)
+                if fail_fast:
+                    break
         return data
 
-    def _validate_forms(self):
-        data = {}
-        for key, form in self.forms.items():
+    def _validate_forms(self, fail_fast=False, partial=False):
+        forms = self._present(self.forms) if partial else self.forms
+        results = []
+        for key, form in forms.items():
             f = form(self.data.get(key))
-            f.submit()
+            options = _form_options(form, fail_fast, partial)
+            if profiling.hook is None:
+                f.submit(**options)
+            else:
+                profiling.submit_form(self, key, f, options)
+            results.append(f)
+            if fail_fast and not f.valid:
+                break
+        return self._collect_forms(results, forms)
+
+    async def _asubmit_form(self, key, form):
+        f = form(self.data.get(key))
+        await f.asubmit()
+        return f
+
+    def _collect_forms(self, results, forms=None):
+        data = {}
+        for key, f in zip(self.forms if forms is None else forms, results):
             if f.valid:
                 data[key] = f.data
             else:
-                self.errors[key] = f.errors
+                self._add_error(key, f._errors)
         return data
 
     def validate(self, data):
         return data
 
     def error(self, key, message):
-        self.errors[key] = message
+        self._add_error(key, message)
+
+    def _add_error(self, key, error):
+        if self._errors is None:
+            self._errors = {}
+        self._errors[key] = error
+
+
+def _form_options(form_class, fail_fast, partial):
+    options = _submit_options(fail_fast)
+    if partial:
+        options = dict(options, partial=True)
+    submit = form_class.submit
+    if not options or submit is Form.submit:
+        return options
+    keywords = form_class.__dict__.get('_submit_keywords')
+    if keywords is None or keywords[0] is not submit:
+        keywords = (submit, _keywords(submit))
+        type.__setattr__(form_class, '_submit_keywords', keywords)
+    if keywords[1] is None:
+        return options
+    return {key: value for key, value in options.items() if key in keywords[1]}
+
+
+def _is_standard(form_class):
+    for method in ('submit', '_initialize_data', '_validate_fields', '_validate_forms'):
+        if getattr(form_class, method) is not getattr(Form, method):
+            return False
+    return True
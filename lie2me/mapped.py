@@ -0,0 +1,175 @@
+import csv
+import json
+import mmap
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+
+
+BOM = b'\xef\xbb\xbf'
+CHUNK = 1 << 20
+
+
+class MappedRecords(object):
+
+    def __init__(self, path, format='jsonl', span=None, fieldnames=None, encoding='utf-8', **options):
+        if format not in ('jsonl', 'csv'):
+            raise ValueError('Unknown format: {}'.format(format))
+        self.path = path
+        self.format = format
+        self.encoding = encoding
+        self.options = options
+        self.fieldnames = fieldnames
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        start, stop, self.line_number = span or (0, size, 1)
+        if start == 0 and self.buffer[:3] == BOM:
+            start = 3
+        self.offsets = self._index(start, stop)
+        if format == 'csv' and fieldnames is None and len(self) > 0:
+            self.fieldnames = self._parse_csv(0)
+            self.line_number += _count_lines(self.buffer, self.offsets[0], self.offsets[1])
+            del self.offsets[0]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
+
+    def _index(self, start, stop):
+        if self.format == 'csv':
+            return self._index_csv(start, stop)
+        find = self.buffer.find
+        offsets = array('q')
+        pos = start
+        while pos < stop:
+            offsets.append(pos)
+            end = find(b'\n', pos, stop)
+            if end == -1:
+                break
+            pos = end + 1
+        offsets.append(stop)
+        return offsets
+
+    def _index_csv(self, start, stop):
+        consumed = [start]
+        def lines():
+            buffer, find, encoding = self.buffer, self.buffer.find, self.encoding
+            pos = start
+            while pos < stop:
+                end = find(b'\n', pos, stop)
+                end = stop if end == -1 else end + 1
+                consumed[0] = end
+                yield buffer[pos:end].decode(encoding, 'replace')
+                pos = end
+        offsets = array('q', [start])
+        reader = csv.reader(lines(), **self.options)
+        while True:
+            try:
+                next(reader)
+            except StopIteration:
+                break
+            except csv.Error:
+                pass
+            if consumed[0] > offsets[-1]:
+                offsets.append(consumed[0])
+        if offsets[-1] != stop:
+            offsets.append(stop)
+        return offsets
+
+    def spans(self, count):
+        offsets = self.offsets
+        total = len(self)
+        spans = []
+        line_number = self.line_number
+        previous = offsets[0]
+        for i in range(count):
+            first, last = total * i // count, total * (i + 1) // count
+            if first == last:
+                continue
+            line_number += _count_lines(self.buffer, previous, offsets[first])
+            previous = offsets[first]
+            spans.append((offsets[first], offsets[last], line_number))
+        return spans
+
+    def validate(self, form_class, valid=None, fail_fast=False):
+        form = form_class()
+        buffer = self.buffer
+        next_line = self.line_number
+        for i in range(len(self)):
+            offset = self.offsets[i]
+            record = buffer[offset:self.offsets[i + 1]]
+            line_number = next_line
+            next_line += record.count(b'\n')
+            if not record or record.isspace():
+                continue
+            if self.format == 'jsonl':
+                try:
+                    data = json.loads(record)
+                except ValueError:
+                    yield offset, line_number, (), 'Invalid JSON.'
+                    continue
+            else:
+                try:
+                    data = dict(zip(self.fieldnames, self._parse_csv(i, record)))
+                except (csv.Error, UnicodeDecodeError):
+                    yield offset, line_number, (), 'Invalid CSV.'
+                    continue
+            form._submit_record(data, fail_fast)
+            if form.valid:
+                if valid is not None:
+                    valid(offset, line_number, form.data)
+                continue
+            for path, message in _flatten(form._errors):
+                yield offset, line_number, path, message
+
+    def _parse_csv(self, i, record=None):
+        if record is None:
+            record = self.buffer[self.offsets[i]:self.offsets[i + 1]]
+        return next(csv.reader(StringIO(record.decode(self.encoding), newline=''), **self.options), [])
+
+
+def validate_mapped(path, form_class, format='jsonl', valid=None, fail_fast=False, **options):
+    with MappedRecords(path, format, **options) as records:
+        yield from records.validate(form_class, valid, fail_fast)
+
+
+def validate_mapped_parallel(path, form_class, format='jsonl', workers=None, fail_fast=False, **options):
+    workers = workers or os.cpu_count() or 1
+    with MappedRecords(path, format, **options) as records:
+        spans = records.spans(workers * 4)
+        fieldnames = records.fieldnames
+    if format == 'csv':
+        options = dict(options, fieldnames=fieldnames)
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(_validate_span, path, form_class, format, span, fail_fast, options) for span in spans]
+        for future in futures:
+            yield from future.result()
+
+
+def _validate_span(path, form_class, format, span, fail_fast, options):
+    with MappedRecords(path, format, span, **options) as records:
+        return list(records.validate(form_class, fail_fast=fail_fast))
+
+
+def _flatten(errors, path=()):
+    if type(errors) is not dict:
+        yield path, str(errors)
+        return
+    for key, error in errors.items():
+        yield from _flatten(error, path + (key,))
+
+
+def _count_lines(buffer, start, stop):
+    return sum(buffer[pos:min(pos + CHUNK, stop)].count(b'\n') for pos in range(start, stop, CHUNK))
@@ -0,0 +1,99 @@
+import re
+from collections.abc import MutableMapping
+from functools import lru_cache
+
+
+PLACEHOLDER = re.compile(r'\{([a-zA-Z][a-zA-Z0-9_]*?)\}')
+
+
+class Message(object):
+
+    __slots__ = ('field', 'code')
+
+    def __init__(self, field, code):
+        self.field = field
+        self.code = code
+
+    def __str__(self):
+        return self.field._render(self.code)
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, (str, Message)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __reduce__(self):
+        return str, (str(self),)
+
+
+class Messages(MutableMapping):
+
+    __slots__ = ('bases', 'overrides')
+
+    def __init__(self, bases, overrides=None):
+        self.bases = bases
+        self.overrides = overrides
+
+    def __getitem__(self, key):
+        if self.overrides is not None and key in self.overrides:
+            return self.overrides[key]
+        for messages in self.bases:
+            if key in messages:
+                return messages[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        if self.overrides is None:
+            self.overrides = {}
+        self.overrides[key] = value
+
+    def __delitem__(self, key):
+        if self.overrides is None:
+            raise KeyError(key)
+        del self.overrides[key]
+
+    def __iter__(self):
+        return iter(self._merged())
+
+    def __len__(self):
+        return len(self._merged())
+
+    def __repr__(self):
+        return repr(self._merged())
+
+    def _merged(self):
+        merged = {}
+        for messages in reversed(self.bases):
+            merged.update(messages)
+        merged.update(self.overrides or {})
+        return merged
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template):
+    parts = PLACEHOLDER.split(template)
+    return parts[0], tuple(zip(parts[1::2], parts[2::2]))
+
+
+def render(errors):
+    if type(errors) is Message:
+        return str(errors)
+    if type(errors) is dict:
+        for key, error in errors.items():
+            if type(error) is Message:
+                errors[key] = str(error)
+            elif type(error) is dict:
+                render(error)
+    return errors
@@ -0,0 +1,33 @@
+class Options(object):
+
+    def __init__(self, options, normalize=None):
+        self.normalize = normalize
+        if normalize is None:
+            self.index = frozenset(options)
+        else:
+            self.index = {}
+            for option in options:
+                self.index.setdefault(normalize(option), option)
+
+    @classmethod
+    def from_file(cls, path, normalize=None, encoding='utf-8'):
+        with open(path, encoding=encoding) as fp:
+            return cls((line.strip() for line in fp if line.strip()), normalize)
+
+    def __contains__(self, value):
+        if self.normalize is None:
+            return value in self.index
+        return self.normalize(value) in self.index
+
+    def __iter__(self):
+        if self.normalize is None:
+            return iter(self.index)
+        return iter(self.index.values())
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, value):
+        if self.normalize is None:
+            return value if value in self.index else None
+        return self.index.get(self.normalize(value))
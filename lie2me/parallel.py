@@ -0,0 +1,43 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .batch import Batch
+
+
+_form_class = None
+_fail_fast = False
+
+
+def submit_parallel(form_class, records, workers=None, chunk_size=1000, fail_fast=False):
+    workers = workers or os.cpu_count() or 1
+    batch = Batch()
+    pending = deque()
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(form_class, fail_fast)) as executor:
+        for chunk in _chunks(records, chunk_size):
+            pending.append(executor.submit(_submit_chunk, chunk))
+            if len(pending) > workers * 2:
+                batch.extend(pending.popleft().result())
+        while pending:
+            batch.extend(pending.popleft().result())
+    return batch
+
+
+def _initialize_worker(form_class, fail_fast):
+    global _form_class, _fail_fast
+    _form_class = form_class
+    _fail_fast = fail_fast
+    form_class._get_schema()
+
+
+def _submit_chunk(records):
+    return _form_class.submit_many(records, _fail_fast)
+
+
+def _chunks(records, size):
+    records = iter(records)
+    chunk = list(islice(records, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(records, size))
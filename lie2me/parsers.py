@@ -2,10 +2,38 @@ from datetime import datetime, date, time, timedelta, timezone
 import re
 
 
+DATETIME_PATTERN = re.compile(r'^([0-9]{4}-[0-9]{2}-[0-9]{2})( |T)([^ ]+)$')
+
+TIME_PATTERN = re.compile(''.join([
+    r'^([0-2][0-9])', # h
+    r'(:([0-5][0-9]))?', # m
+    r'(:([0-5][0-9]))?', # s
+    r'(\.([0-9]{1,3}))?', # ms
+    r'(Z|[+-][0-9:]+)?$', # tz
+]))
+
+TIMEZONE_PATTERN = re.compile(r'^(Z)|([+-])([0-2][0-9])(:?([0-5][0-9]))?$')
+
+DIGITS = frozenset('0123456789')
+
+_timezones = {}
+
+
 def parse_datetime(string):
     string = str(string).strip()
-    pattern = r'^([0-9]{4}-[0-9]{2}-[0-9]{2})( |T)([^ ]+)$'
-    match = re.match(pattern, string)
+    if len(string) >= 19 and string[10] in 'T ':
+        clock = _parse_canonical_time(string, 11)
+        if clock is not None:
+            if clock is False or string[4] != '-' or string[7] != '-':
+                return None
+            y, m, d = string[:4], string[5:7], string[8:10]
+            if not _digits(y + m + d):
+                return None
+            try:
+                return datetime(int(y), int(m), int(d), *clock)
+            except ValueError:
+                return None
+    match = DATETIME_PATTERN.match(string)
     if match is None:
         return None
     d, _, t = match.groups()
@@ -18,27 +46,29 @@ def parse_datetime(string):
 
 def parse_date(string):
     string = str(string).strip()
-    pattern = r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$'
-    match = re.match(pattern, string)
-    if match is None:
+    if len(string) != 10 or string[4] != '-' or string[7] != '-':
+        return None
+    y, m, d = string[:4], string[5:7], string[8:]
+    if not _digits(y + m + d):
         return None
-    y, m, d = map(int, match.groups())
     try:
-        return date(y, m, d)
-    except:
+        return date(int(y), int(m), int(d))
+    except ValueError:
         return None
 
 
 def parse_time(string):
     string = str(string).strip()
-    pattern = ''.join([
-        r'^([0-2][0-9])', # h
-        r'(:([0-5][0-9]))?', # m
-        r'(:([0-5][0-9]))?', # s
-        r'(\.([0-9]{1,3}))?', # ms
-        r'(Z|[+-][0-9:]+)?$', # tz
-    ])
-    match = re.match(pattern, string)
+    if len(string) >= 8:
+        clock = _parse_canonical_time(string, 0)
+        if clock is not None:
+            if clock is False:
+                return None
+            try:
+                return time(*clock)
+            except ValueError:
+                return None
+    match = TIME_PATTERN.match(string)
     if match is None:
         return None
     h, _, m, _, s, _, ms, z = match.groups()
@@ -51,17 +81,22 @@ def parse_time(string):
     except ValueError:
         return None
     if z is not None:
-        tz = parse_timezone(z)
+        tz = _parse_offset(z)
         if tz is None:
             return None
-        tm = tm.replace(tzinfo=timezone(tz))
+        tm = tm.replace(tzinfo=_timezone(tz))
     return tm
 
 
 def parse_timezone(string):
-    string = str(string).strip()
-    pattern = r'^(Z)|([+-])([0-2][0-9])(:?([0-5][0-9]))?$'
-    match = re.match(pattern, string)
+    minutes = _parse_offset(str(string).strip())
+    if minutes is None:
+        return None
+    return timedelta(minutes=minutes)
+
+
+def _parse_offset(string):
+    match = TIMEZONE_PATTERN.match(string)
     if match is None:
         return None
     z, signal, h, _, m = match.groups()
@@ -71,4 +106,49 @@ def parse_timezone(string):
         return None
     if abs((h * 60) + m) > (24 * 60) - 1:
         return None
-    return timedelta(hours=h, minutes=m)
+    return (h * 60) + m
+
+
+def _parse_canonical_time(string, start):
+    # HH:MM:SS(.fff)(Z|+HH:MM), returns the time arguments, None when the layout
+    # does not match or False when the offset is out of range.
+    end = start + 8
+    if string[start + 2] != ':' or string[start + 5] != ':':
+        return None
+    h, m, s = string[start:start + 2], string[start + 3:start + 5], string[start + 6:end]
+    if not _digits(h + m + s):
+        return None
+    mcs = 0
+    if string[end:end + 1] == '.':
+        i = end + 1
+        while i < end + 4 and string[i:i + 1] in DIGITS:
+            i += 1
+        if i == end + 1:
+            return None
+        mcs = int(string[end + 1:i]) * 1000
+        end = i
+    tz = string[end:]
+    if not tz:
+        tzinfo = None
+    elif tz == 'Z':
+        tzinfo = _timezone(0)
+    elif len(tz) == 6 and tz[0] in '+-' and tz[3] == ':' and _digits(tz[1:3] + tz[4:]):
+        hours, minutes = int(tz[1:3]), int(tz[4:])
+        offset = (hours * 60) + minutes
+        if minutes > 59 or offset > (24 * 60) - 1 or (offset == 0 and tz[0] == '-'):
+            return False
+        tzinfo = _timezone(-offset if tz[0] == '-' else offset)
+    else:
+        return None
+    return int(h), int(m), int(s), mcs, tzinfo
+
+
+def _digits(string):
+    return string.isdigit() and string.isascii()
+
+
+def _timezone(minutes):
+    tz = _timezones.get(minutes)
+    if tz is None:
+        tz = _timezones[minutes] = timezone(timedelta(minutes=minutes))
+    return tz
@@ -0,0 +1,16 @@
+import re
+from functools import lru_cache
+
+
+FLAGS = re.MULTILINE | re.DOTALL
+
+
+def compile_pattern(pattern, flags=FLAGS):
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return _compile(pattern, flags)
+
+
+@lru_cache(maxsize=512)
+def _compile(pattern, flags):
+    return re.compile(pattern, flags)
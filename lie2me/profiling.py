@@ -0,0 +1,76 @@
+from collections import defaultdict, namedtuple
+from math import ceil
+from time import perf_counter
+
+
+Timing = namedtuple('Timing', ['form', 'path', 'kind', 'type', 'duration', 'valid'])
+Summary = namedtuple('Summary', ['count', 'total', 'p50', 'p99'])
+
+hook = None
+
+
+def install(new_hook):
+    global hook
+    hook = new_hook
+
+
+def uninstall():
+    global hook
+    hook = None
+
+
+def submit_fields(form, fail_fast=False, fields=None):
+    for key, field in (form.fields if fields is None else fields).items():
+        start = perf_counter()
+        value, error = field._submit(form.data.get(key), fail_fast)
+        _report(form, key, 'field', type(field), start, not error)
+        yield value, error
+
+
+def submit_form(form, key, nested, options):
+    nested._path = form._path + (key,)
+    start = perf_counter()
+    nested.submit(**options)
+    _report(form, key, 'form', type(nested), start, nested.valid)
+
+
+def validate(form, data):
+    start = perf_counter()
+    data = form.validate(data)
+    _report(form, 'validate', 'validate', type(form), start, not form._errors)
+    return data
+
+
+def _report(form, key, kind, cls, start, valid):
+    duration = perf_counter() - start
+    current = hook
+    if current is not None:
+        current(Timing(type(form), form._path + (key,), kind, cls, duration, valid))
+
+
+class Profiler(object):
+
+    def __init__(self):
+        self.durations = defaultdict(list)
+
+    def __call__(self, timing):
+        self.durations[timing.form, timing.path[-1]].append(timing.duration)
+
+    def stats(self, form_class):
+        stats = {}
+        for (form, name), durations in self.durations.items():
+            if form is form_class:
+                stats[name] = _summarize(durations)
+        return stats
+
+    def reset(self):
+        self.durations.clear()
+
+
+def _summarize(durations):
+    durations = sorted(durations)
+    return Summary(len(durations), sum(durations), _percentile(durations, 0.5), _percentile(durations, 0.99))
+
+
+def _percentile(durations, rank):
+    return durations[max(ceil(rank * len(durations)) - 1, 0)]
@@ -0,0 +1,64 @@
+import csv
+import json
+
+from .messages import render
+
+
+def validate_jsonl(fp, form_class, valid=None, invalid=None, fail_fast=False):
+    return _validate(_jsonl_records(fp), form_class, valid, invalid, fail_fast)
+
+
+def validate_csv(fp, form_class, valid=None, invalid=None, fail_fast=False, **options):
+    return _validate(_csv_records(fp, options), form_class, valid, invalid, fail_fast)
+
+
+def _jsonl_records(fp):
+    for line_number, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError:
+            yield line_number, line, {'record': 'Invalid JSON.'}
+
+
+def _csv_records(fp, options):
+    lines = _Lines(fp)
+    reader = csv.DictReader(lines, **options)
+    reader.fieldnames
+    lines.start = None
+    for record in reader:
+        yield lines.start, record, None
+        lines.start = None
+
+
+class _Lines(object):
+
+    def __init__(self, fp):
+        self.fp = iter(fp)
+        self.line_number = 0
+        self.start = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self.fp)
+        self.line_number += 1
+        if self.start is None and line.strip('\r\n'):
+            self.start = self.line_number
+        return line
+
+
+def _validate(records, form_class, valid, invalid, fail_fast):
+    form = form_class()
+    for line_number, record, errors in records:
+        if errors is None:
+            accepted, data, errors = form._submit_record(record, fail_fast)
+            errors = render(errors) or {}
+            if accepted:
+                record = data
+        sink = invalid if errors else valid
+        if sink is not None:
+            sink(line_number, record, errors)
+        yield line_number, record, errors
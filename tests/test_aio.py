@@ -0,0 +1,157 @@
+import asyncio
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.aio import lookup
+
+
+def run(form, **kwargs):
+    asyncio.run(form.asubmit(**kwargs))
+    return form
+
+
+class Tracker(object):
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    async def check(self, value):
+        self.calls.append(value)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return value not in ('taken', 404)
+
+
+tracker = Tracker()
+
+
+class Username(fields.Text):
+
+    async def validate(self, value):
+        value = super().validate(value)
+        if not await tracker.check(value):
+            raise self.error('Already taken.')
+        return value
+
+
+class CategoryId(fields.Integer):
+
+    async def validate(self, value):
+        value = super().validate(value)
+        if not await lookup(('category', value), tracker.check, value):
+            raise self.error('Unknown category.')
+        return value
+
+
+class AccountForm(Form):
+
+    username = Username()
+    nickname = Username(required=False)
+    age = fields.Integer(min=18)
+
+
+class PostForm(Form):
+
+    title = fields.Text()
+    categories = fields.List(CategoryId())
+    author = AccountForm
+
+    async def validate(self, data):
+        if 'title' in data and not await tracker.check(data['title']):
+            self.error('title', 'Duplicated title.')
+        return data
+
+
+class AsyncSubmitTestCase(TestCase):
+
+    def setUp(self):
+        global tracker
+        tracker = Tracker()
+
+    def test_sync_forms_can_be_submitted_asynchronously(self):
+        data = {'name': 'John', 'email': 'john@domain', 'address': {'number': -1}}
+        form = ProfileForm(data)
+        form.submit()
+        async_form = run(ProfileForm(data))
+        self.assertEqual(async_form.valid, form.valid)
+        self.assertEqual(async_form.errors, form.errors)
+
+    def test_async_field_validation(self):
+        form = run(AccountForm({'username': 'john', 'age': 20}))
+        self.assertEqual(form.valid, True)
+        self.assertEqual(form.data, {'username': 'john', 'nickname': None, 'age': 20})
+        form = run(AccountForm({'username': 'taken', 'age': 17}))
+        self.assertEqual(form.errors, {'username': 'Already taken.', 'age': 'Must not be lower than 18.'})
+
+    def test_sync_submit_is_not_affected(self):
+        form = ProfileForm({'name': 'John', 'email': 'john@domain.com', 'address': {'street': 'A', 'number': 1}})
+        form.submit()
+        self.assertEqual(form.valid, True)
+
+    def test_async_form_validation_and_nested_forms(self):
+        form = run(PostForm({
+            'title': 'taken',
+            'categories': [1, 404],
+            'author': {'username': 'taken', 'age': 20},
+        }))
+        self.assertEqual(form.errors, {
+            'categories': {1: 'Unknown category.'},
+            'author': {'username': 'Already taken.'},
+            'title': 'Duplicated title.',
+        })
+
+    def test_independent_checks_run_concurrently(self):
+        run(PostForm({
+            'title': 'Hello',
+            'categories': [1, 2, 3],
+            'author': {'username': 'john', 'nickname': 'johnny', 'age': 20},
+        }))
+        self.assertEqual(tracker.peak, 5)
+
+    def test_concurrency_can_be_limited(self):
+        form = run(PostForm({
+            'title': 'Hello',
+            'categories': [1, 2, 3],
+            'author': {'username': 'john', 'nickname': 'johnny', 'age': 20},
+        }), concurrency=2)
+        self.assertEqual(form.valid, True)
+        self.assertEqual(tracker.peak, 2)
+
+    def test_identical_lookups_are_coalesced_within_one_submit(self):
+        form = run(PostForm({'title': 'Hello', 'categories': [1, 2, 1, 1, 404, 404], 'author': {}}))
+        self.assertEqual(form.errors['categories'], {4: 'Unknown category.', 5: 'Unknown category.'})
+        self.assertEqual(sorted(tracker.calls, key=str), [1, 2, 404, 'Hello'])
+
+    def test_lookups_are_not_shared_between_submits(self):
+        run(PostForm({'title': 'Hello', 'categories': [1], 'author': {}}))
+        run(PostForm({'title': 'Hello', 'categories': [1], 'author': {}}))
+        self.assertEqual(tracker.calls.count(1), 2)
+
+    def test_async_fields_inside_dicts(self):
+        field = fields.Dict({'username': Username(), 'age': fields.Integer()})
+        data, errors = asyncio.run(field.asubmit({'username': 'taken', 'age': 'x'}))
+        self.assertEqual(errors, {'username': 'Already taken.', 'age': 'Invalid number.'})
+        data, errors = asyncio.run(field.asubmit({'username': 'john', 'age': '1'}))
+        self.assertEqual((data, errors), ({'username': 'john', 'age': 1}, {}))
+
+    def test_list_errors_are_kept_on_async_submit(self):
+        field = fields.List(CategoryId(), max=2)
+        data, errors = asyncio.run(field.asubmit([1, 2, 3]))
+        self.assertEqual(errors, {'list': 'Must have no more than 2 items.'})
+
+
+class AddressForm(Form):
+
+    street = fields.Text(max=200)
+    number = fields.Integer(min=0)
+
+
+class ProfileForm(Form):
+
+    name = fields.Text(max=200)
+    email = fields.Email()
+    address = AddressForm
@@ -0,0 +1,114 @@
+from datetime import date
+from threading import Thread
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.cache import CacheInfo
+
+
+class CacheTestCase(TestCase):
+
+    def test_cache_is_disabled_by_default(self):
+        field = fields.Text()
+        field.submit('foo')
+        field.submit('foo')
+        self.assertEqual(field.cache_info(), CacheInfo(0, 0, None, 0))
+
+    def test_repeated_values_are_served_from_cache(self):
+        field = fields.Text(options=['red', 'green'], cache=10)
+        self.assertEqual(field.submit(' red '), ('red', None))
+        self.assertEqual(field.submit(' red '), ('red', None))
+        self.assertEqual(field.submit('blue'), ('blue', 'Invalid option.'))
+        self.assertEqual(field.submit('blue'), ('blue', 'Invalid option.'))
+        self.assertEqual(field.cache_info(), CacheInfo(2, 2, 10, 2))
+
+    def test_least_recently_used_values_are_evicted(self):
+        field = fields.Date(cache=2)
+        field.submit('2017-01-01')
+        field.submit('2017-01-02')
+        field.submit('2017-01-01')
+        field.submit('2017-01-03')
+        self.assertEqual(field.cache_info(), CacheInfo(1, 3, 2, 2))
+        field.submit('2017-01-01')
+        field.submit('2017-01-02')
+        self.assertEqual(field.cache_info(), CacheInfo(2, 4, 2, 2))
+
+    def test_cached_errors_are_not_shared_between_results(self):
+        field = fields.List(fields.Integer(), cache=10)
+        value, errors = field.submit('x')
+        errors['extra'] = 'Changed.'
+        self.assertEqual(field.submit('x'), ('x', {'list': 'Invalid list.'}))
+        value, errors = field.submit('x')
+        errors.clear()
+        self.assertEqual(field.submit('x'), ('x', {'list': 'Invalid list.'}))
+
+    def test_cache_can_be_used_from_many_threads(self):
+        field = fields.Integer(cache=4)
+        failures = []
+        def submit():
+            try:
+                for i in range(2000):
+                    assert field.submit(str(i % 8)) == (i % 8, None)
+            except Exception as e:
+                failures.append(e)
+        threads = [Thread(target=submit) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertEqual(sum(field.cache_info()[:2]), 8000)
+
+    def test_equal_values_of_different_types_are_cached_separately(self):
+        field = fields.Text(cache=10)
+        self.assertEqual(field.submit(1), ('1', None))
+        self.assertEqual(field.submit(True), ('True', None))
+        self.assertEqual(field.submit('1'), ('1', None))
+        self.assertEqual(field.cache_info().misses, 3)
+
+    def test_mutable_and_uncacheable_values_bypass_cache(self):
+        field = fields.Text(cache=10)
+        field.submit(['a'])
+        field.submit(1.0)
+        field.submit(-0.0)
+        field.submit(None)
+        field.submit(date(2017, 1, 1))
+        self.assertEqual(field.cache_info(), CacheInfo(0, 0, 10, 0))
+        self.assertEqual(field.submit(-0.0), ('-0.0', None))
+
+    def test_boolean_values_are_cached(self):
+        field = fields.Boolean(cache=10)
+        self.assertEqual(field.submit('yes'), (True, None))
+        self.assertEqual(field.submit('yes'), (True, None))
+        self.assertEqual(field.submit(1), (True, None))
+        self.assertEqual(field.submit('maybe'), ('maybe', 'Invalid boolean.'))
+        self.assertEqual(field.cache_info(), CacheInfo(1, 3, 10, 3))
+
+    def test_cache_clear_discards_results(self):
+        field = fields.Email(cache=10)
+        field.submit('john.doe@domain.com')
+        field.cache_clear()
+        self.assertEqual(field.cache_info(), CacheInfo(0, 0, 10, 0))
+        field.submit('john.doe@domain.com')
+        self.assertEqual(field.cache_info(), CacheInfo(0, 1, 10, 1))
+
+    def test_changing_cache_size_starts_a_new_cache(self):
+        field = fields.Time(cache=10)
+        field.submit('10:00')
+        field.cache = 5
+        self.assertEqual(field.cache_info(), CacheInfo(0, 0, 5, 0))
+
+    def test_cached_fields_work_inside_forms(self):
+        class EventForm(Form):
+            category = fields.Text(options=['a', 'b'], cache=10)
+            when = fields.DateTime(cache=10)
+        batch = EventForm.submit_many([
+            {'category': 'a', 'when': '2017-01-01 10:00'},
+            {'category': 'c', 'when': '2017-01-01 10:00'},
+            {'category': 'a', 'when': 'never'},
+            {'category': 'c', 'when': 'never'},
+        ])
+        self.assertEqual(batch.valid, [True, False, False, False])
+        self.assertEqual(batch.errors[3], {'category': 'Invalid option.', 'when': 'Invalid date or time.'})
+        self.assertEqual(EventForm.category.cache_info(), CacheInfo(2, 2, 10, 2))
+        self.assertEqual(EventForm.when.cache_info(), CacheInfo(2, 2, 10, 2))
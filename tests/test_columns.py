@@ -0,0 +1,109 @@
+from decimal import Decimal as D
+from unittest import TestCase, skipIf
+
+from lie2me import Field, fields
+from lie2me.columns import numpy, submit_column
+
+
+class ColumnTestCase(TestCase):
+
+    def assertSameAsScalar(self, field, values):
+        column = field.submit_column(values)
+        valid, data, errors = [], [], {}
+        for i, value in enumerate(values):
+            value, error = field.submit(value)
+            valid.append(not error)
+            data.append(value)
+            if error:
+                errors[i] = error
+        self.assertEqual(column.valid, valid)
+        self.assertEqual(repr(column.data), repr(data))
+        self.assertEqual(column.errors, errors)
+
+    def test_any_field_can_submit_a_column(self):
+        column = Field().submit_column(['foo', None, 42])
+        self.assertEqual(len(column), 3)
+        self.assertEqual(column.valid, [True, False, True])
+        self.assertEqual(column.data, ['foo', None, 42])
+        self.assertEqual(column.errors, {1: 'This is required.'})
+
+    def test_column_accepts_any_iterable(self):
+        column = fields.Integer().submit_column(str(i) for i in range(3))
+        self.assertEqual(column.data, [0, 1, 2])
+
+    def test_pure_python_column_matches_scalar_submit(self):
+        field = fields.Integer(min=0, max=10)
+        column = submit_column(field, [1, '5', -1, 11, None, 'x'])
+        self.assertEqual(column.valid, [True, True, False, False, False, False])
+        self.assertEqual(column.data, [1, 5, -1, 11, None, 'x'])
+        self.assertEqual(column.errors, {
+            2: 'Must not be lower than 0.',
+            3: 'Must not be higher than 10.',
+            4: 'This is required.',
+            5: 'Invalid number.',
+        })
+
+    def test_integer_columns(self):
+        self.assertSameAsScalar(fields.Integer(min=0, max=10), [1, 5, -1, 11, None, 3.7, float('nan'), True])
+        self.assertSameAsScalar(fields.Integer(required=False), [None, 2])
+        self.assertSameAsScalar(fields.Integer(default=3), [None, 1])
+        self.assertSameAsScalar(fields.Integer(default=3, max=2), [None, 1])
+        self.assertSameAsScalar(fields.Integer(), ['1', ' 2', 'x', ''])
+        self.assertSameAsScalar(fields.Integer(), [2 ** 70, 1.5])
+
+    def test_float_columns(self):
+        self.assertSameAsScalar(fields.Float(min=0.5, max=2), [0.1, 1, None, 2.5, float('nan'), float('inf')])
+        self.assertSameAsScalar(fields.Float(), ['1.5', 'x'])
+
+    def test_decimal_columns(self):
+        self.assertSameAsScalar(fields.Decimal(min=2.9, max=15.5), [2.8, 2.9, '15.5', 15.51, None])
+
+    def test_boolean_columns(self):
+        self.assertSameAsScalar(fields.Boolean(), ['yes', ' No ', 'x', None, '  ', 'TRUE', 'Off'])
+        self.assertSameAsScalar(fields.Boolean(), [True, False, None])
+        self.assertSameAsScalar(fields.Boolean(), [1, 0, 2, 1.0])
+        self.assertSameAsScalar(fields.Boolean(default='no'), [None, 'on'])
+        self.assertSameAsScalar(fields.Boolean(required=False), [None, 'off', 1])
+
+    def test_custom_fields_keep_their_validation(self):
+        class Even(fields.Integer):
+            def validate(self, value):
+                value = super().validate(value)
+                if value % 2:
+                    raise self.error('Must be even.')
+                return value
+        column = Even().submit_column([1, 2])
+        self.assertEqual(column.errors, {0: 'Must be even.'})
+
+    def test_custom_messages_are_used(self):
+        field = fields.Integer(max=5, messages={'max': 'No more than {max} stars.'})
+        self.assertEqual(field.submit_column([6]).errors, {0: 'No more than 5 stars.'})
+
+
+@skipIf(numpy is None, 'numpy is not installed')
+class NumpyColumnTestCase(ColumnTestCase):
+
+    def test_integer_arrays(self):
+        self.assertSameAsScalar(fields.Integer(min=0), numpy.array([1.5, numpy.inf, -2.5]))
+        self.assertSameAsScalar(fields.Integer(max=3), numpy.arange(6, dtype=numpy.uint8))
+        self.assertSameAsScalar(fields.Integer(), numpy.array([True, False]))
+
+    def test_float_arrays(self):
+        self.assertSameAsScalar(fields.Float(min=2), numpy.arange(5, dtype=numpy.int32))
+        self.assertSameAsScalar(fields.Float(max=0.5), numpy.array([0.1, 0.5, 0.7], dtype=numpy.float32))
+
+    def test_decimal_arrays(self):
+        self.assertSameAsScalar(fields.Decimal(min=2.9, max=15.5), numpy.array([2.8, 2.9, 15.5, 15.51, numpy.inf]))
+        self.assertSameAsScalar(fields.Decimal(min=1), numpy.array([0, 1, 2]))
+        self.assertSameAsScalar(fields.Decimal(), numpy.array([numpy.nan, 2]))
+        self.assertIsInstance(fields.Decimal().submit_column(numpy.array([0.1])).data[0], D)
+
+    def test_boolean_arrays(self):
+        self.assertSameAsScalar(fields.Boolean(), numpy.array(['yes', ' no ', 'maybe', '']))
+        self.assertSameAsScalar(fields.Boolean(), numpy.array([1, 0, 3]))
+        self.assertSameAsScalar(fields.Boolean(), numpy.array([1.0, 0.0]))
+        self.assertSameAsScalar(fields.Boolean(), numpy.array([True, False]))
+
+    def test_numeric_columns_return_python_values(self):
+        column = fields.Integer().submit_column(numpy.array([1, 2]))
+        self.assertEqual([type(value) for value in column.data], [int, int])
@@ -0,0 +1,203 @@
+from datetime import date
+from unittest import TestCase
+
+from lie2me import Form, fields, compile_form
+from lie2me.exceptions import BadValidation
+
+
+class CompiledFormTestCase(TestCase):
+
+    def assertSameResult(self, form_class, data):
+        form = form_class(data)
+        form.submit()
+        self.assertEqual(compile_form(form_class)(data), (form.valid, form.data, form.errors))
+
+    def test_compiled_form_returns_valid_data_and_errors(self):
+        validate = compile_form(AddressForm)
+        self.assertEqual(validate({'street': '  Nowhere  ', 'number': '42'}), (True, {
+            'street': 'Nowhere',
+            'number': 42,
+            'complement': None,
+        }, {}))
+
+    def test_compiled_form_returns_original_data_on_errors(self):
+        data = {'street': 'Nowhere', 'number': -1}
+        valid, new_data, errors = compile_form(AddressForm)(data)
+        self.assertEqual(valid, False)
+        self.assertIs(new_data, data)
+        self.assertEqual(errors, {'number': 'Must not be lower than 0.'})
+
+    def test_compiled_form_against_missing_and_weird_data(self):
+        for data in [None, {}, 42, [], [1, 2, 3], {1, 2, 3}, object()]:
+            self.assertSameResult(OrderForm, data)
+
+    def test_compiled_form_against_valid_data(self):
+        self.assertSameResult(OrderForm, VALID_ORDER)
+
+    def test_compiled_form_against_invalid_data(self):
+        for data in INVALID_ORDERS:
+            self.assertSameResult(OrderForm, data)
+
+    def test_compiled_form_keeps_error_order(self):
+        form = OrderForm(INVALID_ORDERS[0])
+        form.submit()
+        valid, data, errors = compile_form(OrderForm)(INVALID_ORDERS[0])
+        self.assertEqual(list(errors), list(form.errors))
+
+    def test_compiled_form_runs_form_validation(self):
+        data = dict(VALID_ORDER, code='ZZZ')
+        valid, new_data, errors = compile_form(OrderForm)(data)
+        self.assertEqual(errors, {'code': 'Unknown code.'})
+        self.assertSameResult(OrderForm, data)
+
+    def test_compiled_form_raises_when_form_validation_returns_nothing(self):
+        class BadValidationForm(Form):
+            name = fields.Text(required=False)
+            def validate(self, data):
+                pass
+        with self.assertRaises(BadValidation) as context:
+            compile_form(BadValidationForm)({})
+        self.assertEqual(str(context.exception), 'Form validation did not return any data.')
+
+    def test_custom_fields_are_submitted_normally(self):
+        class Upper(fields.Text):
+            def validate(self, value):
+                return super().validate(value).upper()
+        class CustomForm(Form):
+            name = Upper()
+            numbers = fields.List(Upper())
+        self.assertEqual(compile_form(CustomForm)({'name': 'foo', 'numbers': ['a']}), (True, {
+            'name': 'FOO',
+            'numbers': ['A'],
+        }, {}))
+        self.assertSameResult(CustomForm, {'numbers': ['a', None]})
+
+    def test_forms_with_custom_submit_are_submitted_normally(self):
+        class CustomSubmitForm(AddressForm):
+            def submit(self):
+                super().submit()
+                self.data = 'submitted'
+        self.assertEqual(compile_form(CustomSubmitForm)({'street': 'a', 'number': 1}), (True, 'submitted', {}))
+
+    def test_field_messages_and_defaults_are_respected(self):
+        class MessagesForm(Form):
+            stars = fields.Integer(max=5, messages={'max': 'No more than {max} stars.'})
+            active = fields.Boolean(default='yes')
+            tags = fields.List(fields.Integer(), default=[1, 2])
+        self.assertEqual(compile_form(MessagesForm)({'stars': 6}), (False, {'stars': 6}, {
+            'stars': 'No more than 5 stars.',
+        }))
+        self.assertSameResult(MessagesForm, {'stars': 3})
+
+    def test_normalized_options_are_matched(self):
+        class CountryForm(Form):
+            country = fields.Text(options=['BR', 'US'], normalize=str.upper)
+        self.assertEqual(compile_form(CountryForm)({'country': ' br '}), (True, {'country': 'BR'}, {}))
+        self.assertSameResult(CountryForm, {'country': 'ar'})
+
+    def test_pattern_max_length_is_respected(self):
+        class CodeForm(Form):
+            code = fields.Text(pattern=r'^[A-Z]+$', pattern_max_length=3)
+        for code in ['ABC', 'ABCD', 'abc']:
+            self.assertSameResult(CodeForm, {'code': code})
+
+    def test_typed_values_are_accepted(self):
+        typed = {'code': 'ABC', 'quantity': 7, 'price': 9.9, 'gift': True, 'category': 'bug', 'notes': 'a\u2028b'}
+        self.assertSameResult(OrderForm, typed)
+        self.assertSameResult(OrderForm, dict(typed, quantity=7.5, price=0, gift=0))
+        self.assertSameResult(OrderForm, dict(typed, code='A\u2028B', gift=2))
+        self.assertSameResult(CustomerForm, {'name': 'John', 'email': 'john@domain.com', 'birthday': date(1980, 1, 1)})
+        self.assertSameResult(CustomerForm, {'name': 'John', 'email': 'john@domain.com', 'birthday': date(1800, 1, 1)})
+
+    def test_size_guards_are_respected(self):
+        class GuardedForm(Form):
+            max_keys = 2
+            code = fields.Text(max_length=5)
+            quantity = fields.Integer(max_digits=3)
+        for data in [{'code': 'ABC', 'quantity': '12'}, {'code': 'ABCDEF', 'quantity': '1234'}, {'a': 1, 'b': 2, 'c': 3}]:
+            self.assertSameResult(GuardedForm, data)
+
+    def test_compiled_source_is_available(self):
+        self.assertIn('def ', compile_form(AddressForm).source)
+
+
+class AddressForm(Form):
+
+    street = fields.Text(max=200)
+    number = fields.Integer(min=0)
+    complement = fields.Text(required=False)
+
+
+class CustomerForm(Form):
+
+    name = fields.Text(max=20, pattern=r'^[A-Za-z ]+$')
+    email = fields.Email()
+    birthday = fields.Date(min='1900-01-01', max='2017-12-31', required=False)
+    address = AddressForm
+
+
+class OrderForm(Form):
+
+    code = fields.Text(min=3, max=3)
+    quantity = fields.Integer(min=1, max=100)
+    price = fields.Float(min=0)
+    gift = fields.Boolean(default=False)
+    category = fields.Text(options=['feature', 'improvement', 'bug'])
+    notes = fields.Text(multiline=True, required=False)
+    delivery = fields.Date(format='%d/%m/%Y', required=False)
+    weight = fields.Decimal(required=False)
+    tags = fields.List(fields.Text(max=5), min=1, max=3, required=False)
+    matrix = fields.List(fields.List(fields.Integer()), required=False)
+    extra = fields.Dict({'color': fields.Text(), 'size': fields.Integer(required=False)}, required=False)
+    customer = CustomerForm
+
+    def validate(self, data):
+        if data.get('code') == 'ZZZ':
+            self.error('code', 'Unknown code.')
+        return data
+
+
+VALID_ORDER = {
+    'code': 'ABC',
+    'quantity': '3',
+    'price': '9.90',
+    'gift': 'no',
+    'category': 'bug',
+    'notes': 'first line\nsecond line',
+    'delivery': '20/09/2017',
+    'weight': '1.5',
+    'tags': ['a', 'b'],
+    'matrix': [[1, 2], ['3']],
+    'extra': {'color': 'red', 'ignored': True},
+    'customer': {
+        'name': 'John Doe',
+        'email': 'john.doe@domain.com',
+        'birthday': '1990-01-01',
+        'address': {'street': 'Nowhere Street', 'number': 42},
+    },
+}
+
+INVALID_ORDERS = [
+    {
+        'code': 'ABCD',
+        'quantity': 'many',
+        'price': -1,
+        'gift': 'maybe',
+        'category': 'question',
+        'notes': '   ',
+        'delivery': '2017-09-20',
+        'weight': 'heavy',
+        'tags': ['a', 'toolong', None],
+        'matrix': [[1, 'x'], 'y'],
+        'extra': {'size': 'big'},
+        'customer': {
+            'name': 'John 2',
+            'email': 'john.doe@domain',
+            'birthday': date(2018, 1, 1).isoformat(),
+            'address': {'street': 'a' * 201, 'number': -1},
+        },
+    },
+    {'code': 'AB', 'quantity': 0, 'tags': [], 'matrix': (), 'extra': {}, 'customer': None},
+    {'quantity': 101, 'tags': ['a', 'b', 'c', 'd'], 'matrix': {}, 'extra': {'color': '  '}, 'customer': []},
+    {'code': 'ABC', 'tags': 'abc', 'customer': {'birthday': '1899-12-31', 'name': 'a\nb'}},
+]
@@ -0,0 +1,86 @@
+import json
+import tracemalloc
+from json import JSONDecodeError
+from unittest import TestCase
+
+from lie2me.decoder import JSONReader, TooDeep, exceeds_depth
+
+
+class JSONReaderTestCase(TestCase):
+
+    def test_members_are_read_one_at_a_time(self):
+        reader = JSONReader('{"a": 1, "b": [2, 3], "c": {"d": null}}')
+        values = {key: reader.read() for key in reader.members()}
+        self.assertEqual(values, {'a': 1, 'b': [2, 3], 'c': {'d': None}})
+        reader.close()
+
+    def test_elements_are_read_one_at_a_time(self):
+        reader = JSONReader(' [ "a" , 1.5 , true ] ')
+        self.assertEqual([reader.read() for i in reader.elements()], ['a', 1.5, True])
+        reader.close()
+
+    def test_empty_containers(self):
+        reader = JSONReader('{"a": {}, "b": []}')
+        keys = []
+        for key in reader.members():
+            keys.append(key)
+            reader.skip()
+        self.assertEqual(keys, ['a', 'b'])
+
+    def test_skipped_values_are_not_returned(self):
+        reader = JSONReader('{"a": [{"b": [1, {"c": 2}]}, "x"], "d": 3}')
+        values = {}
+        for key in reader.members():
+            if key == 'a':
+                reader.skip()
+            else:
+                values[key] = reader.read()
+        self.assertEqual(values, {'d': 3})
+
+    def test_nested_values_are_skipped_without_being_built(self):
+        body = json.dumps({'junk': {'inner': [{'id': i, 'tags': ['x'] * 5} for i in range(20000)]}, 'a': 1})
+        reader = JSONReader(body)
+        tracemalloc.start()
+        try:
+            for key in reader.members():
+                reader.skip()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 100000)
+
+    def test_bytes_are_decoded(self):
+        reader = JSONReader('{"name": "João"}'.encode('utf-16'))
+        self.assertEqual(reader.read(), {'name': 'João'})
+
+    def test_malformed_input_raises_like_json_module(self):
+        for body in ['{"a": 1,}', '{"a" 1}', '[1 2]', '[1,]', '']:
+            reader = JSONReader(body)
+            with self.assertRaises(JSONDecodeError):
+                reader.skip()
+        reader = JSONReader('{} x')
+        reader.skip()
+        with self.assertRaises(JSONDecodeError) as context:
+            reader.close()
+        self.assertEqual(context.exception.msg, 'Extra data')
+
+    def test_max_depth_is_enforced_while_reading(self):
+        reader = JSONReader('{"a": [[1]]}', max_depth=2)
+        with self.assertRaises(TooDeep):
+            reader.skip()
+        reader = JSONReader('{"a": [[1]]}', max_depth=3)
+        reader.skip()
+
+    def test_max_depth_is_enforced_on_read_values(self):
+        reader = JSONReader('{"a": [[1]]}', max_depth=2)
+        with self.assertRaises(TooDeep):
+            for key in reader.members():
+                reader.read()
+
+
+class ExceedsDepthTestCase(TestCase):
+
+    def test_depth_counts_containers(self):
+        self.assertFalse(exceeds_depth({'a': [1]}, 2))
+        self.assertTrue(exceeds_depth({'a': [{}]}, 2))
+        self.assertFalse(exceeds_depth([], 1))
@@ -0,0 +1,115 @@
+from io import StringIO
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.parallel import submit_parallel
+from lie2me.stream import validate_jsonl
+
+
+class Counted(fields.Integer):
+
+    calls = 0
+
+    def validate(self, value):
+        Counted.calls += 1
+        return super().validate(value)
+
+
+class FailFastFieldTestCase(TestCase):
+
+    def setUp(self):
+        Counted.calls = 0
+
+    def test_list_stops_at_first_invalid_item(self):
+        field = fields.List(Counted())
+        data, errors = field.submit([1, 'a', 'b', 3], fail_fast=True)
+        self.assertEqual(errors, {1: 'Invalid number.'})
+        self.assertEqual(Counted.calls, 2)
+
+    def test_list_without_fail_fast_reports_all_items(self):
+        field = fields.List(Counted())
+        data, errors = field.submit([1, 'a', 'b', 3])
+        self.assertEqual(errors, {1: 'Invalid number.', 2: 'Invalid number.'})
+        self.assertEqual(Counted.calls, 4)
+
+    def test_dict_stops_at_first_invalid_entry(self):
+        field = fields.Dict({'a': Counted(), 'b': Counted(), 'c': Counted()})
+        data, errors = field.submit({'a': 'x', 'b': 'y', 'c': 1}, fail_fast=True)
+        self.assertEqual(errors, {'a': 'Invalid number.'})
+        self.assertEqual(Counted.calls, 1)
+
+    def test_nested_containers_stop_at_first_error(self):
+        field = fields.List(fields.Dict({'a': Counted(), 'b': Counted()}))
+        data, errors = field.submit([{'a': 1, 'b': 2}, {'a': 'x', 'b': 'y'}, {'a': 'z'}], fail_fast=True)
+        self.assertEqual(errors, {1: {'a': 'Invalid number.'}})
+        self.assertEqual(Counted.calls, 3)
+
+    def test_valid_values_are_unaffected(self):
+        field = fields.List(fields.Dict({'a': Counted()}))
+        data, errors = field.submit([{'a': '1'}, {'a': '2'}], fail_fast=True)
+        self.assertEqual(data, [{'a': 1}, {'a': 2}])
+
+
+class FailFastFormTestCase(TestCase):
+
+    def setUp(self):
+        Counted.calls = 0
+
+    def test_form_stops_at_first_field_error(self):
+        form = OrderForm({'a': 'x', 'b': 'y', 'items': [1], 'customer': {}})
+        form.submit(fail_fast=True)
+        self.assertEqual(form.valid, False)
+        self.assertEqual(form.errors, {'a': 'Invalid number.'})
+        self.assertEqual(Counted.calls, 1)
+
+    def test_form_stops_at_first_nested_form_error(self):
+        form = OrderForm({'a': 1, 'b': 2, 'items': [1], 'customer': {'age': 'x', 'height': 'y'}})
+        form.submit(fail_fast=True)
+        self.assertEqual(form.errors, {'customer': {'age': 'Invalid number.'}})
+
+    def test_form_validation_is_skipped_after_an_error(self):
+        form = OrderForm({'a': 1, 'b': 'x', 'items': [1], 'customer': {'age': 1, 'height': 1}})
+        form.submit(fail_fast=True)
+        self.assertEqual(form.errors, {'b': 'Invalid number.'})
+
+    def test_form_validation_runs_when_fields_are_valid(self):
+        form = OrderForm({'a': 1, 'b': 1, 'items': [1], 'customer': {'age': 1, 'height': 1}})
+        form.submit(fail_fast=True)
+        self.assertEqual(form.errors, {'b': 'Must be different from a.'})
+
+    def test_valid_form_data(self):
+        form = OrderForm({'a': 1, 'b': '2', 'items': ['3'], 'customer': {'age': 1, 'height': 1}})
+        form.submit(fail_fast=True)
+        self.assertEqual(form.valid, True)
+        self.assertEqual(form.data, {'a': 1, 'b': 2, 'items': [3], 'customer': {'age': 1, 'height': 1}})
+
+    def test_submit_many_fail_fast(self):
+        batch = OrderForm.submit_many([{'a': 'x', 'b': 'y'}, {}], fail_fast=True)
+        self.assertEqual(batch.errors, {0: {'a': 'Invalid number.'}, 1: {'a': 'This is required.'}})
+
+    def test_submit_parallel_fail_fast(self):
+        batch = submit_parallel(OrderForm, [{'a': 'x', 'b': 'y'}, {}], workers=1, fail_fast=True)
+        self.assertEqual(batch.errors, {0: {'a': 'Invalid number.'}, 1: {'a': 'This is required.'}})
+
+    def test_stream_fail_fast(self):
+        results = list(validate_jsonl(StringIO('{"a": "x", "b": "y"}\n'), OrderForm, fail_fast=True))
+        self.assertEqual(results, [(1, {'a': 'x', 'b': 'y'}, {'a': 'Invalid number.'})])
+
+
+class CustomerForm(Form):
+
+    age = fields.Integer()
+    height = fields.Integer()
+
+
+class OrderForm(Form):
+
+    a = Counted()
+    b = Counted()
+    items = fields.List(fields.Integer())
+    customer = CustomerForm
+
+    def validate(self, data):
+        if data.get('a') == data.get('b'):
+            self.error('b', 'Must be different from a.')
+        return data
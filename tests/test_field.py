@@ -1,7 +1,10 @@
+import asyncio
+from datetime import date, datetime, time
+from decimal import Decimal
 from unittest import TestCase
 
-from lie2me import Field, exceptions
-from lie2me.exceptions import ValidationError, BadConfiguration, BadValidation
+from lie2me import Field, Form, fields, exceptions
+from lie2me.exceptions import ValidationError, Invalid, BadConfiguration, BadValidation
 
 
 class FieldConstructorTestCase(TestCase):
@@ -68,6 +71,80 @@ class FieldSubmitTestCase(TestCase):
         self.assertEqual(str(context.exception), 'Field validation returned an error instead of raising it.')
 
 
+class FieldErrorProtocolTestCase(TestCase):
+
+    def test_builtin_validation_returns_errors_without_raising(self):
+        class Checked(Field):
+            def _check(self, value):
+                return self._invalid('Invalid!')
+        result = Checked()._process_value(42)
+        self.assertIs(type(result), Invalid)
+        self.assertEqual(result.data, 'Invalid!')
+
+    def test_required_error_is_returned_without_raising(self):
+        result = Field()._process_value(None)
+        self.assertEqual(result.data, 'This is required.')
+
+    def test_returned_error_is_submitted_as_error(self):
+        class Checked(Field):
+            def _check(self, value):
+                return self._invalid('Invalid!')
+        self.assertEqual(Checked().submit(42), (42, 'Invalid!'))
+
+    def test_public_validate_raises_returned_errors(self):
+        class Checked(Field):
+            def _check(self, value):
+                return self._invalid('Invalid!')
+        with self.assertRaises(ValidationError) as context:
+            Checked().validate(42)
+        self.assertEqual(context.exception.data, 'Invalid!')
+
+    def test_subclass_overriding_validate_can_rely_on_parent_raising(self):
+        class Checked(Field):
+            def _check(self, value):
+                return self._invalid('Invalid!') if value < 0 else value
+        class Doubled(Checked):
+            def validate(self, value):
+                return super().validate(value) * 2
+        field = Doubled()
+        self.assertEqual(field.submit(2), (4, None))
+        self.assertEqual(field.submit(-1), (-1, 'Invalid!'))
+
+
+    def test_public_submit_results_have_rendered_messages(self):
+        field = fields.Integer(min=0)
+        for value in ('x', -1, None):
+            for error in (field.submit(value)[1], asyncio.run(field.asubmit(value))[1]):
+                self.assertIs(type(error), str)
+        for field, value in ((fields.List(field), ['x']), (fields.Dict({'a': field}), {'a': 'x'})):
+            for error in (field.submit(value)[1], asyncio.run(field.asubmit(value))[1]):
+                self.assertIs(type(next(iter(error.values()))), str)
+
+class FieldSubmitOverrideTestCase(TestCase):
+
+    def test_overridden_submit_is_used_inside_forms(self):
+        class UpperForm(Form):
+            name = Upper()
+        form = UpperForm({'name': 'abc'})
+        form.submit()
+        self.assertEqual(form.data, {'name': 'ABC'})
+        form = UpperForm()
+        form.submit_json('{"name": "abc"}')
+        self.assertEqual(form.data, {'name': 'ABC'})
+
+    def test_overridden_submit_is_used_inside_containers(self):
+        self.assertEqual(fields.List(Upper()).submit(['a', 'b']), (['A', 'B'], None))
+        self.assertEqual(fields.Dict({'a': Upper()}).submit({'a': 'b'}), ({'a': 'B'}, {}))
+
+    def test_overridden_submit_without_fail_fast_argument(self):
+        class Legacy(Field):
+            def submit(self, value):
+                return super().submit(value)
+        self.assertEqual(fields.List(Legacy()).submit([None]), ([None], {0: 'This is required.'}))
+        self.assertEqual(fields.List(Legacy()).submit([None], fail_fast=True), ([None], {0: 'This is required.'}))
+        self.assertEqual(fields.List(Legacy()).submit(['a'], fail_fast=True), (['a'], None))
+
+
 class FieldRequiredTestCase(TestCase):
 
     def test_field_is_required_by_default(self):
@@ -144,7 +221,32 @@ class FieldMessagesTestCase(TestCase):
 
     def test_overwriting_field_instance_message_does_not_change_class_default_messages(self):
         field = Field(messages={'required': 'Required field'})
-        self.assertEqual(Field.messages, {'required': 'This is required.'})
+        self.assertEqual(Field.messages, {'required': 'This is required.', 'length': 'Input is too long.'})
+
+    def test_fields_share_class_messages_until_written(self):
+        a, b = Field(), Field()
+        self.assertIs(a.messages.bases, b.messages.bases)
+        a.messages['required'] = 'Required field'
+        self.assertEqual(a.submit(None), (None, 'Required field'))
+        self.assertEqual(b.submit(None), (None, 'This is required.'))
+        self.assertEqual(Field.messages['required'], 'This is required.')
+
+    def test_later_class_message_changes_are_picked_up(self):
+        class Late(Field):
+            messages = {'required': 'Required.'}
+        Late()
+        Late.messages = {'required': 'Needed.'}
+        self.assertEqual(Late().submit(None), (None, 'Needed.'))
+        Late.messages['required'] = 'Missing.'
+        self.assertEqual(Late().submit(None), (None, 'Missing.'))
+
+    def test_message_overrides_are_copied_per_instance(self):
+        a = Field(messages={'required': 'Required field'})
+        b = Field()
+        self.assertEqual(a.messages['required'], 'Required field')
+        self.assertEqual(b.messages['required'], 'This is required.')
+        a.messages['required'] = 'Still required'
+        self.assertEqual(b.messages['required'], 'This is required.')
 
     def test_error_message_is_unchanged_if_its_not_a_key_in_the_messages_dictionary(self):
         class RawMessage(Field):
@@ -181,3 +283,55 @@ class FieldMessagesTestCase(TestCase):
         field = RequiredMessageTranslated()
         value, error = field.submit(None)
         self.assertEqual(error, 'Lorem ipsum dolor sit amet')
+
+
+class FieldEmptyTestCase(TestCase):
+
+    def test_typed_values_are_never_empty(self):
+        field = Field()
+        for value in [0, 0.0, False, Decimal('0'), date(2017, 1, 1), datetime(2017, 1, 1), time(0)]:
+            self.assertFalse(field.is_empty(value))
+
+    def test_blank_strings_are_empty(self):
+        field = Field()
+        for value in [None, '', ' ', '\t\n', '\u2003']:
+            self.assertTrue(field.is_empty(value))
+        self.assertFalse(field.is_empty(' a '))
+
+    def test_other_values_are_checked_by_their_text(self):
+        field = Field()
+        self.assertTrue(field.is_empty(Blank()))
+        self.assertFalse(field.is_empty([]))
+
+
+class FieldMaxLengthTestCase(TestCase):
+
+    def test_long_input_is_rejected_before_validation(self):
+        class Exploding(Field):
+            def is_empty(self, value):
+                raise AssertionError('Should not be called.')
+        field = Exploding(max_length=10)
+        for value in ['x' * 11, b'x' * 11, [1] * 11, tuple(range(11)), dict.fromkeys(range(11))]:
+            self.assertEqual(field.submit(value), (value, 'Input is too long.'))
+
+    def test_input_within_max_length_is_validated_normally(self):
+        field = Field(max_length=3)
+        self.assertEqual(field.submit('abc'), ('abc', None))
+        self.assertEqual(field.submit(12345), (12345, None))
+
+    def test_max_length_is_checked_before_default(self):
+        field = Field(max_length=3, default='foo')
+        self.assertEqual(field.submit('    '), ('    ', 'Input is too long.'))
+
+
+class Blank(object):
+
+    def __str__(self):
+        return '  '
+
+
+class Upper(Field):
+
+    def submit(self, value, fail_fast=False):
+        value, error = super().submit(value, fail_fast)
+        return (value.upper(), error) if not error else (value, error)
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from unittest import TestCase
 
 from lie2me.fields import Date
@@ -16,6 +16,15 @@ class DateTestCase(TestCase, CommonTests):
         value, error = field.submit(date(2017, 9, 10))
         self.assertEqual(value, date(2017, 9, 10))
 
+    def test_native_date_object_is_returned_as_is(self):
+        value = date(2017, 9, 10)
+        self.assertIs(Date().submit(value)[0], value)
+        self.assertIs(Date(format='%d/%m/%Y').submit(value)[0], value)
+
+    def test_native_datetime_object_is_not_a_date(self):
+        value, error = Date().submit(datetime(2017, 9, 10, 22, 32))
+        self.assertEqual(error, 'Invalid date.')
+
     def test_valid_date(self):
         field = Date()
         value, error = field.submit('2017-09-10')
@@ -16,6 +16,10 @@ class DateTimeTestCase(TestCase, CommonTests):
         value, error = field.submit(datetime(2017, 9, 10, 22, 32))
         self.assertEqual(value, datetime(2017, 9, 10, 22, 32))
 
+    def test_native_datetime_keeps_microseconds(self):
+        value = datetime(2017, 9, 10, 22, 32, 1, 123456)
+        self.assertIs(DateTime().submit(value)[0], value)
+
     def test_valid_naive_datetime(self):
         field = DateTime()
         value, error = field.submit('2017-09-10 22:32')
@@ -16,6 +16,16 @@ class DecimalTestCase(TestCase, CommonTests):
         value, error = field.submit(D('3.6'))
         self.assertEqual(value, D('3.6'))
 
+    def test_native_int_is_converted_exactly(self):
+        field = Decimal(min=0, max=10)
+        self.assertEqual(field.submit(7), (D('7'), None))
+        self.assertEqual(field.submit(11)[1], 'Must not be higher than 10.')
+
+    def test_booleans_are_not_numbers(self):
+        field = Decimal()
+        value, error = field.submit(True)
+        self.assertEqual(error, 'Invalid number.')
+
     def test_valid_decimal(self):
         field = Decimal()
         value, error = field.submit(3.6)
@@ -48,3 +58,8 @@ class DecimalTestCase(TestCase, CommonTests):
     def test_max_constraint_is_converted_to_decimal(self):
         field = Decimal(max=3.3)
         field.submit(3.3)
+
+    def test_max_digits_is_checked_before_conversion(self):
+        field = Decimal(max_digits=5)
+        self.assertEqual(field.submit('1' * 6)[1], 'Must have no more than 5 digits.')
+        self.assertEqual(field.submit(' -12345 ')[1], None)
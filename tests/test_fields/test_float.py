@@ -34,3 +34,8 @@ class FloatTestCase(TestCase, CommonTests):
         field = Float(max=15.5)
         value, error = field.submit(15.51)
         self.assertEqual(error, 'Must not be higher than 15.5.')
+
+    def test_max_digits_is_checked_before_conversion(self):
+        field = Float(max_digits=5)
+        self.assertEqual(field.submit('1' * 6)[1], 'Must have no more than 5 digits.')
+        self.assertEqual(field.submit(' -12345 ')[1], None)
@@ -34,3 +34,13 @@ class IntegerTestCase(TestCase, CommonTests):
         field = Integer(max=99)
         value, error = field.submit(100)
         self.assertEqual(error, 'Must not be higher than 99.')
+
+    def test_max_digits_is_checked_before_conversion(self):
+        field = Integer(max_digits=5)
+        self.assertEqual(field.submit('1' * 6)[1], 'Must have no more than 5 digits.')
+        self.assertEqual(field.submit(' -12345 ')[1], None)
+
+    def test_max_digits_rejects_long_text_without_counting_digits(self):
+        field = Integer(max_digits=5)
+        self.assertEqual(field.submit(' ' * 8 + '12345' + ' ' * 8)[1], None)
+        self.assertEqual(field.submit(' ' * 20 + '12345')[1], 'Must have no more than 5 digits.')
@@ -1,6 +1,8 @@
+import asyncio
 from unittest import TestCase
 
-from lie2me.fields import List, Integer, Text
+from lie2me import Form, compile_form
+from lie2me.fields import List, Integer, Text, Dict
 from lie2me.exceptions import BadConfiguration
 from .common_tests import CommonTests
 
@@ -24,7 +26,7 @@ class ListTestCase(TestCase, CommonTests):
     def test_cannot_be_constructed_with_field_class_as_type(self):
         with self.assertRaises(BadConfiguration) as context:
             List(Integer)
-        self.assertEqual(str(context.exception), 'First argument must be a field instance.')
+        self.assertEqual(str(context.exception), 'First argument must be a field instance or a form class.')
 
     def test_required_list_against_missing_data(self):
         field = List(Integer())
@@ -115,3 +117,175 @@ class ListTestCase(TestCase, CommonTests):
         field = List(Integer(), max=3)
         data, errors = field.submit([1, 2, 3, 4])
         self.assertEqual(errors, {'list': 'Must have no more than 3 items.'})
+
+    def test_list_of_valid_dicts(self):
+        field = List(Dict({'id': Integer()}))
+        data, errors = field.submit([{'id': '1'}, {'id': 2}])
+        self.assertEqual(data, [{'id': 1}, {'id': 2}])
+        self.assertEqual(errors, None)
+
+    def test_max_length_rejects_long_lists_before_items(self):
+        field = List(Integer(), max_length=2)
+        self.assertEqual(field.submit(['x', 'y', 'z'])[1], {'list': 'Input is too long.'})
+
+    def test_error_returns_list_error(self):
+        error = List(Integer()).error('min')
+        self.assertEqual(error.data, {'list': 'Must have at least None items.'})
+
+
+class ItemForm(Form):
+
+    sku = Text(max=8)
+    quantity = Integer(min=1)
+
+
+class PricedItemForm(ItemForm):
+
+    def validate(self, data):
+        if data.get('sku') == 'FREE':
+            self.error('sku', 'Not for sale.')
+        return data
+
+
+class OrderForm(Form):
+
+    items = List(ItemForm, max=3)
+
+
+class ListOfFormsTestCase(TestCase):
+
+    def test_can_be_constructed_with_form_class(self):
+        self.assertIs(List(ItemForm).field, ItemForm)
+
+    def test_valid_items(self):
+        data, errors = List(ItemForm).submit([{'sku': 'A1', 'quantity': '2'}, {'sku': 'B2', 'quantity': 1}])
+        self.assertEqual(data, [{'sku': 'A1', 'quantity': 2}, {'sku': 'B2', 'quantity': 1}])
+        self.assertEqual(errors, None)
+
+    def test_invalid_items_are_reported_by_index(self):
+        data, errors = List(ItemForm).submit([{'sku': 'A1', 'quantity': 1}, {'quantity': 0}, 'foo'])
+        self.assertEqual(errors, {
+            1: {'sku': 'This is required.', 'quantity': 'Must not be lower than 1.'},
+            2: {'sku': 'This is required.', 'quantity': 'This is required.'},
+        })
+
+    def test_items_errors_match_nested_form_errors(self):
+        items = [{'sku': 'TOO-LONG-SKU', 'quantity': 'x'}, {'sku': 'FREE', 'quantity': 1}]
+        data, errors = List(PricedItemForm).submit(items)
+        for i, item in enumerate(items):
+            form = PricedItemForm(item)
+            form.submit()
+            self.assertEqual(errors[i], form.errors)
+
+    def test_fail_fast_stops_at_first_invalid_item(self):
+        data, errors = List(ItemForm).submit([{'sku': 'A1'}, {'quantity': 0}], fail_fast=True)
+        self.assertEqual(errors, {0: {'quantity': 'This is required.'}})
+
+    def test_list_constraints_are_checked_before_items(self):
+        data, errors = List(ItemForm, max=1).submit([{}, {}])
+        self.assertEqual(errors, {'list': 'Must have no more than 1 items.'})
+
+    def test_schema_changes_are_picked_up(self):
+        class NoteForm(Form):
+            text = Text()
+        field = List(NoteForm)
+        self.assertEqual(field.submit([{'text': 'a'}]), ([{'text': 'a'}], None))
+        NoteForm.author = Text()
+        self.assertEqual(field.submit([{'text': 'a'}]), ([{'text': 'a'}], {0: {'author': 'This is required.'}}))
+
+    def test_nested_schema_changes_are_picked_up(self):
+        class InnerForm(Form):
+            a = Text()
+        class OuterForm(Form):
+            inner = InnerForm
+        field = List(OuterForm)
+        self.assertEqual(field.submit([{'inner': {'a': 'x'}}])[1], None)
+        InnerForm.b = Integer()
+        self.assertEqual(field.submit([{'inner': {'a': 'x'}}])[1], {0: {'inner': {'b': 'This is required.'}}})
+
+    def test_async_submit(self):
+        data, errors = asyncio.run(List(ItemForm).asubmit([{'sku': 'A1', 'quantity': 1}, {'sku': 'B2'}]))
+        self.assertEqual(errors, {1: {'quantity': 'This is required.'}})
+
+    def test_list_of_forms_inside_form_and_compiled_form(self):
+        for data in [{'items': [{'sku': 'A1', 'quantity': 1}]}, {'items': [{'sku': 'A1'}, None]}, {'items': 'x'}]:
+            form = OrderForm(data)
+            form.submit()
+            self.assertEqual(compile_form(OrderForm)(data), (form.valid, form.data, form.errors))
+
+
+class LazyListTestCase(TestCase):
+
+    def test_accepts_generators(self):
+        items, errors = List(Integer(), lazy=True).submit(str(i) for i in range(3))
+        self.assertEqual(errors, None)
+        self.assertEqual(list(items), [0, 1, 2])
+        self.assertTrue(items.valid)
+
+    def test_still_rejects_strings_and_dicts(self):
+        field = List(Integer(), lazy=True)
+        self.assertEqual(field.submit('123')[1], {'list': 'Invalid list.'})
+        self.assertEqual(field.submit({'a': 1})[1], {'list': 'Invalid list.'})
+
+    def test_items_are_validated_while_iterating(self):
+        seen = []
+        def source():
+            for value in ['1', 'x', '3']:
+                seen.append(value)
+                yield value
+        items, errors = List(Integer(), lazy=True).submit(source())
+        self.assertEqual(seen, [])
+        self.assertEqual(next(items), 1)
+        self.assertEqual(seen, ['1'])
+        self.assertIsNone(items.valid)
+        self.assertEqual(list(items), [3])
+        self.assertEqual(items.errors, {1: 'Invalid number.'})
+        self.assertFalse(items.valid)
+
+    def test_stops_reading_past_max(self):
+        seen = []
+        def source():
+            for i in range(100):
+                seen.append(i)
+                yield i
+        items, errors = List(Integer(), lazy=True, max=2).submit(source())
+        self.assertEqual(list(items), [0, 1])
+        self.assertEqual(seen, [0, 1, 2])
+        self.assertEqual(items.errors, {'list': 'Must have no more than 2 items.'})
+
+    def test_min_is_checked_when_exhausted(self):
+        items, errors = List(Integer(), lazy=True, min=3).submit(iter([1, 2]))
+        self.assertEqual(list(items), [1, 2])
+        self.assertEqual(items.errors, {'list': 'Must have at least 3 items.'})
+
+    def test_sized_input_is_checked_upfront(self):
+        self.assertEqual(List(Integer(), lazy=True, max=1).submit([1, 2])[1], {'list': 'Must have no more than 1 items.'})
+
+    def test_fail_fast_stops_at_first_error(self):
+        items, errors = List(Integer(), lazy=True).submit(iter(['1', 'x', 'y', '4']), fail_fast=True)
+        self.assertEqual(list(items), [1])
+        self.assertEqual(items.errors, {1: 'Invalid number.'})
+
+    def test_errors_are_collected_up_to_max_errors(self):
+        items, errors = List(Integer(), lazy=True, max_errors=2).submit(iter(['a', 'b', 'c', '4']))
+        self.assertEqual(list(items), [4])
+        self.assertEqual(items.errors, {0: 'Invalid number.', 1: 'Invalid number.'})
+        self.assertEqual(items.error_count, 3)
+
+    def test_lazy_list_of_forms(self):
+        items, errors = List(ItemForm, lazy=True).submit(iter([{'sku': 'A1', 'quantity': 1}, {'sku': 'B2'}]))
+        self.assertEqual(list(items), [{'sku': 'A1', 'quantity': 1}])
+        self.assertEqual(items.errors, {1: {'quantity': 'This is required.'}})
+
+    def test_eager_list_stops_at_max_errors(self):
+        data, errors = List(Integer(), max_errors=2).submit(['a', 'b', 'c'])
+        self.assertEqual(errors, {0: 'Invalid number.', 1: 'Invalid number.'})
+
+    def test_compiled_form_with_max_errors(self):
+        class CappedForm(Form):
+            numbers = List(Integer(), max_errors=1)
+        data = {'numbers': ['a', 'b']}
+        form = CappedForm(data)
+        form.submit()
+        self.assertEqual(compile_form(CappedForm)(data), (form.valid, form.data, form.errors))
+        self.assertEqual(form.errors, {'numbers': {0: 'Invalid number.'}})
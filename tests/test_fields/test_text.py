@@ -1,6 +1,10 @@
 from unittest import TestCase
 
+from lie2me import Options
+import re
+
 from lie2me.fields import Text
+from lie2me.exceptions import BadConfiguration
 from .common_tests import CommonTests
 
 
@@ -79,6 +83,18 @@ class TextTestCase(TestCase, CommonTests):
         value, error = field.submit('foo\rbar')
         self.assertEqual(error, 'Must not have more than one line.')
 
+    def test_long_value_is_rejected_before_trimming(self):
+        field = Text(max=3)
+        self.assertEqual(field.submit('abcd\nefg')[1], 'Must have no more than 3 characters.')
+        self.assertEqual(field.submit(' abc ')[1], None)
+        self.assertEqual(Text(max=3, trim=False).submit(' abc ')[1], 'Must have no more than 3 characters.')
+
+    def test_padding_only_delays_rejection_when_trimming_can_fit_the_value(self):
+        field = Text(max=3)
+        self.assertEqual(field.submit(' ' * 50 + 'abc' + ' ' * 50)[1], None)
+        self.assertEqual(field.submit(' abcd')[1], 'Must have no more than 3 characters.')
+        self.assertEqual(field.submit(' ab cd ')[1], 'Must have no more than 3 characters.')
+
     def test_field_can_be_configured_to_accept_multilines(self):
         field = Text(multiline=True)
         value, error = field.submit('foo\nbar')
@@ -98,6 +114,34 @@ class TextTestCase(TestCase, CommonTests):
         field = Text(required=False, min=1)
         field.submit('')
 
+    def test_pattern_is_compiled_once_and_shared(self):
+        a = Text(pattern=r'^[a-z]+$')
+        b = Text(pattern=r'^[a-z]+$')
+        self.assertEqual(a.pattern, r'^[a-z]+$')
+        self.assertIsInstance(a._pattern, re.Pattern)
+        self.assertIs(a._pattern, b._pattern)
+
+    def test_pattern_placeholder_renders_configured_pattern(self):
+        field = Text(pattern=r'^[a-z]+$', messages={'pattern': 'Must match {pattern}.'})
+        self.assertEqual(field.submit('1'), ('1', 'Must match ^[a-z]+$.'))
+
+    def test_pattern_reassigned_after_construction_is_used(self):
+        field = Text(pattern=r'^[a-z]+$')
+        field.pattern = r'^[0-9]+$'
+        self.assertEqual(field.submit('12'), ('12', None))
+
+    def test_pattern_accepts_compiled_patterns(self):
+        pattern = re.compile(r'^[a-z]+$', re.IGNORECASE)
+        field = Text(pattern=pattern)
+        self.assertIs(field.pattern, pattern)
+        self.assertEqual(field.submit('FOO'), ('FOO', None))
+        self.assertEqual(field.submit('F00'), ('F00', 'Invalid format.'))
+
+    def test_pattern_is_not_evaluated_on_values_over_pattern_max_length(self):
+        field = Text(pattern=r'^(a+)+$', pattern_max_length=10)
+        self.assertEqual(field.submit('a' * 10), ('a' * 10, None))
+        self.assertEqual(field.submit('a' * 50 + 'b'), ('a' * 50 + 'b', 'Invalid format.'))
+
     def test_options_constraint_against_valid_value(self):
         field = Text(options=['foo', 'bar'])
         value, error = field.submit('foo')
@@ -107,3 +151,33 @@ class TextTestCase(TestCase, CommonTests):
         field = Text(options=['foo', 'bar'])
         value, error = field.submit('biz')
         self.assertEqual(error, 'Invalid option.')
+
+    def test_options_are_indexed_on_construction(self):
+        field = Text(options=['foo', 'bar'])
+        self.assertEqual(field.options, ['foo', 'bar'])
+        self.assertIsInstance(field._options_index, Options)
+        self.assertIn('foo', field._options_index)
+
+    def test_options_placeholder_renders_configured_options(self):
+        field = Text(options=['foo', 'bar'], messages={'options': 'Must be one of {options}.'})
+        self.assertEqual(field.submit('biz'), ('biz', "Must be one of ['foo', 'bar']."))
+
+    def test_options_can_be_matched_after_normalization(self):
+        field = Text(options=['Foo', 'Bar'], normalize=str.casefold)
+        self.assertEqual(field.submit(' fOO '), ('Foo', None))
+        self.assertEqual(field.submit('biz'), ('biz', 'Invalid option.'))
+
+    def test_options_instance_is_shared_between_fields(self):
+        options = Options(['foo', 'bar'])
+        self.assertIs(Text(options=options).options, options)
+        self.assertIs(Text(options=options).options, options)
+
+    def test_normalize_cannot_be_set_along_with_options_instance(self):
+        with self.assertRaises(BadConfiguration):
+            Text(options=Options(['foo']), normalize=str.lower)
+
+    def test_options_reassigned_after_construction_still_work(self):
+        field = Text(options=['foo'])
+        field.options = ['bar']
+        self.assertEqual(field.submit('bar'), ('bar', None))
+        self.assertEqual(field.submit('foo'), ('foo', 'Invalid option.'))
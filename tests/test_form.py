@@ -1,3 +1,4 @@
+import json
 from unittest import TestCase
 
 from lie2me import Form, fields
@@ -187,6 +188,440 @@ class FormTestCase(TestCase):
         form = ProfileForm(object())
         form.submit()
 
+    def test_form_with_valid_dict_field_is_valid(self):
+        class DictForm(Form):
+            extra = fields.Dict({'color': fields.Text()})
+        form = DictForm({'extra': {'color': 'red'}})
+        form.submit()
+        self.assertEqual(form.valid, True)
+        self.assertEqual(form.data, {'extra': {'color': 'red'}})
+
+
+    def test_overridden_submit_without_fail_fast_argument(self):
+        class LegacyForm(AddressForm):
+            def submit(self):
+                super().submit()
+        class ParentForm(Form):
+            address = LegacyForm
+            addresses = fields.List(LegacyForm)
+        data = {'address': {'street': 'A', 'number': 1}, 'addresses': [{'street': 'B', 'number': 2}]}
+        form = ParentForm(data)
+        form.submit(fail_fast=True)
+        self.assertTrue(form.valid)
+        form = ParentForm()
+        form.submit_json(json.dumps(data), fail_fast=True)
+        self.assertTrue(form.valid)
+        batch = LegacyForm.submit_many([data['address'], {}], fail_fast=True)
+        self.assertEqual(batch.valid, [True, False])
+
+    def test_overridden_submit_without_partial_argument(self):
+        class LegacyForm(AddressForm):
+            def submit(self):
+                super().submit()
+        class ParentForm(Form):
+            name = fields.Text()
+            address = LegacyForm
+        form = ParentForm({'address': {'street': 'A', 'number': 1}})
+        form.submit(partial=True)
+        self.assertEqual(form.data, {'address': {'street': 'A', 'number': 1, 'complement': None}})
+        form = ParentForm()
+        form.submit_json('{"address": {"number": "x"}}', partial=True)
+        self.assertEqual(form.errors, {'address': {'street': 'This is required.', 'number': 'Invalid number.'}})
+
+class FormSchemaTestCase(TestCase):
+
+    def test_schema_is_shared_between_instances(self):
+        self.assertIs(ProfileForm().fields, ProfileForm().fields)
+        self.assertIs(ProfileForm().forms, ProfileForm().forms)
+
+    def test_schema_contains_public_fields_and_nested_forms(self):
+        form = SignupForm()
+        self.assertEqual(sorted(form.fields), ['email', 'name', 'observations', 'password', 'password2'])
+        self.assertEqual(dict(ProfileForm().forms), {'address': AddressForm})
+
+    def test_schema_cannot_be_changed(self):
+        form = ProfileForm()
+        with self.assertRaises(TypeError):
+            form.fields['age'] = fields.Integer()
+
+    def test_fields_assigned_on_the_instance_are_validated(self):
+        class InstanceForm(AddressForm):
+            def __init__(self, data=None):
+                self.city = fields.Text()
+                self.complement = None
+                super().__init__(data)
+        form = InstanceForm({'street': 'A', 'number': 1})
+        form.submit()
+        self.assertEqual(form.errors, {'city': 'This is required.'})
+        self.assertNotIn('complement', form.fields)
+        self.assertNotIn('city', AddressForm().fields)
+
+    def test_instance_schema_can_be_replaced_with_a_copy(self):
+        form = AddressForm({'street': 'A', 'number': 1})
+        form.fields = dict(form.fields, city=fields.Text())
+        form.submit()
+        self.assertEqual(form.errors, {'city': 'This is required.'})
+
+    def test_subclass_can_override_and_add_fields(self):
+        class ChildForm(AddressForm):
+            number = fields.Text()
+            city = fields.Text()
+        form = ChildForm()
+        self.assertIsInstance(form.fields['number'], fields.Text)
+        self.assertIn('city', form.fields)
+        self.assertIsInstance(AddressForm().fields['number'], fields.Integer)
+
+    def test_late_attribute_changes_are_reflected_in_schema(self):
+        class LateForm(Form):
+            name = fields.Text()
+        LateForm()
+        LateForm.age = fields.Integer()
+        self.assertIn('age', LateForm().fields)
+        del LateForm.name
+        self.assertNotIn('name', LateForm().fields)
+
+    def test_late_attribute_changes_are_reflected_in_subclasses(self):
+        class ParentForm(Form):
+            name = fields.Text()
+        class ChildForm(ParentForm):
+            pass
+        ChildForm()
+        ParentForm.address = AddressForm
+        self.assertEqual(dict(ChildForm().forms), {'address': AddressForm})
+
+
+class FormMemoryTestCase(TestCase):
+
+    def test_form_attributes_are_slotted(self):
+        self.assertEqual(Form.__slots__, ('fields', 'forms', 'data', 'valid', '_errors', '_path', '_input', '_results'))
+        with self.assertRaises(AttributeError):
+            Form().foo = 'bar'
+
+    def test_subclasses_can_still_set_custom_attributes(self):
+        form = SignupForm()
+        form.foo = 'bar'
+        self.assertEqual(form.foo, 'bar')
+
+    def test_valid_form_does_not_allocate_errors_until_read(self):
+        form = AddressForm({'street': 'Nowhere', 'number': 42})
+        form.submit()
+        self.assertTrue(form.valid)
+        self.assertIsNone(form._errors)
+        self.assertEqual(form.errors, {})
+        form.errors['street'] = 'Late error.'
+        self.assertEqual(form.errors, {'street': 'Late error.'})
+
+
+class FormSubmitManyTestCase(TestCase):
+
+    def test_submit_many_returns_batch_with_results_in_order(self):
+        batch = ProfileForm.submit_many([
+            {'name': ' John ', 'email': 'john@domain.com', 'address': {'street': 'A', 'number': '1'}},
+            {'name': 'Jane', 'email': 'jane@domain', 'address': {'street': 'B', 'number': 2}},
+        ])
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.valid, [True, False])
+        self.assertEqual(batch.data[0], {
+            'name': 'John',
+            'email': 'john@domain.com',
+            'address': {'street': 'A', 'number': 1, 'complement': None},
+        })
+        self.assertEqual(batch.data[1]['name'], 'Jane')
+
+    def test_submit_many_errors_are_indexed_by_record(self):
+        batch = ProfileForm.submit_many([
+            {'name': 'John', 'email': 'john@domain.com', 'address': {'street': 'A', 'number': 1}},
+            {'name': 'Jane', 'email': 'jane@domain', 'address': {'street': 'B', 'number': -1}},
+            None,
+        ])
+        self.assertEqual(batch.errors, {
+            1: {'email': 'Invalid email.', 'address': {'number': 'Must not be lower than 0.'}},
+            2: {
+                'name': 'This is required.',
+                'email': 'This is required.',
+                'address': {'street': 'This is required.', 'number': 'This is required.'},
+            },
+        })
+
+    def test_submit_many_matches_individual_submits(self):
+        records = [
+            {'name': 'John', 'email': 'john@domain.com', 'password': '123', 'password2': '123'},
+            {'name': 'John', 'email': 'john@domain.com', 'password': '123', 'password2': '321'},
+            {},
+        ]
+        batch = SignupForm.submit_many(records)
+        for record, (valid, data, errors) in zip(records, batch):
+            form = SignupForm(record)
+            form.submit()
+            self.assertEqual((valid, data, errors), (form.valid, form.data, form.errors))
+
+    def test_submit_many_accepts_any_iterable(self):
+        batch = AddressForm.submit_many({'street': 'A', 'number': i} for i in range(3))
+        self.assertEqual([data['number'] for data in batch.data], [0, 1, 2])
+
+    def test_submit_many_without_records_returns_empty_batch(self):
+        batch = AddressForm.submit_many([])
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.errors, {})
+
+
+class FormSizeTestCase(TestCase):
+
+    def test_too_many_keys_are_rejected_before_fields(self):
+        class GuardedForm(ProfileForm):
+            max_keys = 3
+        form = GuardedForm(dict.fromkeys('abcd', 'x'))
+        form.submit()
+        self.assertFalse(form.valid)
+        self.assertEqual(form.errors, {'form': 'Too many keys.'})
+
+    def test_too_deeply_nested_data_is_rejected(self):
+        class GuardedForm(ProfileForm):
+            max_depth = 3
+        form = GuardedForm({'name': 'John', 'address': {'street': [{'a': 1}]}})
+        form.submit()
+        self.assertEqual(form.errors, {'form': 'Too deeply nested.'})
+        form = GuardedForm({'name': 'John', 'email': 'john@domain.com', 'address': {'street': 'A', 'number': [1]}})
+        form.submit()
+        self.assertEqual(form.errors, {'address': {'number': 'Invalid number.'}})
+
+    def test_size_messages_can_be_overridden(self):
+        class GuardedForm(ProfileForm):
+            max_keys = 0
+            messages = {'keys': 'Payload too large.'}
+        form = GuardedForm({'name': 'John'})
+        form.submit()
+        self.assertEqual(form.errors, {'form': 'Payload too large.'})
+
+
+class FormPartialTestCase(TestCase):
+
+    def test_partial_submit_validates_only_present_keys(self):
+        form = ProfileForm({'email': 'john@domain.com'})
+        form.submit(partial=True)
+        self.assertTrue(form.valid)
+        self.assertEqual(form.data, {'email': 'john@domain.com'})
+
+    def test_partial_submit_reports_errors_of_present_keys(self):
+        form = ProfileForm({'name': '', 'email': 'john@domain'})
+        form.submit(partial=True)
+        self.assertEqual(form.errors, {'name': 'This is required.', 'email': 'Invalid email.'})
+
+    def test_absent_fields_are_not_submitted(self):
+        CountingText.calls = []
+        form = CountingForm({'b': 'b'})
+        form.submit(partial=True)
+        self.assertEqual(CountingText.calls, ['b'])
+        self.assertEqual(form.data, {'b': 'b'})
+
+    def test_present_nested_forms_are_partial_too(self):
+        form = ProfileForm({'address': {'number': '2'}})
+        form.submit(partial=True)
+        self.assertTrue(form.valid)
+        self.assertEqual(form.data, {'address': {'number': 2}})
+
+    def test_unknown_keys_are_ignored(self):
+        form = ProfileForm({'name': 'John', 'foo': 'bar'})
+        form.submit(partial=True)
+        self.assertEqual(form.data, {'name': 'John'})
+
+    def test_partial_fail_fast(self):
+        form = ProfileForm({'name': '', 'email': 'john@domain'})
+        form.submit(fail_fast=True, partial=True)
+        self.assertEqual(len(form.errors), 1)
+
+    def test_form_validation_still_runs(self):
+        form = SignupForm({'password': '123', 'password2': '321'})
+        form.submit(partial=True)
+        self.assertEqual(form.errors, {'password2': 'Password confirmation does not match.'})
+
+
+class FormUpdateTestCase(TestCase):
+
+    def setUp(self):
+        CountingText.calls = []
+
+    def submitted(self, form_class, data):
+        form = form_class(data)
+        form.submit()
+        return form.valid, form.data, form.errors
+
+    def updated(self, form):
+        return form.valid, form.data, form.errors
+
+    def test_first_update_validates_everything(self):
+        data = {'name': 'John', 'email': 'john@domain', 'address': {'street': 'A', 'number': '1'}}
+        form = ProfileForm(data)
+        form.update()
+        self.assertEqual(self.updated(form), self.submitted(ProfileForm, data))
+
+    def test_update_matches_full_submit(self):
+        data = {'name': 'John', 'email': 'john@domain', 'address': {'street': 'A', 'number': 'x'}}
+        form = ProfileForm(data)
+        form.update()
+        changes = [
+            {'email': 'john@domain.com'},
+            {'address': {'street': 'A', 'number': '1'}},
+            {'name': ''},
+            {'name': 'Jane', 'address': None},
+            {'address': {'street': 'B', 'number': 2, 'complement': 'Apt 3'}},
+        ]
+        for change in changes:
+            data = dict(data, **change)
+            form.update(change)
+            self.assertEqual(self.updated(form), self.submitted(ProfileForm, data))
+
+    def test_only_changed_fields_are_revalidated(self):
+        form = CountingForm({'a': 'a', 'b': 'b', 'address': {'street': 'A', 'number': 1}})
+        form.update()
+        self.assertEqual(sorted(CountingText.calls), ['a', 'b'])
+        CountingText.calls = []
+        form.update({'b': 'c'})
+        self.assertEqual(CountingText.calls, ['c'])
+        self.assertEqual(form.data['b'], 'c')
+        self.assertEqual(form.data['a'], 'a')
+
+    def test_only_changed_nested_fields_are_revalidated(self):
+        form = CountingForm({'a': 'a', 'b': 'b', 'address': {'street': 'A', 'number': 1}})
+        form.update()
+        CountingText.calls = []
+        form.update({'address': {'street': 'A', 'number': 'x'}})
+        self.assertEqual(CountingText.calls, [])
+        self.assertEqual(form.errors, {'address': {'number': 'Invalid number.'}})
+        form.update({'address': {'street': 'A', 'number': '2'}})
+        self.assertTrue(form.valid)
+        self.assertEqual(form.data['address'], {'street': 'A', 'number': 2, 'complement': None})
+
+    def test_only_changed_list_and_dict_items_are_revalidated(self):
+        form = CountingForm({'a': 'a', 'b': 'b', 'tags': ['x', 'y', 'z'], 'meta': {'k': 'v', 'w': 'u'}, 'address': {'street': 'A', 'number': 1}})
+        form.update()
+        CountingText.calls = []
+        form.update({'tags': ['x', '', 'z'], 'meta': {'k': 'v', 'w': 'new'}})
+        self.assertEqual(sorted(CountingText.calls), ['new'])
+        self.assertEqual(form.errors, {'tags': {1: 'This is required.'}})
+        form.update({'tags': ['x', 'y', 'z', 'q']})
+        self.assertEqual(sorted(CountingText.calls), ['new', 'q', 'x', 'y', 'z'])
+        self.assertTrue(form.valid)
+        self.assertEqual(form.data['tags'], ['x', 'y', 'z', 'q'])
+        self.assertEqual(form.data['meta'], {'k': 'v', 'w': 'new'})
+
+    def test_items_changed_in_place_are_revalidated(self):
+        item = {'k': 'v', 'w': 'u'}
+        tags = ['x', 'y']
+        data = {'a': 'a', 'b': 'b', 'tags': tags, 'meta': item, 'address': {'street': 'A', 'number': 1}}
+        form = CountingForm(data)
+        form.update()
+        item['w'] = ''
+        tags[1] = ''
+        form.update({'tags': tags, 'meta': dict(item)})
+        self.assertEqual(self.updated(form), self.submitted(CountingForm, dict(data, tags=tags, meta=item)))
+        self.assertEqual(form.errors, {'tags': {1: 'This is required.'}})
+
+    def test_list_of_forms_changed_in_place_is_revalidated(self):
+        class OrderForm(Form):
+            items = fields.List(AddressForm)
+        item = {'street': 'A', 'number': 1}
+        form = OrderForm({'items': [item]})
+        form.update()
+        self.assertTrue(form.valid)
+        item['number'] = 'x'
+        form.update({'items': [item]})
+        self.assertEqual(form.errors, {'items': {0: {'number': 'Invalid number.'}}})
+
+    def test_form_validation_runs_on_every_update(self):
+        form = SignupForm({'name': 'John', 'email': 'john@domain.com', 'password': '123', 'password2': '123'})
+        form.update()
+        self.assertTrue(form.valid)
+        form.update({'password2': '321'})
+        self.assertEqual(form.errors, {'password2': 'Password confirmation does not match.'})
+        form.update({'password': '321'})
+        self.assertTrue(form.valid)
+
+    def test_submit_discards_previous_results(self):
+        form = ProfileForm({'name': 'John', 'email': 'john@domain.com'})
+        form.update()
+        form.submit()
+        self.assertIsNone(form._results)
+
+
+class FormSubmitJSONTestCase(TestCase):
+
+    def submitted(self, body, **options):
+        form = ProfileForm()
+        form.submit_json(body, **options)
+        return form.valid, form.data, form.errors
+
+    def test_json_body_is_submitted_like_decoded_data(self):
+        bodies = [
+            '{"name": " John ", "email": "john@domain.com", "address": {"street": "A", "number": "2"}}',
+            '{"name": "", "email": "john@domain", "address": {"number": -1}}',
+            '{"address": "foo"}',
+            '{}',
+            '[1, 2]',
+            'null',
+        ]
+        for body in bodies:
+            form = ProfileForm(json.loads(body))
+            form.submit()
+            self.assertEqual(self.submitted(body), (form.valid, form.data, form.errors))
+
+    def test_bytes_body(self):
+        valid, data, errors = self.submitted(b'{"name": "John", "email": "john@domain.com", "address": {"street": "A", "number": 2}}')
+        self.assertTrue(valid)
+        self.assertEqual(data['address'], {'street': 'A', 'number': 2, 'complement': None})
+
+    def test_unknown_keys_are_skipped(self):
+        body = '{"name": "John", "email": "john@domain.com", "metadata": [{"a": [1, 2]}], "address": {"street": "A", "number": 2, "x": {}}}'
+        valid, data, errors = self.submitted(body)
+        self.assertTrue(valid)
+        self.assertEqual(data, {'name': 'John', 'email': 'john@domain.com', 'address': {'street': 'A', 'number': 2, 'complement': None}})
+
+    def test_partial(self):
+        self.assertEqual(self.submitted('{"address": {"number": "2"}}', partial=True), (True, {'address': {'number': 2}}, {}))
+
+    def test_fail_fast_stops_at_first_error_in_document_order(self):
+        CountingText.calls = []
+        form = CountingForm()
+        form.submit_json('{"b": "x", "a": "", "tags": ["y"]}', fail_fast=True)
+        self.assertEqual(form.errors, {'a': 'This is required.'})
+        self.assertEqual(CountingText.calls, ['x'])
+
+    def test_fail_fast_stops_at_first_absent_key(self):
+        valid, data, errors = self.submitted('{}', fail_fast=True)
+        self.assertEqual(errors, {'email': 'This is required.'})
+
+    def test_size_guards(self):
+        class GuardedForm(ProfileForm):
+            max_keys = 2
+            max_depth = 2
+        form = GuardedForm()
+        form.submit_json('{"a": 1, "b": 2, "c": 3}')
+        self.assertEqual(form.errors, {'form': 'Too many keys.'})
+        form = GuardedForm()
+        form.submit_json('{"metadata": {"a": [1]}}')
+        self.assertEqual(form.errors, {'form': 'Too deeply nested.'})
+
+    def test_overridden_submit_is_used(self):
+        class LowerForm(Form):
+            x = fields.Text()
+            def submit(self, **options):
+                self.data = {key: value.lower() for key, value in self.data.items()}
+                super().submit(**options)
+        class ParentForm(Form):
+            child = LowerForm
+        for form_class, body in ((LowerForm, '{"x": "ABC"}'), (ParentForm, '{"child": {"x": "ABC"}}')):
+            form = form_class(json.loads(body))
+            form.submit()
+            submitted = form_class()
+            submitted.submit_json(body)
+            self.assertEqual(submitted.data, form.data)
+        self.assertEqual(submitted.data, {'child': {'x': 'abc'}})
+
+    def test_invalid_json_raises_value_error(self):
+        for body in ['{"name": "John",}', '{"name": "John"} x', '']:
+            with self.assertRaises(ValueError):
+                ProfileForm().submit_json(body)
+
 
 class SignupForm(Form):
 
@@ -225,3 +660,21 @@ class ProfileForm(Form):
     name = fields.Text(max=200)
     email = fields.Email()
     address = AddressForm
+
+
+class CountingText(fields.Text):
+
+    calls = []
+
+    def _check(self, value):
+        CountingText.calls.append(value)
+        return super()._check(value)
+
+
+class CountingForm(Form):
+
+    a = CountingText()
+    b = CountingText()
+    tags = fields.List(CountingText(), required=False)
+    meta = fields.Dict({'k': CountingText(required=False), 'w': CountingText(required=False)}, required=False)
+    address = AddressForm
@@ -0,0 +1,140 @@
+import os
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.mapped import MappedRecords, validate_mapped, validate_mapped_parallel
+
+
+class MappedTestCase(TestCase):
+
+    def setUp(self):
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+
+    def write(self, content, suffix='.jsonl'):
+        with NamedTemporaryFile('wb', suffix=suffix, delete=False) as fp:
+            fp.write(content.encode('utf-8'))
+        self.paths.append(fp.name)
+        return fp.name
+
+
+class MappedJsonLinesTestCase(MappedTestCase):
+
+    def test_errors_are_reported_with_offset_line_and_path(self):
+        path = self.write('{"name": "John", "age": 42, "address": {"street": "A"}}\n\n{"name": "", "age": "x", "address": {}}\n')
+        errors = list(validate_mapped(path, PersonForm))
+        self.assertEqual(errors, [
+            (57, 3, ('age',), 'Invalid number.'),
+            (57, 3, ('name',), 'This is required.'),
+            (57, 3, ('address', 'street'), 'This is required.'),
+        ])
+
+    def test_malformed_lines_are_reported(self):
+        path = self.write('{"name": "John", "age": 42}\r\n{"name": \n')
+        self.assertEqual(list(validate_mapped(path, PlainPersonForm)), [(29, 2, (), 'Invalid JSON.')])
+
+    def test_valid_records_are_sent_to_sink(self):
+        path = self.write('﻿{"name": "Zoë", "age": 42}\n{"name": "Jane", "age": "x"}')
+        valid = []
+        list(validate_mapped(path, PlainPersonForm, valid=lambda *r: valid.append(r)))
+        self.assertEqual(valid, [(3, 1, {'name': 'Zoë', 'age': 42})])
+
+    def test_empty_file(self):
+        path = self.write('')
+        self.assertEqual(list(validate_mapped(path, PersonForm)), [])
+
+    def test_offsets_index_record_boundaries(self):
+        path = self.write('{"a": 1}\n{"b": 2}\n{"c": 3}')
+        with MappedRecords(path) as records:
+            self.assertEqual(len(records), 3)
+            self.assertEqual(list(records.offsets), [0, 9, 18, 26])
+
+    def test_spans_split_records_in_ranges(self):
+        path = self.write(''.join('{{"name": "n{}", "age": {}}}\n'.format(i, i) for i in range(10)))
+        with MappedRecords(path) as records:
+            spans = records.spans(3)
+            self.assertEqual([line_number for start, stop, line_number in spans], [1, 4, 7])
+            self.assertEqual(spans[0][0], 0)
+            self.assertEqual(spans[-1][1], records.offsets[-1])
+            self.assertEqual([span[1] for span in spans[:-1]], [span[0] for span in spans[1:]])
+
+    def test_span_can_be_validated_on_its_own(self):
+        path = self.write('{"age": 1}\n{"age": 2}\n{"age": 3}\n')
+        with MappedRecords(path) as records:
+            span = records.spans(3)[2]
+        with MappedRecords(path, span=span) as records:
+            self.assertEqual(list(records.validate(PlainPersonForm)), [(22, 3, ('name',), 'This is required.')])
+
+    def test_parallel_results_match_sequential(self):
+        lines = ['{{"name": "n{}", "age": {}}}'.format(i, i if i % 7 else '"x"') for i in range(50)]
+        path = self.write('\n'.join(lines))
+        sequential = list(validate_mapped(path, PlainPersonForm))
+        self.assertEqual(len(sequential), 8)
+        self.assertEqual(list(validate_mapped_parallel(path, PlainPersonForm, workers=2)), sequential)
+
+
+class MappedCsvTestCase(MappedTestCase):
+
+    def test_errors_are_reported_with_offset_line_and_path(self):
+        path = self.write('name,age\nJohn,42\n"Multi\nline",x\n\nJane,\n', '.csv')
+        errors = list(validate_mapped(path, PlainPersonForm, 'csv'))
+        self.assertEqual(errors, [
+            (17, 3, ('age',), 'Invalid number.'),
+            (17, 3, ('name',), 'Must not have more than one line.'),
+            (33, 6, ('age',), 'This is required.'),
+        ])
+
+    def test_csv_options_are_forwarded_to_the_reader(self):
+        path = self.write('John;42\nJane;x\n', '.csv')
+        errors = list(validate_mapped(path, PlainPersonForm, 'csv', fieldnames=['name', 'age'], delimiter=';'))
+        self.assertEqual(errors, [(8, 2, ('age',), 'Invalid number.')])
+
+    def test_quoted_line_breaks_do_not_split_records(self):
+        path = self.write('name,age\n"a\n""b""\nc",1\nd,2\n', '.csv')
+        with MappedRecords(path, 'csv') as records:
+            self.assertEqual(records.fieldnames, ['name', 'age'])
+            self.assertEqual(len(records), 2)
+
+    def test_quotes_inside_unquoted_fields_do_not_merge_records(self):
+        path = self.write('a,b\n1,5"\nx,x\ny,y\n4,z"\n', '.csv')
+        errors = list(validate_mapped(path, QuoteForm, 'csv'))
+        self.assertEqual(errors, [
+            (9, 3, ('a',), 'Invalid number.'),
+            (13, 4, ('a',), 'Invalid number.'),
+        ])
+        with MappedRecords(path, 'csv') as records:
+            self.assertEqual(len(records), 4)
+
+    def test_parallel_results_match_sequential(self):
+        rows = ['"n\n{}",{}'.format(i, i if i % 7 else 'x') for i in range(50)]
+        path = self.write('name,age\n' + '\n'.join(rows), '.csv')
+        sequential = list(validate_mapped(path, PlainPersonForm, 'csv'))
+        self.assertEqual(list(validate_mapped_parallel(path, PlainPersonForm, 'csv', workers=2)), sequential)
+
+
+class AddressForm(Form):
+
+    street = fields.Text()
+
+
+class PersonForm(Form):
+
+    name = fields.Text()
+    age = fields.Integer()
+    address = AddressForm
+
+
+class PlainPersonForm(Form):
+
+    name = fields.Text()
+    age = fields.Integer()
+
+
+class QuoteForm(Form):
+
+    a = fields.Integer()
+    b = fields.Text()
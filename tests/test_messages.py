@@ -0,0 +1,95 @@
+import json
+import pickle
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.messages import Message, compile_template, render
+
+
+class MessageForm(Form):
+
+    name = fields.Text(max=3)
+    age = fields.Integer(min=18)
+    tags = fields.List(fields.Integer(), max=2)
+    address = fields.Dict({'street': fields.Text()})
+
+
+class MessageTestCase(TestCase):
+
+    def test_form_keeps_errors_unrendered_until_they_are_read(self):
+        form = MessageForm({'name': 'John', 'age': 10, 'tags': [1, 'a'], 'address': {}})
+        form.submit()
+        self.assertFalse(form.valid)
+        self.assertIsInstance(form._errors['name'], Message)
+        self.assertIsInstance(form._errors['tags'][1], Message)
+        self.assertEqual(form.errors, {
+            'name': 'Must have no more than 3 characters.',
+            'age': 'Must not be lower than 18.',
+            'tags': {1: 'Invalid number.'},
+            'address': 'This is required.',
+        })
+        self.assertIs(type(form.errors['name']), str)
+        self.assertIs(type(form.errors['tags'][1]), str)
+
+    def test_rendered_errors_are_json_serializable(self):
+        form = MessageForm({'tags': [1, 2, 3], 'address': {'street': ''}})
+        form.submit()
+        self.assertEqual(json.loads(json.dumps(form.errors)), {
+            'name': 'This is required.',
+            'age': 'This is required.',
+            'tags': {'list': 'Must have no more than 2 items.'},
+            'address': {'street': 'This is required.'},
+        })
+
+    def test_reading_errors_keeps_dict_identity(self):
+        form = MessageForm({})
+        form.submit()
+        form.errors['extra'] = 'Extra error.'
+        self.assertEqual(form.errors['extra'], 'Extra error.')
+
+    def test_field_submit_returns_rendered_strings(self):
+        value, error = fields.Integer(max=10).submit(20)
+        self.assertIs(type(error), str)
+        self.assertEqual(error, 'Must not be higher than 10.')
+
+    def test_messages_overridden_after_construction_are_used(self):
+        field = fields.Integer(min=5)
+        field.messages = dict(field.messages, min='Too small, minimum is {min}.')
+        field.min = 7
+        value, error = field.submit(3)
+        self.assertEqual(error, 'Too small, minimum is 7.')
+
+    def test_message_reflects_field_attributes_at_render_time(self):
+        field = fields.Integer(max=10)
+        message = field._invalid('max').data
+        field.max = 12
+        self.assertEqual(message, 'Must not be higher than 12.')
+        self.assertEqual(str(message), 'Must not be higher than 12.')
+        self.assertEqual(repr(message), repr('Must not be higher than 12.'))
+
+    def test_message_pickles_as_plain_string(self):
+        message = fields.Integer()._invalid('type').data
+        loaded = pickle.loads(pickle.dumps(message))
+        self.assertIs(type(loaded), str)
+        self.assertEqual(loaded, 'Invalid number.')
+
+    def test_templates_are_compiled_once(self):
+        self.assertEqual(compile_template('At least {min} of {max}, {min}.'),
+            ('At least ', (('min', ' of '), ('max', ', '), ('min', '.'))))
+        self.assertIs(compile_template('Plain {a}.'), compile_template('Plain {a}.'))
+
+    def test_format_message_replaces_every_placeholder(self):
+        field = fields.Integer(min=1, max=9)
+        self.assertEqual(field.format_message('{min}-{max}-{min} {unknown'), '1-9-1 {unknown')
+
+    def test_render_leaves_strings_untouched(self):
+        errors = {'a': 'Error.', 'b': {'c': 'Nested.'}}
+        self.assertIs(render(errors), errors)
+        self.assertEqual(errors, {'a': 'Error.', 'b': {'c': 'Nested.'}})
+        self.assertIsNone(render(None))
+
+    def test_batch_errors_are_rendered(self):
+        batch = MessageForm.submit_many([{'name': 'Jo', 'age': 20, 'tags': [1], 'address': {'street': 'Main'}}, {}])
+        self.assertEqual(batch.valid, [True, False])
+        self.assertIs(type(batch.errors[1]['name']), str)
+        self.assertEqual(list(batch)[1][2]['age'], 'This is required.')
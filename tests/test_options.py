@@ -0,0 +1,38 @@
+import os
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+from lie2me import Options
+
+
+class OptionsTestCase(TestCase):
+
+    def test_options_are_indexed_in_a_set(self):
+        options = Options(['foo', 'bar', 'foo'])
+        self.assertIsInstance(options.index, frozenset)
+        self.assertEqual(len(options), 2)
+        self.assertIn('foo', options)
+        self.assertNotIn('baz', options)
+        self.assertEqual(options.get('bar'), 'bar')
+        self.assertIsNone(options.get('baz'))
+
+    def test_normalized_options_map_to_the_first_declared_option(self):
+        options = Options(['BR', 'US', 'br'], normalize=str.casefold)
+        self.assertEqual(options.index, {'br': 'BR', 'us': 'US'})
+        self.assertIn('Us', options)
+        self.assertEqual(options.get('bR'), 'BR')
+        self.assertEqual(sorted(options), ['BR', 'US'])
+
+    def test_options_accept_any_iterable(self):
+        options = Options('SKU-{}'.format(i) for i in range(50000))
+        self.assertEqual(len(options), 50000)
+        self.assertIn('SKU-49999', options)
+
+    def test_options_can_be_loaded_from_file(self):
+        with NamedTemporaryFile('w', suffix='.txt', delete=False) as fp:
+            fp.write('foo\n  bar  \n\nbiz\n')
+        try:
+            options = Options.from_file(fp.name, normalize=str.upper)
+        finally:
+            os.remove(fp.name)
+        self.assertEqual(options.index, {'FOO': 'foo', 'BAR': 'bar', 'BIZ': 'biz'})
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.batch import Batch
+from lie2me.parallel import submit_parallel
+
+
+class ParallelTestCase(TestCase):
+
+    def test_results_are_merged_in_input_order(self):
+        records = [{'number': i} for i in range(25)]
+        batch = submit_parallel(NumberForm, records, workers=2, chunk_size=4)
+        self.assertEqual(len(batch), 25)
+        self.assertEqual([data['number'] for data in batch.data], list(range(25)))
+
+    def test_errors_keep_record_indexes(self):
+        records = [{'number': i} if i % 7 else {'number': 'x'} for i in range(1, 30)]
+        batch = submit_parallel(PlainNumberForm, records, workers=2, chunk_size=3)
+        self.assertEqual(batch.errors, {
+            6: {'number': 'Invalid number.'},
+            13: {'number': 'Invalid number.'},
+            20: {'number': 'Invalid number.'},
+            27: {'number': 'Invalid number.'},
+        })
+        self.assertEqual(batch.valid, [i % 7 != 0 for i in range(1, 30)])
+
+    def test_form_validation_runs_in_workers(self):
+        records = [{'number': i} for i in range(10)]
+        batch = submit_parallel(NumberForm, records, workers=2, chunk_size=2)
+        self.assertEqual(batch.errors, {
+            3: {'number': 'Must not be a multiple of 3.'},
+            6: {'number': 'Must not be a multiple of 3.'},
+            9: {'number': 'Must not be a multiple of 3.'},
+        })
+        self.assertEqual(batch.data[1], {'number': 1, 'double': 2})
+
+    def test_results_match_sequential_submit_many(self):
+        records = [{'number': str(i)} for i in range(-5, 20)] + [None, {}]
+        parallel = submit_parallel(NumberForm, iter(records), workers=3, chunk_size=5)
+        sequential = NumberForm.submit_many(records)
+        self.assertEqual(list(parallel), list(sequential))
+
+    def test_no_records_results_in_empty_batch(self):
+        batch = submit_parallel(NumberForm, [], workers=1)
+        self.assertEqual(len(batch), 0)
+
+
+class BatchExtendTestCase(TestCase):
+
+    def test_extend_offsets_error_indexes(self):
+        batch = Batch()
+        batch.append(True, {'a': 1}, {})
+        other = Batch()
+        other.append(False, {}, {'a': 'Invalid.'})
+        batch.extend(other)
+        self.assertEqual(batch.valid, [True, False])
+        self.assertEqual(batch.errors, {1: {'a': 'Invalid.'}})
+
+
+class PlainNumberForm(Form):
+
+    number = fields.Integer()
+
+
+class NumberForm(Form):
+
+    number = fields.Integer()
+
+    def validate(self, data):
+        if 'number' in data:
+            if data['number'] and data['number'] % 3 == 0:
+                self.error('number', 'Must not be a multiple of 3.')
+            data['double'] = data['number'] * 2
+        return data
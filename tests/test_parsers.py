@@ -1,4 +1,6 @@
+import re
 from datetime import datetime, date, time, timedelta, timezone
+from random import Random
 from unittest import TestCase
 from lie2me.parsers import parse_datetime, parse_date, parse_time, parse_timezone
 
@@ -189,3 +191,139 @@ class TimeZoneParserTestCase(TestCase):
         self.assertEqual(parse_timezone('+24:00'), None)
         self.assertEqual(parse_timezone('-25:00'), None)
         self.assertEqual(parse_timezone('+25:00'), None)
+
+
+def legacy_parse_datetime(string):
+    string = str(string).strip()
+    pattern = r'^([0-9]{4}-[0-9]{2}-[0-9]{2})( |T)([^ ]+)$'
+    match = re.match(pattern, string)
+    if match is None:
+        return None
+    d, _, t = match.groups()
+    date = legacy_parse_date(d)
+    time = legacy_parse_time(t)
+    if date is None or time is None:
+        return None
+    return datetime.combine(date, time)
+
+
+def legacy_parse_date(string):
+    string = str(string).strip()
+    pattern = r'^([0-9]{4})-([0-9]{2})-([0-9]{2})$'
+    match = re.match(pattern, string)
+    if match is None:
+        return None
+    y, m, d = map(int, match.groups())
+    try:
+        return date(y, m, d)
+    except:
+        return None
+
+
+def legacy_parse_time(string):
+    string = str(string).strip()
+    pattern = ''.join([
+        r'^([0-2][0-9])', # h
+        r'(:([0-5][0-9]))?', # m
+        r'(:([0-5][0-9]))?', # s
+        r'(\.([0-9]{1,3}))?', # ms
+        r'(Z|[+-][0-9:]+)?$', # tz
+    ])
+    match = re.match(pattern, string)
+    if match is None:
+        return None
+    h, _, m, _, s, _, ms, z = match.groups()
+    h = int(h)
+    m = int(m) if m is not None else 0
+    s = int(s) if s is not None else 0
+    mcs = int(ms) * 1000 if ms is not None else 0
+    try:
+        tm = time(h, m, s, mcs)
+    except ValueError:
+        return None
+    if z is not None:
+        tz = legacy_parse_timezone(z)
+        if tz is None:
+            return None
+        tm = tm.replace(tzinfo=timezone(tz))
+    return tm
+
+
+def legacy_parse_timezone(string):
+    string = str(string).strip()
+    pattern = r'^(Z)|([+-])([0-2][0-9])(:?([0-5][0-9]))?$'
+    match = re.match(pattern, string)
+    if match is None:
+        return None
+    z, signal, h, _, m = match.groups()
+    h = int(signal + h) if h is not None else 0
+    m = int(signal + m) if m is not None else 0
+    if h == 0 and m == 0 and signal == '-':
+        return None
+    if abs((h * 60) + m) > (24 * 60) - 1:
+        return None
+    return timedelta(hours=h, minutes=m)
+
+
+DATES = ['2017-09-20', '2016-02-29', '2017-02-29', '0000-01-01', '9999-12-31', '2017-13-01',
+    '2017-9-20', '2017-09-2', '201７-09-20', '2017/09/20', '2017-09-20-']
+SEPARATORS = [' ', 'T', 't', '', '  ', '\t', ' T ']
+CLOCKS = ['19', '23:59', '23:59:59', '24:00:00', '19:60:00', '19:34:60', '09:30:00', '9:30:00',
+    '19:3４:00', '19:34:5', '19:34:567', '1934', '19.5']
+FRACTIONS = ['', '.', '.1', '.12', '.123', '.1234', '.١']
+OFFSETS = ['', 'Z', 'ZZ', 'z', '+00:00', '-00:00', '+0000', '-0000', '+00', '-00', '-03:00', '+03:30',
+    '-0300', '+23:59', '-23:59', '+24:00', '-25:00', '+03:60', '+3:00', '-03:', '+03:00:00', '+', '-0']
+PADDING = ['', ' ', '\n']
+
+
+class DifferentialParserTestCase(TestCase):
+
+    def assertSameResult(self, value, old, new):
+        self.assertEqual((type(old), old), (type(new), new), value)
+        if isinstance(old, (datetime, time)):
+            self.assertEqual(old.utcoffset(), new.utcoffset(), value)
+
+    def clocks(self):
+        for clock in CLOCKS:
+            for fraction in FRACTIONS:
+                for offset in OFFSETS:
+                    yield clock + fraction + offset
+
+    def test_datetimes_match_legacy_parser(self):
+        for d in DATES + [' 2017-09-20', '\n2017-09-20']:
+            for separator in SEPARATORS:
+                for clock in self.clocks():
+                    value = d + separator + clock
+                    self.assertSameResult(value, legacy_parse_datetime(value), parse_datetime(value))
+
+    def test_dates_match_legacy_parser(self):
+        for d in DATES + ['', '2017', '2017-09', '2017-09-200', None, 20170920]:
+            for padding in PADDING:
+                value = d if d is None or padding == '' else padding + str(d) + padding
+                self.assertSameResult(value, legacy_parse_date(value), parse_date(value))
+
+    def test_times_match_legacy_parser(self):
+        for clock in self.clocks():
+            for padding in PADDING:
+                value = padding + clock + padding
+                self.assertSameResult(value, legacy_parse_time(value), parse_time(value))
+
+    def test_timezones_match_legacy_parser(self):
+        for value in OFFSETS + ['Zfoo', ' +03:00 ', '+03:00\n', None]:
+            self.assertEqual(legacy_parse_timezone(value), parse_timezone(value), value)
+
+    def test_mutated_timestamps_match_legacy_parser(self):
+        rng = Random(0)
+        alphabet = '0123456789-:.+TZ '
+        for i in range(20000):
+            value = list(rng.choice(['2017-09-20T19:34:59.123-03:00', '2017-09-20 19:34:59Z', '2017-09-20T08:30']))
+            for j in range(rng.randint(1, 3)):
+                value[rng.randrange(len(value))] = rng.choice(alphabet)
+            value = ''.join(value)
+            self.assertSameResult(value, legacy_parse_datetime(value), parse_datetime(value))
+            self.assertSameResult(value[11:], legacy_parse_time(value[11:]), parse_time(value[11:]))
+
+    def test_timezones_are_shared_per_offset(self):
+        a = parse_datetime('2017-09-20T19:34:59-03:00')
+        b = parse_time('08:30-0300')
+        self.assertIs(a.tzinfo, b.tzinfo)
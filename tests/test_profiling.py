@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from lie2me import Form, fields, profiling
+from lie2me.profiling import Profiler, Summary, _summarize
+
+
+class AddressForm(Form):
+
+    street = fields.Text()
+    number = fields.Integer(min=0)
+
+
+class PersonForm(Form):
+
+    name = fields.Text()
+    age = fields.Integer()
+    address = AddressForm
+
+    def validate(self, data):
+        if data.get('name') == 'Nobody':
+            self.error('name', 'Invalid name.')
+        return data
+
+
+class ProfilingTestCase(TestCase):
+
+    def setUp(self):
+        self.timings = []
+        profiling.install(self.timings.append)
+
+    def tearDown(self):
+        profiling.uninstall()
+
+    def test_no_timings_are_reported_without_hook(self):
+        profiling.uninstall()
+        PersonForm({'name': 'John'}).submit()
+        self.assertEqual(self.timings, [])
+
+    def test_fields_nested_forms_and_validation_are_timed(self):
+        form = PersonForm({'name': 'John', 'age': 'x', 'address': {'street': 'Nowhere', 'number': 1}})
+        form.submit()
+        events = [(t.form, t.path, t.kind, t.type, t.valid) for t in self.timings]
+        self.assertEqual(events, [
+            (PersonForm, ('age',), 'field', fields.Integer, False),
+            (PersonForm, ('name',), 'field', fields.Text, True),
+            (AddressForm, ('address', 'number'), 'field', fields.Integer, True),
+            (AddressForm, ('address', 'street'), 'field', fields.Text, True),
+            (AddressForm, ('address', 'validate'), 'validate', AddressForm, True),
+            (PersonForm, ('address',), 'form', AddressForm, True),
+            (PersonForm, ('validate',), 'validate', PersonForm, False),
+        ])
+        for timing in self.timings:
+            self.assertGreaterEqual(timing.duration, 0)
+
+    def test_validation_outcome_reflects_form_errors(self):
+        PersonForm({'name': 'Nobody', 'age': 1, 'address': {'street': 'a', 'number': 1}}).submit()
+        self.assertEqual(self.timings[-1].kind, 'validate')
+        self.assertFalse(self.timings[-1].valid)
+
+    def test_submitted_data_is_unchanged_by_profiling(self):
+        data = {'name': 'John', 'age': '42', 'address': {'street': 'Nowhere', 'number': '1'}}
+        form = PersonForm(data)
+        form.submit()
+        profiling.uninstall()
+        plain = PersonForm(data)
+        plain.submit()
+        self.assertEqual((form.valid, form.data, form.errors), (plain.valid, plain.data, plain.errors))
+
+    def test_profiler_aggregates_stats_per_form_class(self):
+        profiler = Profiler()
+        profiling.install(profiler)
+        for age in range(10):
+            PersonForm({'name': 'John', 'age': age, 'address': {'street': 'a', 'number': 1}}).submit()
+        stats = profiler.stats(PersonForm)
+        self.assertEqual(sorted(stats), ['address', 'age', 'name', 'validate'])
+        self.assertEqual(stats['age'].count, 10)
+        self.assertEqual(sorted(profiler.stats(AddressForm)), ['number', 'street', 'validate'])
+        profiler.reset()
+        self.assertEqual(profiler.stats(PersonForm), {})
+
+    def test_summary_percentiles(self):
+        self.assertEqual(_summarize([3, 1, 2, 4]), Summary(4, 10, 2, 4))
+        self.assertEqual(_summarize(list(range(1, 101))), Summary(100, 5050, 50, 99))
+        self.assertEqual(_summarize([5]), Summary(1, 5, 5, 5))
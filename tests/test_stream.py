@@ -0,0 +1,73 @@
+from io import StringIO
+from unittest import TestCase
+
+from lie2me import Form, fields
+from lie2me.stream import validate_jsonl, validate_csv
+
+
+class JsonLinesTestCase(TestCase):
+
+    def test_records_are_validated_with_line_numbers(self):
+        fp = StringIO('{"name": " John ", "age": "42"}\n\n{"name": "Jane", "age": "x"}\n')
+        results = list(validate_jsonl(fp, PersonForm))
+        self.assertEqual(results, [
+            (1, {'name': 'John', 'age': 42}, {}),
+            (3, {'name': 'Jane', 'age': 'x'}, {'age': 'Invalid number.'}),
+        ])
+
+    def test_malformed_lines_are_reported(self):
+        fp = StringIO('{"name": "John", "age": 42}\n{"name": \n')
+        results = list(validate_jsonl(fp, PersonForm))
+        self.assertEqual(results[1], (2, '{"name": \n', {'record': 'Invalid JSON.'}))
+
+    def test_records_are_read_lazily(self):
+        lines = iter(['{"name": "John", "age": 42}\n', 'not read'])
+        results = validate_jsonl(lines, PersonForm)
+        self.assertEqual(next(results)[0], 1)
+        self.assertEqual(next(lines), 'not read')
+
+    def test_valid_and_invalid_records_are_sent_to_sinks(self):
+        fp = StringIO('{"name": "John", "age": 42}\n{"name": "Jane"}\n[]\n')
+        valid, invalid = [], []
+        for result in validate_jsonl(fp, PersonForm, valid=lambda *r: valid.append(r), invalid=lambda *r: invalid.append(r)):
+            pass
+        self.assertEqual(valid, [(1, {'name': 'John', 'age': 42}, {})])
+        self.assertEqual([line_number for line_number, data, errors in invalid], [2, 3])
+        self.assertEqual(invalid[1][1], [])
+
+    def test_records_that_are_not_objects_are_reported_as_read(self):
+        results = list(validate_jsonl(StringIO('[1, 2]\n"x"\n'), PersonForm))
+        self.assertEqual([data for line_number, data, errors in results], [[1, 2], 'x'])
+
+
+class CsvTestCase(TestCase):
+
+    def test_records_are_validated_with_line_numbers(self):
+        fp = StringIO('name,age\nJohn,42\nJane,\n')
+        results = list(validate_csv(fp, PersonForm))
+        self.assertEqual(results, [
+            (2, {'name': 'John', 'age': 42}, {}),
+            (3, {'name': 'Jane', 'age': ''}, {'age': 'This is required.'}),
+        ])
+
+    def test_multi_line_records_report_the_line_they_start_on(self):
+        fp = StringIO('name,age\n"Multi\nline",x\n\nJane,\n')
+        results = list(validate_csv(fp, PersonForm))
+        self.assertEqual([line_number for line_number, data, errors in results], [2, 5])
+
+    def test_csv_options_are_forwarded_to_the_reader(self):
+        fp = StringIO('John;42\n')
+        results = list(validate_csv(fp, PersonForm, fieldnames=['name', 'age'], delimiter=';'))
+        self.assertEqual(results, [(1, {'name': 'John', 'age': 42}, {})])
+
+    def test_invalid_records_are_sent_to_sink(self):
+        fp = StringIO('name,age\nJohn,42\nJane,x\n')
+        invalid = []
+        list(validate_csv(fp, PersonForm, invalid=lambda *r: invalid.append(r)))
+        self.assertEqual(invalid, [(3, {'name': 'Jane', 'age': 'x'}, {'age': 'Invalid number.'})])
+
+
+class PersonForm(Form):
+
+    name = fields.Text()
+    age = fields.Integer()